@@ -5,6 +5,8 @@ PII De-Identification Pipeline
 Usage:
     python main.py --input <audio_dir> --output <output_dir> [options]
     python main.py --test  # Run on sample files
+    python main.py review <conversation_id> --region 0  # Extract a review clip
+    python main.py merge --output <output_dir>  # Merge the outputs of --shard runs
 """
 import os
 import sys
@@ -16,7 +18,14 @@ from pathlib import Path
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
 
 from src.pipeline import Pipeline, run_pipeline
-from src.config import OUTPUT_DIR
+from src.sharding import parse_shard
+from src.config import (
+    OUTPUT_DIR,
+    OUTPUT_PROFILES,
+    DEFAULT_OUTPUT_PROFILE,
+    REVIEW_CONTEXT_S,
+    VERIFY_AUDIT_RATE
+)
 
 # Configure logging
 logging.basicConfig(
@@ -44,7 +53,120 @@ def find_audio_files(input_dir: str) -> list:
     return [str(f) for f in files]
 
 
+def review_main(argv: list) -> int:
+    """Extract original/redacted clips for a processed conversation."""
+    from src.review import ClipExtractor, save_clip_pair
+
+    parser = argparse.ArgumentParser(
+        prog="main.py review",
+        description="Extract original and redacted clips side by side for review"
+    )
+    parser.add_argument("conversation_id", type=str, help="Conversation to review")
+    parser.add_argument(
+        "--output", "-o",
+        type=str,
+        default=str(OUTPUT_DIR),
+        help="Pipeline output directory"
+    )
+    parser.add_argument(
+        "--output-profile",
+        type=str,
+        default=DEFAULT_OUTPUT_PROFILE,
+        choices=sorted(OUTPUT_PROFILES),
+        help="Profile the outputs were written with"
+    )
+    parser.add_argument("--region", type=int, help="Bleep region index (see --list)")
+    parser.add_argument("--start", type=float, help="Clip start in seconds")
+    parser.add_argument("--end", type=float, help="Clip end in seconds")
+    parser.add_argument(
+        "--context",
+        type=float,
+        default=REVIEW_CONTEXT_S,
+        help=f"Seconds around a region (default: {REVIEW_CONTEXT_S})"
+    )
+    parser.add_argument("--list", action="store_true", help="List bleep regions")
+    parser.add_argument(
+        "--clip-dir",
+        type=str,
+        default="review_clips",
+        help="Where to write the clips (default: review_clips)"
+    )
+
+    args = parser.parse_args(argv)
+    extractor = ClipExtractor(output_dir=args.output, output_profile=args.output_profile)
+
+    try:
+        if args.list:
+            for i, region in enumerate(extractor.regions(args.conversation_id)):
+                categories = ", ".join(sorted({m.category for m in region.pii_matches}))
+                print(f"{i:4d}  {region.start_time:8.2f}s - {region.end_time:8.2f}s  {categories}")
+            return 0
+
+        if args.region is not None:
+            pair = extractor.region_clip(args.conversation_id, args.region, args.context)
+            name = f"{args.conversation_id}_region{args.region}"
+        elif args.start is not None and args.end is not None:
+            pair = extractor.clip(args.conversation_id, args.start, args.end)
+            name = None
+        else:
+            parser.error("give --list, --region, or --start and --end")
+
+        original_path, redacted_path = save_clip_pair(pair, args.clip_dir, name)
+    except (FileNotFoundError, IndexError, ValueError) as e:
+        # ValueError: no decoder could open the audio
+        logger.error(str(e))
+        return 1
+    finally:
+        extractor.close()
+
+    print(f"Original: {original_path}")
+    print(f"Redacted: {redacted_path}")
+    return 0
+
+
+def merge_main(argv: list) -> int:
+    """Merge the manifests and reports of sharded runs into one dataset view."""
+    from src.sharding import merge_shards
+
+    parser = argparse.ArgumentParser(
+        prog="main.py merge",
+        description="Combine shard manifests and processing reports (from --shard runs)"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        type=str,
+        default=str(OUTPUT_DIR),
+        help="Output directory shared by the shards"
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        help="Number of shards (default: the shard count found in the output directory)"
+    )
+
+    args = parser.parse_args(argv)
+    try:
+        report = merge_shards(Path(args.output), count=args.shards)
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+
+    summary = report["summary"]
+    shards = report["shards"]
+    print(f"Merged shards: {len(shards['merged'])} of {shards['count']}")
+    if shards["missing"]:
+        print(f"Missing shards: {shards['missing']}")
+    print(f"Conversations: {summary['total_conversations']} "
+          f"({summary['successful']} successful, {summary['failed']} failed)")
+    return 0 if not shards["missing"] else 1
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "review":
+        return review_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "merge":
+        return merge_main(sys.argv[2:])
+
     parser = argparse.ArgumentParser(
         description="PII De-Identification Pipeline for Audio/Transcript Data"
     )
@@ -66,11 +188,80 @@ def main():
         choices=["tiny", "base", "small", "medium", "large-v3"],
         help="Whisper model size (default: base)"
     )
+    parser.add_argument(
+        "--output-profile",
+        type=str,
+        default=DEFAULT_OUTPUT_PROFILE,
+        choices=sorted(OUTPUT_PROFILES),
+        help=f"Audio encoding profile (default: {DEFAULT_OUTPUT_PROFILE})"
+    )
+    parser.add_argument(
+        "--multichannel",
+        action="store_true",
+        help="Transcribe and redact each channel separately, keeping the channel layout"
+    )
+    parser.add_argument(
+        "--compress",
+        type=str,
+        choices=["gzip", "zstd"],
+        help="Compress transcript JSON (zstd needs the zstandard package)"
+    )
+    parser.add_argument(
+        "--export-words",
+        action="store_true",
+        help="Also write word-level tables (Parquet if pyarrow is installed, else .npz)"
+    )
     parser.add_argument(
         "--no-verify",
         action="store_true",
         help="Skip audio verification (faster but less thorough)"
     )
+    parser.add_argument(
+        "--no-spectral-check",
+        action="store_true",
+        help="Always re-transcribe redacted audio instead of checking bleeps spectrally first"
+    )
+    parser.add_argument(
+        "--sync-verify",
+        action="store_true",
+        help="Verify each file before starting the next (default: verify in the background)"
+    )
+    parser.add_argument(
+        "--audit-rate",
+        type=float,
+        default=VERIFY_AUDIT_RATE,
+        help="Re-transcribe only high-risk files plus this random share of the rest (0-1)"
+    )
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="Pipeline the batch: transcribe, redact and verify different files at once"
+    )
+    parser.add_argument(
+        "--stage-workers",
+        type=str,
+        help="Threads per stage with --staged, e.g. redact_text=4,redact_audio=2"
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Reprocess every file, even ones the journal shows completed"
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Keep memory flat on large batches: drop each file's transcripts once written"
+    )
+    parser.add_argument(
+        "--input-order",
+        action="store_true",
+        help="Process files in input order instead of longest first"
+    )
+    parser.add_argument(
+        "--shard",
+        type=str,
+        help="Process only shard i of N (i/N, 0-based), e.g. 0/4 on the first of four nodes"
+    )
     parser.add_argument(
         "--test",
         action="store_true",
@@ -130,13 +321,48 @@ def main():
     logger.info(f"Output directory: {args.output}")
     logger.info(f"Whisper model: {args.model}")
     logger.info(f"Audio verification: {not args.no_verify}")
+    if args.audit_rate is not None:
+        logger.info(f"Audio verification audit rate: {args.audit_rate}")
+    logger.info(f"Output profile: {args.output_profile}")
+
+    stage_workers = None
+    if args.stage_workers:
+        try:
+            stage_workers = {
+                name.strip(): int(count)
+                for name, count in (item.split("=") for item in args.stage_workers.split(","))
+            }
+        except ValueError:
+            logger.error(f"Invalid --stage-workers: {args.stage_workers} (expected name=N,...)")
+            sys.exit(1)
+
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            logger.error(str(e))
+            sys.exit(1)
 
     # Run pipeline
     results = run_pipeline(
         audio_paths=audio_files,
         output_dir=args.output,
         whisper_model=args.model,
-        verify_audio=not args.no_verify
+        verify_audio=not args.no_verify,
+        output_profile=args.output_profile,
+        multichannel=args.multichannel,
+        transcript_compression=args.compress,
+        export_words=args.export_words,
+        spectral_precheck=not args.no_spectral_check,
+        audit_rate=args.audit_rate,
+        async_verification=not args.sync_verify,
+        staged=args.staged,
+        stage_workers=stage_workers,
+        resume=not args.no_resume,
+        streaming=args.streaming,
+        shard=shard,
+        longest_first=not args.input_order
     )
 
     # Summary
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark output encoding profiles: encode throughput vs bytes on disk.
+Uses synthetic speech-like audio so it runs without the dataset.
+"""
+import io
+import json
+import time
+import argparse
+from pathlib import Path
+import sys
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.config import OUTPUT_PROFILES, SAMPLE_RATE
+
+
+def make_speech_like_audio(duration_s: float, sample_rate: int = SAMPLE_RATE, seed: int = 0):
+    """
+    Generate audio that compresses roughly like conversational speech:
+    voiced harmonics with a wandering pitch, syllable-rate amplitude
+    modulation, pauses, and a low noise floor.
+    """
+    rng = np.random.default_rng(seed)
+    n = int(duration_s * sample_rate)
+    t = np.arange(n) / sample_rate
+
+    # Pitch wanders around 120-220 Hz
+    pitch = 170 + 50 * np.sin(2 * np.pi * 0.3 * t) + 10 * rng.standard_normal(n).cumsum() / n
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 8))
+
+    # ~4 syllables per second, with pauses
+    syllables = np.clip(np.sin(2 * np.pi * 4 * t), 0, None)
+    pauses = np.repeat(rng.random(int(duration_s) + 1) > 0.3, sample_rate)[:n]
+
+    audio = 0.2 * voiced * syllables * pauses + 0.002 * rng.standard_normal(n)
+    return audio.astype(np.float32)
+
+
+def benchmark_profile(profile, audio: np.ndarray, sample_rate: int, repeats: int) -> dict:
+    """Encode audio with a profile several times and return the best timing."""
+    args = {"format": profile.format.upper(), "subtype": profile.subtype}
+    if profile.compression_level is not None:
+        args["compression_level"] = profile.compression_level
+
+    best = float("inf")
+    size = 0
+    for _ in range(repeats):
+        buf = io.BytesIO()
+        start = time.perf_counter()
+        sf.write(buf, audio, sample_rate, **args)
+        best = min(best, time.perf_counter() - start)
+        size = len(buf.getvalue())
+
+    duration_s = len(audio) / sample_rate
+    return {
+        "profile": profile.name,
+        "format": profile.format,
+        "subtype": profile.subtype,
+        "compression_level": profile.compression_level,
+        "encode_time_s": best,
+        "realtime_factor": duration_s / best if best > 0 else float("inf"),
+        "bytes": size,
+        "bytes_per_audio_sec": size / duration_s,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark output encoding profiles")
+    parser.add_argument("--duration", type=float, default=300.0,
+                        help="Seconds of synthetic audio to encode (default: 300)")
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="Encodes per profile; the fastest is reported (default: 3)")
+    parser.add_argument("--profiles", type=str, nargs="*", default=sorted(OUTPUT_PROFILES),
+                        help="Profiles to benchmark (default: all)")
+    parser.add_argument("--output", type=str, help="Output JSON file for results")
+
+    args = parser.parse_args()
+
+    audio = make_speech_like_audio(args.duration)
+    print(f"Encoding {args.duration:.0f}s of synthetic audio at {SAMPLE_RATE}Hz\n")
+
+    results = [
+        benchmark_profile(OUTPUT_PROFILES[name], audio, SAMPLE_RATE, args.repeats)
+        for name in args.profiles
+    ]
+
+    print(f"  {'Profile':<10} │ {'Format':<6} │ {'Subtype':<7} │ {'Level':>5} │ "
+          f"{'x realtime':>10} │ {'KB/audio-min':>12}")
+    print("  " + "-" * 68)
+    for r in sorted(results, key=lambda r: r["bytes"]):
+        level = "-" if r["compression_level"] is None else f"{r['compression_level']:.1f}"
+        print(f"  {r['profile']:<10} │ {r['format']:<6} │ {r['subtype']:<7} │ {level:>5} │ "
+              f"{r['realtime_factor']:>10.0f} │ {r['bytes_per_audio_sec'] * 60 / 1024:>12.1f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"duration_s": args.duration, "results": results}, f, indent=2)
+        print(f"\nSaved results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
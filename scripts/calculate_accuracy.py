@@ -10,6 +10,7 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.wer_calculator import calculate_wer, print_wer_report, calculate_batch_wer
+from src.serialization import conversation_id_from_path, iter_json_files, read_json
 
 
 def clean_human_transcript(text: str) -> str:
@@ -47,8 +48,8 @@ def find_matching_files(asr_dir: Path, human_dir: Path):
     """Find matching ASR and human transcript pairs."""
     pairs = []
 
-    for asr_file in asr_dir.glob("*.json"):
-        conv_id = asr_file.stem
+    for asr_file in iter_json_files(asr_dir):
+        conv_id = conversation_id_from_path(asr_file)
 
         # Search for matching human transcript
         for human_file in human_dir.rglob(f"{conv_id}.txt"):
@@ -65,16 +66,15 @@ def calculate_single_wer(asr_path: str, human_path: str) -> dict:
         human_raw = f.read()
     human_clean = clean_human_transcript(human_raw)
 
-    # Load ASR transcript
-    with open(asr_path) as f:
-        asr_data = json.load(f)
+    # Load ASR transcript (plain or compressed)
+    asr_data = read_json(asr_path)
     asr_clean = clean_asr_transcript(asr_data)
 
     # Calculate WER
     result = calculate_wer(human_clean, asr_clean)
 
     return {
-        "conversation_id": Path(asr_path).stem,
+        "conversation_id": conversation_id_from_path(asr_path),
         "wer": result.wer,
         "substitutions": result.substitutions,
         "insertions": result.insertions,
@@ -4,12 +4,16 @@ Simple visualization for pipeline results.
 Shows PII counts, before/after comparison, and processing times.
 Uses ASCII charts to avoid matplotlib dependency.
 """
-import json
 import sys
 from pathlib import Path
 from collections import Counter
 from typing import Dict, List
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.serialization import (
+    find_transcript, iter_json_files, read_json, transcript_text, conversation_id_from_path
+)
+
 # Simple ASCII visualization (no matplotlib dependency)
 
 
@@ -46,10 +50,61 @@ def create_comparison_table(before: Dict, after: Dict, title: str) -> str:
     return "\n".join(lines)
 
 
+def format_throughput(stats: Dict) -> str:
+    """words/s or MB/s for a stage, whichever it reports."""
+    if stats.get("words_per_s") is not None:
+        return f"{stats['words_per_s']:.0f} words/s"
+    if stats.get("bytes_per_s") is not None:
+        return f"{stats['bytes_per_s'] / 1e6:.1f} MB/s"
+    return ""
+
+
+def create_stage_table(performance: Dict, title: str = "STAGE TIMINGS") -> str:
+    """Per-stage timing table: totals, percentiles, real-time factor and throughput."""
+    stages = performance.get("stages") or {}
+    if not stages:
+        return f"{title}\n  (no data)"
+
+    lines = [title, "=" * len(title)]
+    batch = performance.get("batch", {})
+    if batch.get("wall_s") is not None:
+        rtf = f", RTF {batch['rtf']:.3f}" if batch.get("rtf") is not None else ""
+        lines.append(
+            f"  Batch: {batch['files']} files, {batch['audio_s']:.1f}s audio "
+            f"in {batch['wall_s']:.1f}s wall{rtf}"
+        )
+    lines.append(
+        f"  {'Stage':<18} │ {'Files':>5} │ {'Total':>8} │ {'p50':>7} │ {'p95':>7} │ "
+        f"{'p99':>7} │ {'RTF':>6} │ Throughput"
+    )
+    lines.append("  " + "-" * 96)
+
+    def secs(value) -> str:
+        return f"{value:.3f}s" if value is not None else "-"
+
+    for stage, stats in stages.items():
+        rtf = f"{stats['rtf']:.3f}" if stats.get("rtf") is not None else "-"
+        lines.append(
+            f"  {stage:<18} │ {stats['files']:>5} │ {secs(stats['total_s']):>8} │ "
+            f"{secs(stats['p50_s']):>7} │ {secs(stats['p95_s']):>7} │ {secs(stats['p99_s']):>7} │ "
+            f"{rtf:>6} │ {format_throughput(stats)}"
+        )
+
+    # Share of stage time, to see where a batch spends it
+    total = sum(stats["total_s"] for stats in stages.values())
+    if total > 0:
+        lines.append("")
+        lines.append("  Share of stage time:")
+        for stage, stats in sorted(stages.items(), key=lambda x: -x[1]["total_s"]):
+            share = stats["total_s"] / total
+            lines.append(f"  {stage:<18} │ {'█' * int(share * 40)} {share:.0%}")
+
+    return "\n".join(lines)
+
+
 def visualize_processing_report(report_path: str) -> str:
     """Visualize the processing report."""
-    with open(report_path) as f:
-        report = json.load(f)
+    report = read_json(report_path)
 
     output = []
 
@@ -62,7 +117,7 @@ def visualize_processing_report(report_path: str) -> str:
     summary = report.get("summary", {})
     output.append("PROCESSING SUMMARY")
     output.append("-" * 40)
-    output.append(f"  Total files processed: {summary.get('total_processed', 0)}")
+    output.append(f"  Total files processed: {summary.get('total_conversations', 0)}")
     output.append(f"  Successful:            {summary.get('successful', 0)}")
     output.append(f"  Failed:                {summary.get('failed', 0)}")
     output.append(f"  Total PII redacted:    {summary.get('total_pii_redacted', 0)}")
@@ -87,6 +142,12 @@ def visualize_processing_report(report_path: str) -> str:
         output.append(f"  Average per file:      {total_time/len(times):.1f}s")
         output.append("")
 
+    # Per-stage timings, real-time factor and throughput
+    performance = report.get("performance")
+    if performance:
+        output.append(create_stage_table(performance))
+        output.append("")
+
     # Failures
     failures = report.get("failures", [])
     if failures:
@@ -102,9 +163,8 @@ def visualize_processing_report(report_path: str) -> str:
 
 
 def visualize_transcript_deid(transcript_path: str) -> str:
-    """Visualize a single de-identified transcript."""
-    with open(transcript_path) as f:
-        data = json.load(f)
+    """Visualize a single de-identified transcript (.json, .json.gz or .json.zst)."""
+    data = read_json(transcript_path)
 
     output = []
 
@@ -130,8 +190,14 @@ def visualize_transcript_deid(transcript_path: str) -> str:
         output.append(f"  ... and {len(redactions) - 10} more")
     output.append("")
 
-    # Text comparison
-    original = data.get("original_text", "")[:200]
+    # Text comparison. Compact de-identified transcripts leave out the
+    # original text, so fall back to the matching raw transcript.
+    original = data.get("original_text")
+    if original is None:
+        raw_dir = Path(transcript_path).parent.parent.parent / "transcripts_raw" / "train"
+        raw_path = find_transcript(raw_dir, conversation_id_from_path(transcript_path))
+        original = transcript_text(read_json(raw_path)) if raw_path else ""
+    original = original[:200]
     redacted = data.get("redacted_text", "")[:200]
 
     output.append("TEXT COMPARISON (first 200 chars)")
@@ -178,7 +244,7 @@ def main():
     if args.all_transcripts:
         deid_dir = Path("output/transcripts_deid/train")
         if deid_dir.exists():
-            for transcript in sorted(deid_dir.glob("*.json")):
+            for transcript in iter_json_files(deid_dir):
                 print(visualize_transcript_deid(str(transcript)))
                 print("\n" + "=" * 70 + "\n")
 
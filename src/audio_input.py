@@ -0,0 +1,288 @@
+"""
+Audio input layer for the redactor.
+Opens any supported file as a block-readable source, so the redaction stage
+can stream compressed inputs the same way it streams WAV/FLAC.
+
+Decoders are tried in registration order:
+1. soundfile (libsndfile) - WAV, FLAC, OGG, MP3, ... at the native sample rate
+2. PyAV (ships with faster-whisper) - m4a/aac and anything else FFmpeg can
+   decode, resampled to SAMPLE_RATE on the fly
+"""
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Type
+
+import numpy as np
+
+from .config import SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AudioInfo:
+    """Header-level description of an audio source."""
+    decoder: str     # Name of the decoder that opened it
+    format: str      # Container format (WAV, FLAC, MOV,MP4,M4A,...)
+    subtype: str     # Sample format or codec (PCM_16, FLOAT, AAC, ...)
+    channels: int
+    samplerate: int  # Rate the source delivers samples at (after any resampling)
+    frames: int      # Frames at samplerate (estimated for compressed formats)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds."""
+        return self.frames / self.samplerate
+
+
+class AudioSource:
+    """
+    Base class for block-readable audio sources.
+    Subclasses set decoder_name and implement info() and read().
+    """
+
+    decoder_name = ""
+
+    def info(self) -> AudioInfo:
+        """Describe the source."""
+        raise NotImplementedError
+
+    @property
+    def samplerate(self) -> int:
+        return self.info().samplerate
+
+    @property
+    def channels(self) -> int:
+        return self.info().channels
+
+    @property
+    def frames(self) -> int:
+        return self.info().frames
+
+    def read(
+        self,
+        frames: int,
+        dtype: str = "float32",
+        always_2d: bool = True,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Read up to frames frames as a (frames, channels) array.
+        Returns fewer frames at the end of the file, and an empty array after it.
+        When out is given the data is written into it and a view is returned.
+        """
+        raise NotImplementedError
+
+    def seek(self, frame: int) -> None:
+        """Move the read position to frame."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the underlying file."""
+
+    def __enter__(self) -> "AudioSource":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+_DECODERS: List[Type[AudioSource]] = []
+
+
+def register_decoder(cls: Type[AudioSource]) -> Type[AudioSource]:
+    """Register a decoder class (used as a decorator). Later ones are fallbacks."""
+    _DECODERS.append(cls)
+    return cls
+
+
+@register_decoder
+class SoundFileSource(AudioSource):
+    """Source backed by libsndfile via soundfile."""
+
+    decoder_name = "soundfile"
+
+    def __init__(self, path: str):
+        import soundfile as sf
+        self._file = sf.SoundFile(path)
+        self._info = AudioInfo(
+            decoder=self.decoder_name,
+            format=self._file.format,
+            subtype=self._file.subtype,
+            channels=self._file.channels,
+            samplerate=self._file.samplerate,
+            frames=self._file.frames
+        )
+
+    def info(self) -> AudioInfo:
+        return self._info
+
+    def read(self, frames, dtype="float32", always_2d=True, out=None):
+        return self._file.read(frames, dtype=dtype, always_2d=always_2d, out=out)
+
+    def seek(self, frame: int) -> None:
+        self._file.seek(frame)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+@register_decoder
+class AVSource(AudioSource):
+    """
+    Streaming decoder for compressed formats using PyAV.
+    Decodes packet by packet and resamples to SAMPLE_RATE, so only a frame or
+    two of audio is ever buffered.
+    """
+
+    decoder_name = "av"
+    _AV_FORMATS = {"float32": "flt", "int16": "s16"}
+    _SKIP_FRAMES = 1 << 16  # Frames decoded per step when seeking forward
+
+    def __init__(self, path: str, samplerate: int = SAMPLE_RATE):
+        import av
+        self._av = av
+        self._path = path
+        self._container = av.open(path)
+        if not self._container.streams.audio:
+            self._container.close()
+            raise ValueError(f"No audio stream in {path}")
+
+        self._stream = self._container.streams.audio[0]
+        ctx = self._stream.codec_context
+
+        # Duration comes from the container header; compressed formats can be
+        # off by a few ms (encoder priming), which only affects end clamping
+        if self._stream.duration is not None:
+            duration = float(self._stream.duration * self._stream.time_base)
+        else:
+            duration = (self._container.duration or 0) / av.time_base
+
+        self._info = AudioInfo(
+            decoder=self.decoder_name,
+            format=self._container.format.name.upper(),
+            subtype=ctx.name.upper(),
+            channels=self._stream.layout.nb_channels,
+            samplerate=samplerate,
+            frames=int(round(duration * samplerate))
+        )
+        self._reset()
+
+    def _reset(self) -> None:
+        """Decoding state for reading from the start of the stream."""
+        self._dtype: Optional[str] = None
+        self._resampler = None
+        self._decoded = None
+        self._pending: List[np.ndarray] = []
+        self._pending_frames = 0
+        self._eof = False
+        self._position = 0
+
+    def info(self) -> AudioInfo:
+        return self._info
+
+    def _next_frames(self) -> bool:
+        """Decode the next packet into pending. Returns False at end of stream."""
+        if self._eof:
+            return False
+
+        try:
+            frame = next(self._decoded)
+        except StopIteration:
+            frame = None  # Flush the resampler
+            self._eof = True
+
+        for resampled in self._resampler.resample(frame):
+            data = resampled.to_ndarray().reshape(-1, self._info.channels)
+            self._pending.append(data)
+            self._pending_frames += len(data)
+        return True
+
+    def read(self, frames, dtype="float32", always_2d=True, out=None):
+        if self._dtype is None:
+            self._dtype = dtype
+            self._resampler = self._av.AudioResampler(
+                format=self._AV_FORMATS[dtype],
+                layout=self._stream.layout,
+                rate=self._info.samplerate
+            )
+            self._decoded = self._container.decode(self._stream)
+        elif dtype != self._dtype:
+            raise ValueError(f"Source already reading as {self._dtype}, not {dtype}")
+
+        if frames < 0:
+            frames = np.iinfo(np.int64).max
+
+        while self._pending_frames < frames and self._next_frames():
+            pass
+
+        n = min(frames, self._pending_frames)
+        if out is None:
+            out = np.empty((n, self._info.channels), dtype=dtype)
+        result = out[:n]
+
+        pos = 0
+        while pos < n:
+            chunk = self._pending[0]
+            take = min(len(chunk), n - pos)
+            result[pos:pos + take] = chunk[:take]
+            if take == len(chunk):
+                self._pending.pop(0)
+            else:
+                self._pending[0] = chunk[take:]
+            pos += take
+        self._pending_frames -= n
+        self._position += n
+
+        if not always_2d and self._info.channels == 1:
+            return result[:, 0]
+        return result
+
+    def seek(self, frame: int) -> None:
+        """
+        Compressed streams can't be positioned exactly, so this decodes up to
+        frame; seeking backwards reopens the file and decodes from the start.
+        """
+        if frame < self._position:
+            self._container.close()
+            self._container = self._av.open(self._path)
+            self._stream = self._container.streams.audio[0]
+            self._reset()
+        while self._position < frame:
+            skip = min(frame - self._position, self._SKIP_FRAMES)
+            if not len(self.read(skip, dtype=self._dtype or "float32")):
+                break
+
+    def close(self) -> None:
+        self._container.close()
+
+
+def open_audio(path: str, samplerate: Optional[int] = None) -> AudioSource:
+    """
+    Open path with the first registered decoder that accepts it.
+
+    Args:
+        path: Audio file
+        samplerate: Rate to deliver samples at; a source at another rate is
+            decoded through PyAV instead, which resamples block by block
+            (None: the decoder's rate)
+    """
+    errors = []
+    for decoder in _DECODERS:
+        try:
+            source = decoder(str(path))
+        except Exception as e:
+            errors.append(f"{decoder.decoder_name}: {e}")
+            continue
+        if samplerate is None or source.samplerate == samplerate:
+            return source
+        source.close()
+        return AVSource(str(path), samplerate=samplerate)
+
+    raise ValueError(f"No decoder could open {path} ({'; '.join(errors)})")
+
+
+def probe_audio(path: str) -> AudioInfo:
+    """Read an input's header without decoding any audio."""
+    with open_audio(path) as source:
+        return source.info()
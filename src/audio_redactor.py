@@ -2,13 +2,17 @@
 Audio redaction - replaces PII segments with bleep tones.
 Bleep duration is max(400ms, word_duration + padding) so longer words are fully covered.
 """
-import math
+import os
+import shutil
 import logging
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 from dataclasses import dataclass
 import numpy as np
 
+from .audio_input import AudioInfo, SoundFileSource, open_audio, probe_audio
 from .config import (
     PIIMatch,
     MIN_BLEEP_DURATION_MS,
@@ -17,11 +21,27 @@ from .config import (
     PADDING_BEFORE_MS,
     PADDING_AFTER_MS,
     SAMPLE_RATE,
-    OUTPUT_AUDIO_FORMAT
+    AUDIO_CHANNELS,
+    OUTPUT_PROFILES,
+    DEFAULT_OUTPUT_PROFILE,
+    EncodingProfile,
+    STREAMING_REDACTION,
+    AUDIO_BLOCK_FRAMES,
+    NATIVE_PCM16_REDACTION
 )
 
 logger = logging.getLogger(__name__)
 
+# Redaction modes, recorded in the processing report
+MODE_PCM16 = "pcm16"      # Read/bleep/write int16 directly (16-bit PCM sources)
+MODE_FLOAT32 = "float32"  # Decode to float32 (everything else)
+MODE_PASSTHROUGH = "passthrough"  # No PII, source already in target format: link or copy
+MODE_TRANSCODE = "transcode"      # No PII, different format: stream-transcode without bleeps
+ZERO_PII_MODES = (MODE_PASSTHROUGH, MODE_TRANSCODE)
+
+# Linux ioctl for copy-on-write clones (btrfs, xfs, ...)
+_FICLONE = 0x40049409
+
 
 @dataclass
 class BleepRegion:
@@ -30,6 +50,176 @@ class BleepRegion:
     end_time: float        # End time in seconds (with padding)
     bleep_duration: float  # Duration of bleep in seconds
     pii_matches: List[PIIMatch]  # PII matches in this region
+    channel: Optional[int] = None  # Output channel (None = mono / all channels)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization (match categories and times only)."""
+        return {
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "bleep_duration": self.bleep_duration,
+            "channel": self.channel,
+            "matches": [
+                {"category": m.category, "start_time": m.start_time, "end_time": m.end_time}
+                for m in self.pii_matches
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BleepRegion":
+        """Rebuild a region from its dictionary form (matches without their text)."""
+        return cls(
+            start_time=data["start_time"],
+            end_time=data["end_time"],
+            bleep_duration=data["bleep_duration"],
+            pii_matches=[
+                PIIMatch(
+                    text="",
+                    category=m["category"],
+                    start_time=m["start_time"],
+                    end_time=m["end_time"],
+                    confidence=1.0,
+                    word_indices=[]
+                )
+                for m in data["matches"]
+            ],
+            channel=data["channel"]
+        )
+
+
+# Cached tone tables keyed by (sample_rate, frequency, amplitude, dtype).
+# Every bleep is the same tone, so we synthesize it once and slice into it.
+_TONE_CACHE: Dict[Tuple[int, float, float, str], np.ndarray] = {}
+
+FADE_DURATION_S = 0.01  # 10ms fade in/out to avoid clicks
+PCM16_SCALE = 32767     # Float -> int16 scale, same as libsndfile uses on write
+
+
+def _quantize_pcm16(samples: np.ndarray) -> np.ndarray:
+    """Quantize float samples in [-1, 1] to int16."""
+    return np.rint(np.asarray(samples, dtype=np.float64) * PCM16_SCALE).astype(np.int16)
+
+
+def get_tone_table(
+    n_samples: int,
+    sample_rate: int = SAMPLE_RATE,
+    frequency: float = BLEEP_FREQUENCY_HZ,
+    amplitude: float = BLEEP_AMPLITUDE,
+    dtype: np.dtype = np.float32
+) -> np.ndarray:
+    """
+    Get a cached, phase-continuous sine table at least n_samples long.
+    The table grows geometrically, so a file full of bleeps pays for trig once.
+    dtype is float32 or int16 (quantized from the float32 table).
+    """
+    dtype = np.dtype(dtype)
+    key = (sample_rate, frequency, amplitude, dtype.name)
+    table = _TONE_CACHE.get(key)
+
+    if table is None or len(table) < n_samples:
+        length = max(n_samples, 2 * len(table) if table is not None else sample_rate)
+        if dtype == np.int16:
+            table = _quantize_pcm16(get_tone_table(length, sample_rate, frequency, amplitude))
+        else:
+            k = np.arange(length, dtype=np.float64)
+            table = (amplitude * np.sin(2 * np.pi * frequency * k / sample_rate)).astype(dtype)
+        table.flags.writeable = False
+        _TONE_CACHE[key] = table
+
+    return table
+
+
+@lru_cache(maxsize=None)
+def get_fade_envelopes(sample_rate: int = SAMPLE_RATE) -> Tuple[np.ndarray, np.ndarray]:
+    """Get cached (fade_in, fade_out) ramps for a sample rate."""
+    fade_samples = int(FADE_DURATION_S * sample_rate)
+    fade_in = np.linspace(0, 1, fade_samples)
+    fade_out = np.linspace(1, 0, fade_samples)
+    fade_in.flags.writeable = False
+    fade_out.flags.writeable = False
+    return fade_in, fade_out
+
+
+def write_bleep(
+    buffer: np.ndarray,
+    buffer_start: int,
+    start_sample: int,
+    end_sample: int,
+    bleep_samples: int,
+    sample_rate: int = SAMPLE_RATE,
+    frequency: float = BLEEP_FREQUENCY_HZ,
+    amplitude: float = BLEEP_AMPLITUDE
+) -> None:
+    """
+    Write one bleep into the part of buffer it overlaps, in place.
+
+    buffer holds samples [buffer_start, buffer_start + len(buffer)) of the file,
+    so the same call works on a whole file or on a single block of it.
+    The region [start_sample, end_sample) gets the first bleep_samples of the
+    tone (faded in/out) and silence after that. float32 and int16 buffers are
+    supported; int16 buffers get the pre-quantized table.
+    """
+    lo = max(start_sample, buffer_start)
+    hi = min(end_sample, buffer_start + len(buffer))
+    if lo >= hi:
+        return
+
+    # Positions relative to the start of the bleep
+    a = lo - start_sample
+    b = hi - start_sample
+    out = buffer[lo - buffer_start:hi - buffer_start]
+    tone_end = min(b, bleep_samples)
+    is_pcm16 = buffer.dtype == np.int16
+
+    if a < tone_end:
+        table = get_tone_table(tone_end, sample_rate, frequency, amplitude, buffer.dtype)
+        dst = out[:tone_end - a]
+        src = table[a:tone_end]
+        dst[...] = src if dst.ndim == 1 else src[:, None]
+
+        # Fades are only 10ms, so compute them from the float table and quantize if needed
+        fade_in, fade_out = get_fade_envelopes(sample_rate)
+        fade_samples = len(fade_in)
+        if bleep_samples > 2 * fade_samples:
+            float_table = get_tone_table(tone_end, sample_rate, frequency, amplitude)
+            fades = (
+                (a, min(tone_end, fade_samples), 0, fade_in),
+                (max(a, bleep_samples - fade_samples), tone_end,
+                 bleep_samples - fade_samples, fade_out),
+            )
+            for i0, i1, ramp_start, ramp in fades:
+                if i0 >= i1:
+                    continue
+                faded = float_table[i0:i1] * ramp[i0 - ramp_start:i1 - ramp_start]
+                if is_pcm16:
+                    faded = _quantize_pcm16(faded)
+                dst[i0 - a:i1 - a] = faded if dst.ndim == 1 else faded[:, None]
+
+    # Bleep shorter than the region (shouldn't happen with our formula): silence the rest
+    if tone_end < b:
+        out[max(tone_end, a) - a:] = 0
+
+
+def apply_bleeps(
+    buffer: np.ndarray,
+    regions: List["BleepRegion"],
+    sample_rate: int = SAMPLE_RATE,
+    frequency: float = BLEEP_FREQUENCY_HZ,
+    amplitude: float = BLEEP_AMPLITUDE,
+    buffer_start: int = 0
+) -> None:
+    """Write all bleep regions into buffer in place (no per-region synthesis)."""
+    for region in regions:
+        write_bleep(
+            buffer,
+            buffer_start,
+            int(region.start_time * sample_rate),
+            int(region.end_time * sample_rate),
+            int(region.bleep_duration * sample_rate),
+            sample_rate,
+            frequency,
+            amplitude
+        )
 
 
 def generate_bleep_tone(
@@ -40,56 +230,62 @@ def generate_bleep_tone(
 ) -> np.ndarray:
     """Generate a sine wave bleep tone with fade in/out to avoid clicks."""
     n_samples = int(duration_s * sample_rate)
-    t = np.linspace(0, duration_s, n_samples, dtype=np.float32)
+    bleep = np.empty(n_samples, dtype=np.float32)
+    write_bleep(bleep, 0, 0, n_samples, n_samples, sample_rate, frequency, amplitude)
+    return bleep
 
-    # Generate sine wave
-    bleep = amplitude * np.sin(2 * np.pi * frequency * t)
 
-    # Apply fade in/out to avoid clicks (10ms each)
-    fade_samples = int(0.01 * sample_rate)
-    if n_samples > 2 * fade_samples:
-        fade_in = np.linspace(0, 1, fade_samples)
-        fade_out = np.linspace(1, 0, fade_samples)
-        bleep[:fade_samples] *= fade_in
-        bleep[-fade_samples:] *= fade_out
+def sweep_merge(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    min_gap_s: float = 0.1
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Merge overlapping or adjacent intervals in one pass over sorted arrays.
+
+    starts/ends must already be sorted by start. A new group begins wherever a
+    start lies more than min_gap_s past the running max of all earlier ends.
+    Returns (first, stop, group_starts, group_ends), where group k covers
+    intervals first[k]:stop[k].
+    """
+    run_end = np.maximum.accumulate(ends)
+    breaks = np.flatnonzero(starts[1:] > run_end[:-1] + min_gap_s) + 1
+    first = np.concatenate(([0], breaks))
+    stop = np.concatenate((breaks, [len(starts)]))
+    return first, stop, starts[first], run_end[stop - 1]
 
-    return bleep.astype(np.float32)
+
+def _bleep_durations(starts: np.ndarray, ends: np.ndarray, min_bleep_ms: float) -> np.ndarray:
+    """Bleep duration in seconds: max(min_bleep, actual duration)."""
+    return np.maximum(min_bleep_ms, (ends - starts) * 1000) / 1000
 
 
 def merge_overlapping_regions(
     regions: List[BleepRegion],
-    min_gap_s: float = 0.1
+    min_gap_s: float = 0.1,
+    min_bleep_ms: float = MIN_BLEEP_DURATION_MS
 ) -> List[BleepRegion]:
     """Merge overlapping or adjacent bleep regions into single bleeps."""
     if not regions:
         return []
 
-    # Sort by start time
-    sorted_regions = sorted(regions, key=lambda r: r.start_time)
-
-    merged = [sorted_regions[0]]
-
-    for region in sorted_regions[1:]:
-        last = merged[-1]
-
-        # Check if regions overlap or are very close
-        if region.start_time <= last.end_time + min_gap_s:
-            # Merge: extend end time and combine PII matches
-            merged[-1] = BleepRegion(
-                start_time=last.start_time,
-                end_time=max(last.end_time, region.end_time),
-                bleep_duration=0,  # Will recalculate
-                pii_matches=last.pii_matches + region.pii_matches
-            )
-        else:
-            merged.append(region)
+    starts = np.fromiter((r.start_time for r in regions), dtype=np.float64, count=len(regions))
+    ends = np.fromiter((r.end_time for r in regions), dtype=np.float64, count=len(regions))
+    order = np.argsort(starts, kind="stable")
 
-    # Recalculate bleep durations for merged regions
-    for region in merged:
-        actual_duration_ms = (region.end_time - region.start_time) * 1000
-        region.bleep_duration = max(MIN_BLEEP_DURATION_MS, actual_duration_ms) / 1000
+    first, stop, group_starts, group_ends = sweep_merge(starts[order], ends[order], min_gap_s)
+    durations = _bleep_durations(group_starts, group_ends, min_bleep_ms)
 
-    return merged
+    ordered = [regions[i] for i in order]
+    return [
+        BleepRegion(
+            start_time=float(group_starts[k]),
+            end_time=float(group_ends[k]),
+            bleep_duration=float(durations[k]),
+            pii_matches=list(chain.from_iterable(r.pii_matches for r in ordered[a:b]))
+        )
+        for k, (a, b) in enumerate(zip(first.tolist(), stop.tolist()))
+    ]
 
 
 class AudioRedactor:
@@ -105,121 +301,404 @@ class AudioRedactor:
         bleep_freq: float = BLEEP_FREQUENCY_HZ,
         bleep_amp: float = BLEEP_AMPLITUDE,
         padding_before_ms: int = PADDING_BEFORE_MS,
-        padding_after_ms: int = PADDING_AFTER_MS
+        padding_after_ms: int = PADDING_AFTER_MS,
+        streaming: bool = STREAMING_REDACTION,
+        block_frames: int = AUDIO_BLOCK_FRAMES,
+        native_pcm16: bool = NATIVE_PCM16_REDACTION,
+        profile: EncodingProfile = OUTPUT_PROFILES[DEFAULT_OUTPUT_PROFILE],
+        per_channel: bool = False
     ):
-        """Initialize with configurable bleep settings."""
+        """
+        Initialize with configurable bleep settings.
+
+        streaming reads and writes the file in blocks of block_frames so memory
+        stays constant; the output is bit-identical to the in-memory path.
+        native_pcm16 keeps 16-bit PCM sources as int16 end to end.
+        profile sets the output format, subtype and compression level.
+        per_channel keeps the source channel layout and bleeps each channel
+        only for the matches tagged with that channel (PIIMatch.channel).
+        """
         self.min_bleep_ms = min_bleep_ms
         self.bleep_freq = bleep_freq
         self.bleep_amp = bleep_amp
         self.padding_before_s = padding_before_ms / 1000
         self.padding_after_s = padding_after_ms / 1000
+        self.streaming = streaming
+        self.block_frames = block_frames
+        self.native_pcm16 = native_pcm16
+        self.profile = profile
+        self.per_channel = per_channel
 
     def calculate_bleep_regions(
         self,
         pii_matches: List[PIIMatch],
         audio_duration: float
     ) -> List[BleepRegion]:
-        """Calculate bleep regions from PII matches. Uses max(400ms, actual + padding)."""
-        regions = []
+        """
+        Calculate bleep regions from PII matches. Uses max(400ms, actual + padding).
+
+        Padded times live in numpy arrays and are merged with a single sweep;
+        each region takes a slice of the start-sorted matches, so the whole
+        thing is linear in the number of matches after the sort.
+        """
+        n = len(pii_matches)
+        if n == 0:
+            return []
+
+        # Calculate padded regions
+        starts = np.fromiter((m.start_time for m in pii_matches), dtype=np.float64, count=n)
+        ends = np.fromiter((m.end_time for m in pii_matches), dtype=np.float64, count=n)
+        starts = np.maximum(0, starts - self.padding_before_s)
+        ends = np.minimum(audio_duration, ends + self.padding_after_s)
+
+        order = np.argsort(starts, kind="stable")
+        first, stop, region_starts, region_ends = sweep_merge(starts[order], ends[order])
+        durations = _bleep_durations(region_starts, region_ends, self.min_bleep_ms)
+
+        sorted_matches = [pii_matches[i] for i in order]
+        return [
+            BleepRegion(
+                start_time=float(region_starts[k]),
+                end_time=float(region_ends[k]),
+                bleep_duration=float(durations[k]),
+                pii_matches=sorted_matches[a:b]
+            )
+            for k, (a, b) in enumerate(zip(first.tolist(), stop.tolist()))
+        ]
+
+    def choose_mode(self, audio_path: str, pii_matches: List[PIIMatch]) -> str:
+        """Pick the redaction mode for a file from its header."""
+        info = probe_audio(str(audio_path))
+
+        if not pii_matches:
+            # Nothing to bleep: reuse the source bytes if they're already what we'd write
+            expected_channels = info.channels if self.per_channel else AUDIO_CHANNELS
+            # A compression level can't be read back from the header, so a
+            # profile that sets one always re-encodes
+            if (
+                info.format == self.profile.format.upper()
+                and info.channels == expected_channels
+                and info.subtype == self.profile.subtype
+                and info.samplerate == self.profile.sample_rate
+                and self.profile.compression_level is None
+            ):
+                return MODE_PASSTHROUGH
+            return MODE_TRANSCODE
+
+        return self._sample_mode(info)
+
+    def _sample_mode(self, info: AudioInfo) -> str:
+        """Pick int16 or float32 processing from a source header."""
+        if self.native_pcm16 and info.subtype == "PCM_16":
+            return MODE_PCM16
+        return MODE_FLOAT32
+
+    def bleep_regions_for(
+        self,
+        audio_path: str,
+        pii_matches: List[PIIMatch],
+        mode: str
+    ) -> List[BleepRegion]:
+        """
+        The bleep regions redact() writes for these matches, from the header
+        alone; used when the redacted audio from an earlier run is kept.
+        """
+        if mode in ZERO_PII_MODES:
+            return []
+        info = probe_audio(str(audio_path))
+        regions, _ = self._plan_regions(pii_matches, info.duration, info.channels)
+        return regions
 
-        for match in pii_matches:
-            # Calculate padded region
-            start_time = max(0, match.start_time - self.padding_before_s)
-            end_time = min(audio_duration, match.end_time + self.padding_after_s)
+    def redact(
+        self,
+        audio_path: str,
+        pii_matches: List[PIIMatch],
+        output_path: Optional[str] = None,
+        mode: Optional[str] = None
+    ) -> Tuple[str, List[BleepRegion]]:
+        """
+        Redact PII from audio file. Returns (output_path, bleep_regions).
+        mode defaults to choose_mode(); pass it in to record the decision.
+        """
+        audio_path = Path(audio_path)
+        if not audio_path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-            # Calculate actual duration with padding
-            actual_duration_ms = (end_time - start_time) * 1000
+        output_path = self._get_output_path(audio_path, output_path)
+        if mode is None:
+            mode = self.choose_mode(str(audio_path), pii_matches)
+
+        if mode == MODE_PASSTHROUGH:
+            method = link_or_copy(audio_path, output_path)
+            logger.info(f"No PII, {method} source to: {output_path}")
+            return str(output_path), []
+
+        if mode == MODE_TRANSCODE:
+            # Zero regions, so streaming is a plain block-by-block transcode
+            sample_mode = self._sample_mode(probe_audio(str(audio_path)))
+            regions = self._redact_streaming(audio_path, [], output_path, sample_mode)
+        elif self.streaming or not self._can_load_whole(audio_path):
+            regions = self._redact_streaming(audio_path, pii_matches, output_path, mode)
+        else:
+            regions = self._redact_in_memory(audio_path, pii_matches, output_path, mode)
 
-            # Bleep duration: max(min_bleep, actual_duration)
-            bleep_duration_ms = max(self.min_bleep_ms, actual_duration_ms)
-            bleep_duration_s = bleep_duration_ms / 1000
+        logger.info(f"Saved redacted audio to: {output_path}")
+        return str(output_path), regions
 
-            regions.append(BleepRegion(
-                start_time=start_time,
-                end_time=end_time,
-                bleep_duration=bleep_duration_s,
-                pii_matches=[match]
-            ))
+    def _encoder_args(self) -> Dict[str, object]:
+        """soundfile write arguments for the output profile."""
+        args: Dict[str, object] = {
+            "format": self.profile.format.upper(),
+            "subtype": self.profile.subtype,
+        }
+        if self.profile.compression_level is not None:
+            args["compression_level"] = self.profile.compression_level
+        return args
+
+    def _can_load_whole(self, audio_path: Path) -> bool:
+        """
+        Whether the in-memory path can read this file: soundfile formats
+        already at the output rate (the rest are resampled while streaming).
+        """
+        info = probe_audio(str(audio_path))
+        return (
+            info.decoder == SoundFileSource.decoder_name
+            and info.samplerate == self.profile.sample_rate
+        )
+
+    def _get_output_path(self, audio_path: Path, output_path: Optional[str]) -> Path:
+        """Resolve the output path and make sure its directory exists."""
+        if output_path is None:
+            output_path = audio_path.parent / f"{audio_path.stem}_redacted.{self.profile.extension}"
+        else:
+            output_path = Path(output_path)
 
-        # Merge overlapping regions
-        return merge_overlapping_regions(regions)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        return output_path
 
-    def redact(
+    def _plan_regions(
         self,
-        audio_path: str,
         pii_matches: List[PIIMatch],
-        output_path: Optional[str] = None
-    ) -> Tuple[str, List[BleepRegion]]:
-        """Redact PII from audio file. Returns (output_path, bleep_regions)."""
+        audio_duration: float,
+        channels: int
+    ) -> Tuple[List[BleepRegion], List[List[BleepRegion]]]:
+        """
+        Calculate bleep regions for each output channel.
+        Returns (all regions sorted by start, regions per output channel).
+        Matches without a channel are bleeped on every channel.
+        """
+        if not self.per_channel or channels == 1:
+            regions = self.calculate_bleep_regions(pii_matches, audio_duration)
+            return regions, [regions]
+
+        shared = [m for m in pii_matches if m.channel is None]
+        per_channel = []
+        for ch in range(channels):
+            ch_matches = [m for m in pii_matches if m.channel == ch] + shared
+            ch_regions = self.calculate_bleep_regions(ch_matches, audio_duration)
+            for region in ch_regions:
+                region.channel = ch
+            per_channel.append(ch_regions)
+
+        regions = sorted(
+            (r for ch_regions in per_channel for r in ch_regions),
+            key=lambda r: (r.start_time, r.channel)
+        )
+        return regions, per_channel
+
+    def _redact_in_memory(
+        self,
+        audio_path: Path,
+        pii_matches: List[PIIMatch],
+        output_path: Path,
+        mode: str
+    ) -> List[BleepRegion]:
+        """Redact by loading the whole file into memory."""
         import soundfile as sf
 
-        audio_path = Path(audio_path)
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        dtype = _mode_dtype(mode)
 
         # Read audio
-        audio_data, sample_rate = sf.read(str(audio_path), dtype='float32')
+        audio_data, sample_rate = sf.read(str(audio_path), dtype=dtype, always_2d=True)
+        channels = audio_data.shape[1]
 
-        # Handle stereo -> mono
-        if len(audio_data.shape) > 1:
-            audio_data = audio_data.mean(axis=1)
+        if self.per_channel:
+            # Bleep each channel through a strided view; layout is kept as-is
+            redacted_audio = audio_data if channels > 1 else audio_data[:, 0]
+            views = [audio_data[:, ch] for ch in range(channels)]
+        else:
+            # Handle stereo -> mono
+            if channels > 1:
+                audio_data = _downmix(audio_data, np.empty(len(audio_data), dtype=dtype))
+            else:
+                audio_data = audio_data[:, 0]
+            redacted_audio = audio_data.copy()
+            views = [redacted_audio]
 
         audio_duration = len(audio_data) / sample_rate
         logger.info(f"Loaded audio: {audio_duration:.1f}s, {sample_rate}Hz")
 
         # Calculate bleep regions
-        regions = self.calculate_bleep_regions(pii_matches, audio_duration)
+        regions, channel_regions = self._plan_regions(pii_matches, audio_duration, channels)
         logger.info(f"Calculated {len(regions)} bleep regions from {len(pii_matches)} PII matches")
 
         # Apply bleeps
-        redacted_audio = audio_data.copy()
-
-        for region in regions:
-            # Calculate sample positions
-            start_sample = int(region.start_time * sample_rate)
-            end_sample = int(region.end_time * sample_rate)
-
-            # Generate bleep tone
-            bleep = generate_bleep_tone(
-                region.bleep_duration,
-                sample_rate,
-                self.bleep_freq,
-                self.bleep_amp
-            )
+        for view, ch_regions in zip(views, channel_regions):
+            apply_bleeps(view, ch_regions, sample_rate, self.bleep_freq, self.bleep_amp)
+
+        # Write output
+        sf.write(str(output_path), redacted_audio, sample_rate, **self._encoder_args())
+        return regions
 
-            # Replace audio segment with bleep
-            # If bleep is longer than segment, we extend; if shorter, we truncate
-            segment_length = end_sample - start_sample
-            bleep_length = len(bleep)
+    def _redact_streaming(
+        self,
+        audio_path: Path,
+        pii_matches: List[PIIMatch],
+        output_path: Path,
+        mode: str
+    ) -> List[BleepRegion]:
+        """
+        Redact block by block, so memory doesn't grow with recording length.
+        Regions are sorted and non-overlapping, so one cursor per output
+        channel tracks which ones can intersect the current block.
+        Any source open_audio() accepts works here, including compressed
+        formats decoded on the fly; sources at another rate than the
+        profile's are resampled to it.
+        """
+        import soundfile as sf
 
-            if bleep_length >= segment_length:
-                # Bleep covers the segment (possibly longer)
-                redacted_audio[start_sample:end_sample] = bleep[:segment_length]
-            else:
-                # Bleep is shorter (shouldn't happen with our formula, but handle it)
-                redacted_audio[start_sample:start_sample + bleep_length] = bleep
-                # Silence the rest
-                redacted_audio[start_sample + bleep_length:end_sample] = 0
-
-            logger.debug(
-                f"Applied bleep at {region.start_time:.2f}s-{region.end_time:.2f}s "
-                f"(duration: {region.bleep_duration:.3f}s)"
-            )
+        dtype = _mode_dtype(mode)
 
-        # Determine output path
-        if output_path is None:
-            output_path = audio_path.parent / f"{audio_path.stem}_redacted.{OUTPUT_AUDIO_FORMAT}"
-        else:
-            output_path = Path(output_path)
+        with open_audio(str(audio_path), samplerate=self.profile.sample_rate) as src:
+            sample_rate = src.samplerate
+            channels = src.channels
+            out_channels = channels if self.per_channel else 1
+            audio_duration = src.frames / sample_rate
+            logger.info(f"Streaming audio: {audio_duration:.1f}s, {sample_rate}Hz")
 
-        # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+            regions, channel_regions = self._plan_regions(pii_matches, audio_duration, channels)
+            logger.info(
+                f"Calculated {len(regions)} bleep regions from {len(pii_matches)} PII matches"
+            )
+            channel_bounds = [
+                [
+                    (
+                        int(r.start_time * sample_rate),
+                        int(r.end_time * sample_rate),
+                        int(r.bleep_duration * sample_rate)
+                    )
+                    for r in ch_regions
+                ]
+                for ch_regions in channel_regions
+            ]
+            cursors = [0] * len(channel_bounds)
+
+            # Reused buffers: one for reading, one for the mono downmix
+            read_buf = np.empty((self.block_frames, channels), dtype=dtype)
+            mono_buf = np.empty(self.block_frames, dtype=dtype)
+
+            with sf.SoundFile(
+                str(output_path), "w", samplerate=sample_rate, channels=out_channels,
+                **self._encoder_args()
+            ) as dst:
+                block_start = 0
+
+                while True:
+                    n = src.read(self.block_frames, dtype=dtype, always_2d=True, out=read_buf)
+                    n = len(n)
+                    if n == 0:
+                        break
+
+                    if out_channels > 1:
+                        # Strided per-channel views of the interleaved block
+                        block = read_buf[:n]
+                        views = [block[:, ch] for ch in range(channels)]
+                    else:
+                        # Handle stereo -> mono
+                        if channels > 1:
+                            block = _downmix(read_buf[:n], mono_buf[:n])
+                        else:
+                            block = read_buf[:n, 0]
+                        views = [block]
+
+                    for k, view in enumerate(views):
+                        cursors[k] = self._bleep_block(
+                            view, block_start, channel_bounds[k], cursors[k], sample_rate
+                        )
+
+                    dst.write(block)
+                    block_start += n
+
+        return regions
+
+    def _bleep_block(
+        self,
+        block: np.ndarray,
+        block_start: int,
+        bounds: List[Tuple[int, int, int]],
+        cursor: int,
+        sample_rate: int
+    ) -> int:
+        """Apply the bleeps that intersect one block. Returns the advanced cursor."""
+        block_end = block_start + len(block)
+
+        while cursor < len(bounds) and bounds[cursor][1] <= block_start:
+            cursor += 1
+        i = cursor
+        while i < len(bounds) and bounds[i][0] < block_end:
+            write_bleep(
+                block, block_start, *bounds[i],
+                sample_rate, self.bleep_freq, self.bleep_amp
+            )
+            i += 1
 
-        # Write output
-        sf.write(str(output_path), redacted_audio, sample_rate)
-        logger.info(f"Saved redacted audio to: {output_path}")
+        return cursor
 
-        return str(output_path), regions
+
+def link_or_copy(src: Path, dst: Path) -> str:
+    """
+    Materialize src at dst as cheaply as possible: hardlink, then reflink,
+    then a plain copy. Returns the method used.
+    """
+    src, dst = Path(src), Path(dst)
+    if src.resolve() == dst.resolve():
+        return "in-place"
+
+    # Build under a temp name and rename, so an existing output is replaced atomically
+    tmp = dst.with_name(f".{dst.name}.tmp")
+    if tmp.exists():
+        tmp.unlink()
+
+    try:
+        os.link(src, tmp)
+        method = "hardlink"
+    except OSError:
+        try:
+            import fcntl
+            with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            method = "reflink"
+        except (OSError, ImportError):
+            shutil.copyfile(src, tmp)
+            method = "copy"
+
+    os.replace(tmp, dst)
+    return method
+
+
+def _mode_dtype(mode: str) -> str:
+    """Get the read dtype for a redaction mode."""
+    if mode == MODE_PCM16:
+        return "int16"
+    return "float32"
+
+
+def _downmix(audio: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Average channels into out (float32 or int16)."""
+    if out.dtype == np.int16:
+        out[...] = np.rint(audio.mean(axis=1))
+        return out
+    return np.mean(audio, axis=1, out=out)
 
 
 def redact_audio(
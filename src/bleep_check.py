@@ -0,0 +1,261 @@
+"""
+Spectral pre-check of bleep regions.
+Reads only the bleep regions of a redacted file (plus one window on each
+side) and checks them with a windowed FFT:
+
+- inside the region every window must be dominated by the bleep tone, at the
+  expected level, with almost no other speech-band energy; a bad first or last
+  window means the bleep is shifted or cut short
+- the windows just outside the region must not carry the tone, which would
+  also mean the bleep is shifted
+
+Takes milliseconds per file, so it runs before the much slower audio re-ASR
+and lets verification skip re-ASR when the bleeps are right.
+"""
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .audio_redactor import BleepRegion
+from .config import (
+    BLEEP_FREQUENCY_HZ,
+    BLEEP_AMPLITUDE,
+    SPECTRAL_WINDOW_MS,
+    SPECTRAL_TONE_BAND_HZ,
+    SPECTRAL_SPEECH_BAND_HZ,
+    SPECTRAL_MIN_TONE_FRACTION,
+    SPECTRAL_MAX_SPEECH_FRACTION,
+    SPECTRAL_LEVEL_TOLERANCE_DB
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BleepCheckResult:
+    """Result of the spectral check of one file."""
+    regions_checked: int
+    flagged: List[Dict] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    @property
+    def passed(self) -> bool:
+        return not self.flagged
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "passed": self.passed,
+            "regions_checked": self.regions_checked,
+            "flagged": self.flagged,
+            "elapsed_ms": round(self.elapsed_ms, 2)
+        }
+
+
+class SpectralChecker:
+    """Checks bleep regions of redacted audio for the tone, and only the tone."""
+
+    def __init__(
+        self,
+        frequency: float = BLEEP_FREQUENCY_HZ,
+        amplitude: float = BLEEP_AMPLITUDE,
+        window_ms: float = SPECTRAL_WINDOW_MS,
+        tone_band_hz: float = SPECTRAL_TONE_BAND_HZ,
+        speech_band_hz: Tuple[float, float] = SPECTRAL_SPEECH_BAND_HZ,
+        min_tone_fraction: float = SPECTRAL_MIN_TONE_FRACTION,
+        max_speech_fraction: float = SPECTRAL_MAX_SPEECH_FRACTION,
+        level_tolerance_db: float = SPECTRAL_LEVEL_TOLERANCE_DB
+    ):
+        """
+        Initialize the checker.
+
+        Args:
+            frequency: Bleep tone frequency
+            amplitude: Bleep tone amplitude (full scale = 1.0)
+            window_ms: FFT window length
+            tone_band_hz: Half-width of the band counted as tone
+            speech_band_hz: (low, high) band counted as speech, minus the tone band
+            min_tone_fraction: Share of window energy that must be tone
+            max_speech_fraction: Share of window energy allowed as speech
+            level_tolerance_db: Allowed deviation of the tone level
+        """
+        self.frequency = frequency
+        self.window_ms = window_ms
+        self.tone_band_hz = tone_band_hz
+        self.speech_band_hz = speech_band_hz
+        self.min_tone_fraction = min_tone_fraction
+        self.max_speech_fraction = max_speech_fraction
+        self.level_tolerance_db = level_tolerance_db
+        # Mean square of a full-scale sine is amplitude^2 / 2
+        self.expected_level_db = 10 * np.log10(amplitude ** 2 / 2)
+
+    def analyze(
+        self, frames: np.ndarray, sample_rate: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Analyze equal-length windows (one per row).
+
+        Returns:
+            Tuple of (tone_fraction, speech_fraction, tone_level_db), one value
+            per window. Fractions are shares of the window's spectral energy.
+        """
+        n = frames.shape[1]
+        spectrum = np.fft.rfft(frames * np.hanning(n), axis=1)
+        power = spectrum.real ** 2 + spectrum.imag ** 2
+        freqs = np.fft.rfftfreq(n, 1 / sample_rate)
+
+        tone_band = np.abs(freqs - self.frequency) <= self.tone_band_hz
+        low, high = self.speech_band_hz
+        speech_band = (freqs >= low) & (freqs <= high) & ~tone_band
+
+        total = np.maximum(power.sum(axis=1), 1e-20)
+        tone_fraction = power[:, tone_band].sum(axis=1) / total
+        speech_fraction = power[:, speech_band].sum(axis=1) / total
+
+        mean_square = np.mean(frames.astype(np.float64) ** 2, axis=1)
+        tone_level_db = 10 * np.log10(np.maximum(mean_square * tone_fraction, 1e-20))
+        return tone_fraction, speech_fraction, tone_level_db
+
+    def _is_tone(self, tone_fraction: np.ndarray, level_db: np.ndarray) -> np.ndarray:
+        """Windows dominated by the tone at the expected level."""
+        return (
+            (tone_fraction >= self.min_tone_fraction)
+            & (np.abs(level_db - self.expected_level_db) <= self.level_tolerance_db)
+        )
+
+    def check_region(
+        self,
+        audio: np.ndarray,
+        audio_start: int,
+        start: int,
+        end: int,
+        sample_rate: int,
+        total_frames: int
+    ) -> Tuple[List[str], Dict[str, float]]:
+        """
+        Check one bleep region.
+
+        Args:
+            audio: Mono samples from audio_start on (region plus margins)
+            audio_start: Frame index of audio[0] in the file
+            start: First frame of the region
+            end: End frame of the region (exclusive)
+            sample_rate: Sample rate
+            total_frames: Length of the file
+
+        Returns:
+            Tuple of (issues, stats); no issues means the region passed
+        """
+        issues = []
+        if end > total_frames:
+            issues.append("truncated")
+            end = total_frames
+        length = end - start
+        if length <= 0:
+            return issues, {}
+
+        window = min(int(self.window_ms * sample_rate / 1000), length)
+
+        # Windows tile the region; the last one is aligned to its end
+        offsets = list(range(start, end - window + 1, window))
+        if offsets[-1] != end - window:
+            offsets.append(end - window)
+        idx = np.asarray(offsets) - audio_start
+        frames = audio[idx[:, None] + np.arange(window)]
+
+        tone_fraction, speech_fraction, level_db = self.analyze(frames, sample_rate)
+        bad = ~self._is_tone(tone_fraction, level_db) | (speech_fraction > self.max_speech_fraction)
+
+        if bad[0]:
+            issues.append("start_edge")
+        if len(bad) > 1 and bad[-1]:
+            issues.append("end_edge")
+        if bad[1:-1].any():
+            issues.append("interior")
+
+        # Margins: the tone mustn't carry on past the region
+        margins = []
+        if start - window >= audio_start:
+            margins.append(("tone_before_region", start - window))
+        if end + window <= min(total_frames, audio_start + len(audio)):
+            margins.append(("tone_after_region", end))
+        if margins:
+            idx = np.asarray([m for _, m in margins]) - audio_start
+            margin_tone, _, margin_level = self.analyze(
+                audio[idx[:, None] + np.arange(window)], sample_rate
+            )
+            for (name, _), is_tone in zip(margins, self._is_tone(margin_tone, margin_level)):
+                if is_tone:
+                    issues.append(name)
+
+        stats = {
+            "min_tone_fraction": round(float(tone_fraction.min()), 4),
+            "max_speech_fraction": round(float(speech_fraction.max()), 4),
+        }
+        return issues, stats
+
+    def check(self, audio_path: str, regions: List[BleepRegion]) -> BleepCheckResult:
+        """
+        Check every bleep region of a redacted file.
+        Only the regions and their margins are read (seek + read).
+
+        Args:
+            audio_path: Redacted audio file
+            regions: Bleep regions written into it
+
+        Returns:
+            BleepCheckResult
+        """
+        import soundfile as sf
+
+        started = time.perf_counter()
+        flagged = []
+
+        with sf.SoundFile(str(audio_path)) as f:
+            sample_rate = f.samplerate
+            total_frames = f.frames
+            window = int(self.window_ms * sample_rate / 1000)
+
+            for k, region in enumerate(regions):
+                start = int(region.start_time * sample_rate)
+                end = int(region.end_time * sample_rate)
+                read_start = max(0, start - window)
+                f.seek(min(read_start, total_frames))
+                block = f.read(max(0, end + window - read_start), dtype="float32", always_2d=True)
+                audio = _channel(block, region.channel)
+
+                issues, stats = self.check_region(
+                    audio, read_start, start, end, sample_rate, total_frames
+                )
+                if issues:
+                    flagged.append({
+                        "index": k,
+                        "start_time": region.start_time,
+                        "end_time": region.end_time,
+                        "channel": region.channel,
+                        "issues": issues,
+                        **stats
+                    })
+
+        result = BleepCheckResult(
+            regions_checked=len(regions),
+            flagged=flagged,
+            elapsed_ms=(time.perf_counter() - started) * 1000
+        )
+        logger.info(
+            f"Spectral check: {len(regions) - len(flagged)}/{len(regions)} bleep regions "
+            f"passed in {result.elapsed_ms:.1f}ms"
+        )
+        return result
+
+
+def _channel(block: np.ndarray, channel: Optional[int]) -> np.ndarray:
+    """One channel of a block; the mix when the region applies to all channels."""
+    if channel is not None and channel < block.shape[1]:
+        return block[:, channel]
+    if block.shape[1] == 1:
+        return block[:, 0]
+    return block.mean(axis=1)
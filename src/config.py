@@ -3,7 +3,7 @@ Pipeline configuration.
 """
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -37,14 +37,96 @@ BLEEP_FREQUENCY_HZ = 1000       # Bleep tone frequency (1kHz)
 BLEEP_AMPLITUDE = 0.5           # Bleep volume (50%)
 PADDING_BEFORE_MS = 150         # Padding before PII word (±100ms accuracy + 50ms safety)
 PADDING_AFTER_MS = 150          # Padding after PII word
+STREAMING_REDACTION = True      # Redact block by block instead of loading the whole file
+AUDIO_BLOCK_FRAMES = 65536      # Frames per block for streaming redaction (~4s at 16kHz)
+NATIVE_PCM16_REDACTION = True   # Keep 16-bit PCM sources as int16 (half the memory of float32)
+MULTICHANNEL_REDACTION = False  # Transcribe/redact each channel separately, keep channel layout
+CHANNEL_WORKERS = 2             # Channels processed in parallel in multi-channel mode
 
 # Verification thresholds
 VERIFY_PASS_THRESHOLD = 0       # 0 PII found = PASS
 VERIFY_REVIEW_THRESHOLD = 2    # ≤2 low-confidence = PASS_WITH_NOTE
 VERIFY_FAIL_THRESHOLD = 2      # >2 = FAIL
 
+# Spectral pre-check of bleep regions (runs before audio re-ASR)
+SPECTRAL_PRECHECK = True            # Check every bleep region for the tone with an FFT
+SPECTRAL_SKIP_REASR = True          # Skip re-ASR when all bleeps pass and all matches are exact
+SPECTRAL_SKIP_MIN_CONFIDENCE = 1.0  # Match confidence needed to skip re-ASR
+SPECTRAL_WINDOW_MS = 20             # FFT window length
+SPECTRAL_TONE_BAND_HZ = 100         # Tone band is BLEEP_FREQUENCY_HZ ± this
+SPECTRAL_SPEECH_BAND_HZ = (300, 3400)  # Speech band (tone band excluded)
+SPECTRAL_MIN_TONE_FRACTION = 0.9    # Share of window energy that must be tone
+SPECTRAL_MAX_SPEECH_FRACTION = 0.05 # Share of window energy allowed in the speech band
+SPECTRAL_LEVEL_TOLERANCE_DB = 3.0   # Allowed tone level deviation from BLEEP_AMPLITUDE
+
+# Risk-scored audio verification (re-ASR high-risk files plus a random audit)
+VERIFY_AUDIT_RATE = None            # None = re-ASR every file; else audit share of low-risk files
+VERIFY_AUDIT_SEED = 0               # Audit draws are a stable hash of (seed, conversation_id)
+RISK_THRESHOLD = 1.0                # Files scoring at least this are always verified
+RISK_WEIGHTS = {
+    "fuzzy_matches": 1.0,           # Per fuzzy PII match
+    "low_confidence_words": 0.25,   # Per low-confidence word near PII
+    "edge_matches": 0.5,            # Per PII word close to its bleep edge
+    "history": 2.0,                 # Previous run needed review or failed
+}
+RISK_LOW_CONFIDENCE = 0.6           # Word confidence counted as low
+RISK_CONTEXT_S = 1.0                # How close to PII a low-confidence word must be
+RISK_EDGE_MARGIN_MS = 100           # PII closer than this to a bleep edge counts as risky
+
 # Output format
 OUTPUT_AUDIO_FORMAT = "flac"    # Lossless compression
+DEFAULT_OUTPUT_PROFILE = "default"  # See OUTPUT_PROFILES below
+
+# Transcript serialization
+TRANSCRIPT_COMPRESSION = None   # None (plain .json), "gzip" or "zstd" (needs zstandard)
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+DEID_INCLUDE_ORIGINAL_TEXT = False  # original_text duplicates the raw transcript
+
+# Word-level export (Parquet with pyarrow, .npz otherwise)
+EXPORT_WORD_TABLES = False      # Write exports/words_raw and exports/words_deid
+EXPORT_ROW_GROUP_ROWS = 100_000 # Rows per row group
+EXPORT_SHARD_ROWS = 1_000_000   # Rows per shard file
+
+# Reviewer clip extraction
+REVIEW_CONTEXT_S = 2.0          # Seconds of audio around a bleep region
+REVIEW_BLOCK_FRAMES = 16000     # Frames per cached block
+REVIEW_CACHE_BLOCKS = 64        # Decoded blocks kept in the LRU cache
+
+# Background output writing (audio encoding + JSON serialization)
+ASYNC_OUTPUT_WRITES = True      # Write outputs on a background pool
+OUTPUT_WRITER_WORKERS = 2       # Writer threads
+OUTPUT_WRITER_QUEUE_SIZE = 8    # Max pending writes before the pipeline blocks
+
+# Background verification (runs next to the main stages of later files)
+ASYNC_VERIFICATION = True       # Verify on a background pool
+VERIFY_WORKERS = 1              # Verification threads (each re-ASR holds a model)
+VERIFY_QUEUE_SIZE = 4           # Max pending verifications before the pipeline blocks
+MANIFEST_UPDATE_INTERVAL_S = 5.0  # Min seconds between manifest rewrites during a batch
+
+# Stage-pipelined batch execution (different files in different stages at once)
+STAGED_EXECUTION = False        # Use the staged executor instead of one file at a time
+STAGE_WORKERS = {               # Threads per stage
+    "transcribe": 1,            # Shares one Whisper model
+    "redact_text": 2,           # PII detection + transcript redaction
+    "redact_audio": 2,          # Bleeping and encoding
+    "finish": 1,                # Verification hand-off and output writes
+}
+STAGE_QUEUE_SIZE = 2            # Files waiting in front of each stage
+
+# Processing journal (<output>/checkpoints/journal.jsonl), for resumable batches
+JOURNAL_FILE = "journal.jsonl"
+JOURNAL_RESUME = True           # Skip completed files, resume failed ones at their last checkpoint
+
+# Processing report
+REPORT_PERCENTILES = (50, 95, 99)  # Per-stage timing percentiles
+
+# Batch scheduling
+SCHEDULE_LONGEST_FIRST = True   # Start the longest files first (durations from file headers)
+PROBE_WORKERS = 8               # Threads reading file headers
+
+# Memory-bounded batches: release each conversation once its outputs are written
+STREAMING_BATCH = False         # process_batch returns ConversationSummary objects
 
 
 @dataclass
@@ -55,27 +137,112 @@ class ProcessingResult:
     stage: Optional[str] = None  # transcription, detection, redaction, verification
     error: Optional[str] = None
     pii_count: int = 0
-    verification_status: Optional[str] = None  # PASS, PASS_WITH_NOTE, REVIEW, FAIL
+    verification_status: Optional[str] = None  # PASS, PASS_WITH_NOTE, REVIEW, FAIL, NOT_VERIFIED
     audio_duration_s: float = 0.0
     processing_time_s: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True)
+class EncodingProfile:
+    """Output audio encoding settings."""
+    name: str
+    format: str                                # soundfile format (flac, wav)
+    subtype: str                               # Sample format (PCM_16, PCM_24)
+    compression_level: Optional[float] = None  # FLAC only: 0.0 fastest .. 1.0 smallest
+    sample_rate: int = SAMPLE_RATE             # Output rate; other sources are resampled
+
+    @property
+    def extension(self) -> str:
+        """File extension for this profile."""
+        return self.format.lower()
+
+
+# Output encoding profiles, selectable per run (--output-profile).
+# Run scripts/benchmark_encoding.py to compare speed vs size.
+OUTPUT_PROFILES = {
+    "default": EncodingProfile("default", OUTPUT_AUDIO_FORMAT, "PCM_16"),
+    "archive": EncodingProfile("archive", "flac", "PCM_16", compression_level=1.0),
+    "review": EncodingProfile("review", "flac", "PCM_16", compression_level=0.0),
+    "hires": EncodingProfile("hires", "flac", "PCM_24"),
+    "wav": EncodingProfile("wav", "wav", "PCM_16"),
+}
+
+
 class PIIMatch:
-    """A detected PII instance."""
-    text: str                    # Original text matched
-    category: str               # day, month, color, state, city
-    start_time: float           # Start time in seconds
-    end_time: float             # End time in seconds
-    confidence: float           # 1.0 for exact, <1.0 for fuzzy
-    word_indices: list          # Indices of words in transcript
-    is_fuzzy: bool = False      # Whether this was a fuzzy match
+    """
+    A detected PII instance.
+    Uses __slots__ (a long transcript can produce thousands of these), and
+    word_indices is normally a range over the transcript's word table.
+    """
+
+    __slots__ = (
+        "text", "category", "start_time", "end_time",
+        "confidence", "word_indices", "is_fuzzy", "channel"
+    )
+
+    def __init__(
+        self,
+        text: str,                      # Original text matched
+        category: str,                  # day, month, color, state, city
+        start_time: float,              # Start time in seconds
+        end_time: float,                # End time in seconds
+        confidence: float,              # 1.0 for exact, <1.0 for fuzzy
+        word_indices: Sequence[int],    # Indices of words in transcript
+        is_fuzzy: bool = False,         # Whether this was a fuzzy match
+        channel: Optional[int] = None   # Source channel in per-channel mode
+    ):
+        self.text = text
+        self.category = category
+        self.start_time = start_time
+        self.end_time = end_time
+        self.confidence = confidence
+        self.word_indices = word_indices
+        self.is_fuzzy = is_fuzzy
+        self.channel = channel
+
+    def _key(self) -> tuple:
+        return (
+            self.text, self.category, self.start_time, self.end_time,
+            self.confidence, tuple(self.word_indices), self.is_fuzzy, self.channel
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, PIIMatch):
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"PIIMatch({fields})"
 
 
-@dataclass
 class WordTimestamp:
-    """A word with its timestamp."""
-    word: str
-    start: float  # seconds
-    end: float    # seconds
-    confidence: float = 1.0
+    """
+    A word with its timestamp.
+    Transcripts keep their words in a WordTable; this is for words built one
+    at a time (ASR output, checkpoints, redaction labels).
+    """
+
+    __slots__ = ("word", "start", "end", "confidence")
+
+    def __init__(self, word: str, start: float, end: float, confidence: float = 1.0):
+        self.word = word
+        self.start = start    # seconds
+        self.end = end        # seconds
+        self.confidence = confidence
+
+    def __eq__(self, other):
+        try:
+            return (self.word, self.start, self.end, self.confidence) == (
+                other.word, other.start, other.end, other.confidence
+            )
+        except AttributeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"WordTimestamp(word={self.word!r}, start={self.start}, end={self.end}, "
+                f"confidence={self.confidence})")
@@ -0,0 +1,367 @@
+"""
+Word-level export for training jobs.
+Writes every word of the raw and de-identified transcripts as rows of
+columnar shard files, so data loaders can scan just the columns they need
+instead of parsing one JSON file per conversation:
+
+    exports/words_raw/shard-00000.parquet
+    exports/words_deid/shard-00000.parquet
+
+Columns: conversation_id, segment, word, start, end, confidence, label.
+label is the redaction label ([CITY], ...) for PII words and null otherwise;
+in words_deid the PII word itself is replaced by its label, as in the
+de-identified transcript.
+
+Uses Parquet (row-grouped, zstd) when pyarrow is installed, otherwise an
+equivalent .npz layout with dictionary-encoded string columns.
+"""
+import os
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from .config import EXPORT_ROW_GROUP_ROWS, EXPORT_SHARD_ROWS, PIIMatch
+from .lexicon import CATEGORY_LABELS
+from .output_writer import atomic_path
+from .text_redactor import RedactedTranscript
+from .transcriber import TranscriptionResult
+from .word_table import word_strings
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("conversation_id", "segment", "word", "start", "end", "confidence", "label")
+STRING_COLUMNS = ("conversation_id", "word", "label")
+LABELS = set(CATEGORY_LABELS.values())
+
+
+def _pyarrow():
+    """Import pyarrow.parquet, or None if it isn't installed."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def default_backend() -> str:
+    """'parquet' when pyarrow is available, else 'npz'."""
+    return "parquet" if _pyarrow() is not None else "npz"
+
+
+def raw_word_rows(
+    transcript: TranscriptionResult,
+    pii_matches: Sequence[PIIMatch]
+) -> Dict[str, object]:
+    """Columns for every word of a raw transcript, with PII words labelled."""
+    words = transcript.get_all_words()
+    lengths = [len(seg.words) for seg in transcript.segments]
+
+    labels: List[Optional[str]] = [None] * len(words)
+    channels = np.repeat(
+        np.array([-1 if seg.channel is None else seg.channel for seg in transcript.segments]),
+        lengths
+    )
+    for match in pii_matches:
+        label = CATEGORY_LABELS.get(match.category, f"[{match.category.upper()}]")
+        if match.channel is None:
+            indices = match.word_indices
+        else:
+            # Per-channel matches index their channel's transcript, not the
+            # merged one, so find their words by channel and time instead
+            indices = np.flatnonzero(
+                (channels == match.channel)
+                & (words.starts >= match.start_time)
+                & (words.ends <= match.end_time)
+            ).tolist()
+        for i in indices:
+            labels[i] = label
+
+    return {
+        "conversation_id": [transcript.conversation_id] * len(words),
+        "segment": np.repeat(np.arange(len(lengths), dtype=np.int32), lengths),
+        "word": words.words(),
+        "start": words.starts,
+        "end": words.ends,
+        "confidence": words.confidences,
+        "label": labels,
+    }
+
+
+def deid_word_rows(transcript: RedactedTranscript) -> Dict[str, object]:
+    """Columns for every word of a de-identified transcript."""
+    word_list: List[str] = []
+    segment: List[int] = []
+    start: List[float] = []
+    end: List[float] = []
+    confidence: List[float] = []
+
+    for k, seg in enumerate(transcript.redacted_segments):
+        word_list.extend(word_strings(seg.words))
+        segment.extend([k] * len(seg.words))
+        for w in seg.words:
+            start.append(w.start)
+            end.append(w.end)
+            confidence.append(w.confidence)
+
+    return {
+        "conversation_id": [transcript.conversation_id] * len(word_list),
+        "segment": np.array(segment, dtype=np.int32),
+        "word": word_list,
+        "start": np.array(start, dtype=np.float64),
+        "end": np.array(end, dtype=np.float64),
+        "confidence": np.array(confidence, dtype=np.float64),
+        "label": [w if w in LABELS else None for w in word_list],
+    }
+
+
+class WordShardWriter:
+    """
+    Appends word rows to rolling shard files in one directory.
+    Rows are buffered up to row_group_rows and written as one row group;
+    a new shard starts once the current one holds shard_rows rows.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        backend: str,
+        row_group_rows: int = EXPORT_ROW_GROUP_ROWS,
+        shard_rows: int = EXPORT_SHARD_ROWS
+    ):
+        """
+        Initialize the writer. Shards left by a previous export are removed.
+
+        Args:
+            directory: Directory for shard files
+            backend: "parquet" or "npz"
+            row_group_rows: Rows per row group
+            shard_rows: Rows per shard file (rounded up to whole row groups)
+        """
+        self.directory = Path(directory)
+        self.backend = backend
+        self.row_group_rows = row_group_rows
+        self.shard_rows = shard_rows
+        self.paths: List[Path] = []
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for old in self.directory.glob("shard-*"):
+            old.unlink()
+
+        self._buffer: Dict[str, list] = {name: [] for name in COLUMNS}
+        self._buffered = 0
+        self._shard = 0
+        self._shard_rows_written = 0
+        self._groups: List[Dict[str, object]] = []  # npz: row groups of the open shard
+        self._parquet = None                        # parquet: open ParquetWriter
+
+    def add(self, rows: Dict[str, object]) -> None:
+        """Append a conversation's rows (a dict of equal-length columns)."""
+        n = len(rows["word"])
+        if n == 0:
+            return
+        for name in COLUMNS:
+            self._buffer[name].append(rows[name])
+        self._buffered += n
+        if self._buffered >= self.row_group_rows:
+            self._flush_row_group()
+
+    def _take_buffer(self) -> Dict[str, object]:
+        """Concatenate and clear the buffered rows."""
+        columns: Dict[str, object] = {}
+        for name in COLUMNS:
+            parts = self._buffer[name]
+            if name in STRING_COLUMNS:
+                columns[name] = [v for part in parts for v in part]
+            else:
+                columns[name] = np.concatenate(parts)
+        self._buffer = {name: [] for name in COLUMNS}
+        self._buffered = 0
+        return columns
+
+    def _shard_path(self) -> Path:
+        suffix = ".parquet" if self.backend == "parquet" else ".npz"
+        return self.directory / f"shard-{self._shard:05d}{suffix}"
+
+    def _flush_row_group(self) -> None:
+        if self._buffered == 0:
+            return
+        n = self._buffered
+        columns = self._take_buffer()
+
+        if self.backend == "parquet":
+            self._write_parquet_group(columns)
+        else:
+            self._groups.append(columns)
+
+        self._shard_rows_written += n
+        if self._shard_rows_written >= self.shard_rows:
+            self._close_shard()
+
+    def _write_parquet_group(self, columns: Dict[str, object]) -> None:
+        pa = _pyarrow()
+        table = pa.table({
+            "conversation_id": (
+                pa.array(columns["conversation_id"], pa.string()).dictionary_encode()
+            ),
+            "segment": pa.array(columns["segment"], pa.int32()),
+            "word": pa.array(columns["word"], pa.string()),
+            "start": pa.array(columns["start"], pa.float64()),
+            "end": pa.array(columns["end"], pa.float64()),
+            "confidence": pa.array(columns["confidence"], pa.float64()),
+            "label": pa.array(columns["label"], pa.string()).dictionary_encode(),
+        })
+        if self._parquet is None:
+            self._parquet = pa.parquet.ParquetWriter(
+                str(_partial_path(self._shard_path())), table.schema, compression="zstd"
+            )
+        self._parquet.write_table(table, row_group_size=len(table))
+
+    def _close_shard(self) -> None:
+        if self.backend == "parquet":
+            if self._parquet is None:
+                return
+            self._parquet.close()
+            self._parquet = None
+            os.replace(_partial_path(self._shard_path()), self._shard_path())
+        else:
+            if not self._groups:
+                return
+            with atomic_path(self._shard_path()) as tmp:
+                with open(tmp, "wb") as f:
+                    np.savez(f, **_encode_npz(self._groups))
+            self._groups = []
+
+        self.paths.append(self._shard_path())
+        self._shard += 1
+        self._shard_rows_written = 0
+
+    def close(self) -> List[Path]:
+        """Write out buffered rows and close the open shard. Returns shard paths."""
+        self._flush_row_group()
+        self._close_shard()
+        return self.paths
+
+
+def _partial_path(path: Path) -> Path:
+    """Temp name a shard is written under until it's complete."""
+    return path.with_name(f".{path.stem}.partial{path.suffix}")
+
+
+def _dictionary_encode(values: list, code_dtype) -> tuple:
+    """Encode a string column as (codes, values); None becomes code -1."""
+    index: Dict[str, int] = {}
+    codes = np.empty(len(values), dtype=code_dtype)
+    for i, v in enumerate(values):
+        if v is None:
+            codes[i] = -1
+        else:
+            code = index.get(v)
+            if code is None:
+                code = index[v] = len(index)
+            codes[i] = code
+    return codes, np.array(list(index), dtype=np.str_)
+
+
+def _encode_npz(groups: List[Dict[str, object]]) -> Dict[str, np.ndarray]:
+    """Flatten row groups into npz arrays; string columns are dictionary-encoded."""
+    arrays: Dict[str, np.ndarray] = {
+        "_row_groups": np.cumsum([0] + [len(g["word"]) for g in groups]).astype(np.int64)
+    }
+    for name in COLUMNS:
+        if name in STRING_COLUMNS:
+            values = [v for g in groups for v in g[name]]
+            code_dtype = np.int16 if name == "label" else np.int32
+            arrays[name], arrays[f"{name}.values"] = _dictionary_encode(values, code_dtype)
+        else:
+            arrays[name] = np.concatenate([g[name] for g in groups])
+    return arrays
+
+
+class WordExporter:
+    """Exports raw and de-identified word tables for a batch."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        backend: Optional[str] = None,
+        row_group_rows: int = EXPORT_ROW_GROUP_ROWS,
+        shard_rows: int = EXPORT_SHARD_ROWS
+    ):
+        """
+        Initialize the exporter.
+
+        Args:
+            output_dir: Export directory (words_raw/ and words_deid/ go here)
+            backend: "parquet" or "npz" (default: parquet if pyarrow is installed)
+            row_group_rows: Rows per row group
+            shard_rows: Rows per shard file
+        """
+        self.backend = backend or default_backend()
+        if self.backend == "parquet" and _pyarrow() is None:
+            raise ImportError("Parquet export needs pyarrow (or use the npz backend)")
+
+        output_dir = Path(output_dir)
+        self.raw = WordShardWriter(
+            output_dir / "words_raw", self.backend, row_group_rows, shard_rows
+        )
+        self.deid = WordShardWriter(
+            output_dir / "words_deid", self.backend, row_group_rows, shard_rows
+        )
+
+    def add(
+        self,
+        transcript_raw: TranscriptionResult,
+        transcript_redacted: RedactedTranscript,
+        pii_matches: Sequence[PIIMatch]
+    ) -> None:
+        """Add one conversation's words to both tables."""
+        self.raw.add(raw_word_rows(transcript_raw, pii_matches))
+        self.deid.add(deid_word_rows(transcript_redacted))
+
+    def close(self) -> List[Path]:
+        """Finish both tables. Returns all shard paths written."""
+        paths = self.raw.close() + self.deid.close()
+        logger.info(f"Exported word tables ({self.backend}): {len(paths)} shard file(s)")
+        return paths
+
+
+def iter_word_shards(directory: Path) -> Iterator[Path]:
+    """Shard files in an export directory, in order."""
+    directory = Path(directory)
+    return iter(sorted(
+        p for p in directory.glob("shard-*") if p.suffix in (".parquet", ".npz")
+    ))
+
+
+def read_word_shard(path: Path, columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+    """
+    Read selected columns of a shard (either format) as numpy arrays.
+    String columns come back as object arrays, with None for missing labels.
+    """
+    path = Path(path)
+    columns = list(columns or COLUMNS)
+
+    if path.suffix == ".parquet":
+        pa = _pyarrow()
+        if pa is None:
+            raise ImportError("Reading Parquet shards needs pyarrow")
+        table = pa.parquet.read_table(str(path), columns=columns)
+        return {
+            name: np.asarray(table.column(name).to_pylist(), dtype=object)
+            if name in STRING_COLUMNS else table.column(name).to_numpy()
+            for name in columns
+        }
+
+    result: Dict[str, np.ndarray] = {}
+    with np.load(path) as data:
+        for name in columns:
+            if name in STRING_COLUMNS:
+                codes = data[name]
+                values = np.append(data[f"{name}.values"].astype(object), None)
+                result[name] = values[codes]  # code -1 picks the trailing None
+            else:
+                result[name] = data[name]
+    return result
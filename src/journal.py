@@ -0,0 +1,215 @@
+"""
+Processing journal for resumable batches.
+An append-only JSONL file recording each conversation's progress, fsynced
+after every record, so an interrupted or partly failed batch can simply be
+rerun: conversations whose outputs are all in place are skipped, and the
+rest re-enter after the last checkpoint that still holds.
+
+Records (one JSON object per line, later records win):
+- start:  processing (re)starts; carries the source fingerprint, output
+          settings and the checkpoint it resumes from. Drops the
+          conversation's records for that checkpoint and the ones after it.
+- stage:  a checkpoint completed, with the sha256 of every file it wrote
+- failed: processing failed at a stage
+
+Checkpoints, in order: transcribe (raw transcript written), redact_audio
+(redacted audio written), verify, save (transcripts written).
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINTS = ("transcribe", "redact_audio", "verify", "save")
+
+# Checkpoints a conversation needs to count as complete (multi-channel files
+# don't write a transcribe checkpoint, since they can't resume from it)
+COMPLETE_CHECKPOINTS = ("redact_audio", "verify", "save")
+
+RESUME_DONE = "done"  # resume_point() result: nothing left to do
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """sha256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_fingerprint(path: Path) -> Optional[Dict[str, int]]:
+    """Size and mtime of an input file (None if it doesn't exist)."""
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+@dataclass
+class ConversationState:
+    """One conversation's progress, folded from its journal records."""
+    conversation_id: str
+    source: Optional[Dict[str, int]] = None
+    settings: Optional[Dict[str, Any]] = None
+    stages: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    failure: Optional[Dict[str, Any]] = None
+
+    def apply(self, record: Dict[str, Any]) -> None:
+        """Fold one journal record into the state."""
+        event = record.get("event")
+        if event == "start":
+            self.source = record.get("source")
+            self.settings = record.get("settings")
+            self.failure = None
+            first = CHECKPOINTS.index(record.get("resume_from", CHECKPOINTS[0]))
+            for checkpoint in CHECKPOINTS[first:]:
+                self.stages.pop(checkpoint, None)
+        elif event == "stage":
+            self.stages[record["stage"]] = record
+        elif event == "failed":
+            self.failure = record
+
+    @property
+    def complete(self) -> bool:
+        return all(c in self.stages for c in COMPLETE_CHECKPOINTS)
+
+    def outputs_valid(self, checkpoint: str, output_dir: Path, check_hashes: bool = True) -> bool:
+        """Whether a checkpoint was recorded and the files it wrote are unchanged."""
+        record = self.stages.get(checkpoint)
+        if record is None:
+            return False
+        for relative, digest in record.get("outputs", {}).items():
+            path = Path(output_dir) / relative
+            if not path.exists():
+                return False
+            if check_hashes and file_sha256(path) != digest:
+                logger.warning(f"{path} changed since it was written; redoing {checkpoint}")
+                return False
+        return True
+
+    def changed(self, source: Optional[Dict[str, int]], settings: Dict[str, Any]) -> bool:
+        """Whether the input file or output settings differ from the last run's."""
+        return source is None or self.source != source or self.settings != settings
+
+    def resume_point(
+        self,
+        source: Optional[Dict[str, int]],
+        settings: Dict[str, Any],
+        verify_settings: Dict[str, Any],
+        output_dir: Path
+    ) -> str:
+        """
+        Where processing should pick up for this conversation.
+
+        Args:
+            source: Fingerprint of the input file now
+            settings: Output settings now (profile, compression, ...)
+            verify_settings: Verification settings now
+            output_dir: Pipeline output directory
+
+        Returns:
+            RESUME_DONE, or the first checkpoint to redo
+        """
+        if self.changed(source, settings):
+            return CHECKPOINTS[0]
+
+        valid = {c for c in CHECKPOINTS if self.outputs_valid(c, output_dir)}
+        if (
+            all(c in valid for c in COMPLETE_CHECKPOINTS)
+            and self.stages["verify"].get("settings") == verify_settings
+        ):
+            return RESUME_DONE
+        if "transcribe" not in valid:
+            return "transcribe"
+        if "redact_audio" not in valid:
+            return "redact_audio"
+        return "verify"
+
+
+class Journal:
+    """Append-only, fsynced JSONL journal of conversation progress."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize the journal.
+
+        Args:
+            path: Journal file (created on the first record)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def record(self, conversation_id: str, event: str, **data: Any) -> None:
+        """Append one record and fsync it, so it survives a crash right after."""
+        line = dumps({
+            "conversation_id": conversation_id,
+            "event": event,
+            "time": round(time.time(), 3),
+            **data
+        }) + b"\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def record_stage(
+        self,
+        conversation_id: str,
+        checkpoint: str,
+        output_dir: Path,
+        paths: Iterable[Path] = (),
+        **data: Any
+    ) -> None:
+        """Record a completed checkpoint with the hashes of the files it wrote."""
+        outputs = {
+            Path(p).relative_to(output_dir).as_posix(): file_sha256(Path(p))
+            for p in paths
+        }
+        self.record(conversation_id, "stage", stage=checkpoint, outputs=outputs, **data)
+
+    def load(self) -> Dict[str, ConversationState]:
+        """
+        Fold the journal into per-conversation state.
+
+        A crash mid-write can leave a truncated last line; it is ignored and
+        cut off, so new records start on a line of their own.
+        """
+        states: Dict[str, ConversationState] = {}
+        with self._lock:
+            if not self.path.exists():
+                return states
+            data = self.path.read_bytes()
+            complete = data.rfind(b"\n") + 1
+            if complete < len(data):
+                logger.warning(f"Ignoring truncated journal entry in {self.path}")
+                os.truncate(self.path, complete)
+
+        for line in data[:complete].splitlines():
+            try:
+                record = loads(line)
+                conversation_id = record["conversation_id"]
+            except (ValueError, KeyError, TypeError):
+                logger.warning(f"Ignoring unreadable journal entry in {self.path}")
+                continue
+            state = states.get(conversation_id)
+            if state is None:
+                state = states[conversation_id] = ConversationState(conversation_id)
+            state.apply(record)
+        return states
+
+
+def stage_outputs(state: ConversationState, checkpoint: str) -> List[str]:
+    """Relative paths of the files a checkpoint wrote."""
+    return list(state.stages.get(checkpoint, {}).get("outputs", {}))
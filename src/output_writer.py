@@ -0,0 +1,186 @@
+"""
+Background output writer - runs audio encoding and JSON serialization off the
+critical path so the next conversation can start transcribing right away.
+Files are written under a temp name and renamed into place when complete,
+so a crash never leaves a half-written output behind.
+"""
+import os
+import json
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple
+
+from .config import OUTPUT_WRITER_WORKERS, OUTPUT_WRITER_QUEUE_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def atomic_path(path: Path) -> Iterator[Path]:
+    """
+    Yield a temp path next to path; rename it over path on success.
+    The temp name keeps the suffix so soundfile can infer the format from it.
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.stem}.partial{path.suffix}")
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        if tmp.exists():
+            tmp.unlink()
+        raise
+
+
+def write_json_atomic(path: Path, data: Any, indent: int = 2) -> None:
+    """Write JSON to path via a temp file and rename."""
+    with atomic_path(path) as tmp:
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=indent)
+
+
+def write_json_rows_atomic(path: Path, rows: Iterable[Any], indent: int = 2) -> None:
+    """
+    Write rows as a JSON array via a temp file and rename, one row at a
+    time, so the rows never have to be in memory together.
+    """
+    pad = " " * indent
+    with atomic_path(path) as tmp:
+        with open(tmp, "w") as f:
+            f.write("[")
+            separator = "\n"
+            for row in rows:
+                f.write(separator + pad + json.dumps(row, indent=indent).replace("\n", "\n" + pad))
+                separator = ",\n"
+            f.write("]" if separator == "\n" else "\n]")
+
+
+def write_json_sections_atomic(
+    path: Path,
+    data: Dict[str, Any],
+    sections: Dict[str, Iterable[Tuple[str, Any]]],
+    indent: int = 2
+) -> None:
+    """
+    Write a JSON object via a temp file and rename: the members of data,
+    then each section as a nested object built from (key, value) pairs as
+    they are iterated, so large sections never have to be in memory.
+    """
+    pad = " " * indent
+
+    def encode(value: Any, depth: int) -> str:
+        return json.dumps(value, indent=indent).replace("\n", "\n" + pad * depth)
+
+    with atomic_path(path) as tmp:
+        with open(tmp, "w") as f:
+            f.write("{")
+            separator = "\n"
+            for key, value in data.items():
+                f.write(f"{separator}{pad}{json.dumps(key)}: {encode(value, 1)}")
+                separator = ",\n"
+            for name, items in sections.items():
+                f.write(f"{separator}{pad}{json.dumps(name)}: {{")
+                separator = ",\n"
+                item_separator = "\n"
+                for key, value in items:
+                    f.write(f"{item_separator}{pad * 2}{json.dumps(key)}: {encode(value, 2)}")
+                    item_separator = ",\n"
+                f.write("}" if item_separator == "\n" else f"\n{pad}}}")
+            f.write("}" if separator == "\n" else "\n}")
+
+
+class OutputWriter:
+    """
+    Bounded background pool for output writes.
+
+    Each job is tied to a target (a ConversationOutput). Errors are collected
+    when the writer is drained (or the job is collected) and recorded on that
+    target, marking it failed at the stage the job was submitted for. Jobs
+    that succeed are forgotten as soon as they finish, so the writer doesn't
+    keep their targets alive until the end of the batch.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = OUTPUT_WRITER_WORKERS,
+        max_pending: int = OUTPUT_WRITER_QUEUE_SIZE,
+        name: str = "output-writer"
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            max_workers: Number of writer threads
+            max_pending: Max queued + running jobs; submit() blocks beyond this
+            name: Thread name prefix
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=name
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending: Dict[Future, Tuple[Any, str]] = {}  # Unfinished or failed jobs
+        self._lock = threading.Lock()
+
+    def submit(self, target: Any, stage: str, fn: Callable, *args: Any) -> Future:
+        """Queue fn(*args) for target, blocking if the queue is full."""
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+
+        with self._lock:
+            self._pending[future] = (target, stage)
+        future.add_done_callback(self._forget_success)
+        return future
+
+    def _forget_success(self, future: Future) -> None:
+        """Drop a finished job unless it failed (failures wait for drain or collect)."""
+        if not future.cancelled() and future.exception() is None:
+            with self._lock:
+                self._pending.pop(future, None)
+
+    def collect(self, future: Future) -> bool:
+        """
+        Settle one finished job now rather than at drain(): record its
+        failure on its target and stop tracking it.
+        Returns whether the job failed.
+        """
+        with self._lock:
+            entry = self._pending.pop(future, None)
+        if entry is None:
+            return False  # Succeeded, or already collected
+        return self._settle(future, *entry)
+
+    def _settle(self, future: Future, target: Any, stage: str) -> bool:
+        """Wait for a job; on failure record it on the target. Returns whether it failed."""
+        try:
+            future.result()
+        except Exception as e:
+            target.success = False
+            target.stage = stage
+            target.error = str(e)
+            logger.error(f"Failed {target.conversation_id} at {stage}: {e}")
+            return True
+        return False
+
+    def drain(self) -> int:
+        """
+        Wait for all queued jobs and record failures on their targets.
+        Returns the number of failed jobs.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        return sum(self._settle(future, *entry) for future, entry in pending.items())
+
+    def close(self) -> None:
+        """Drain outstanding jobs and stop the worker threads."""
+        self.drain()
+        self._executor.shutdown(wait=True)
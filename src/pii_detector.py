@@ -14,9 +14,10 @@ from .lexicon import (
 )
 from .config import (
     FUZZY_MAX_DISTANCE, FUZZY_MIN_CONFIDENCE,
-    PIIMatch, WordTimestamp
+    PIIMatch
 )
 from .transcriber import TranscriptionResult
+from .word_table import WordTable
 
 logger = logging.getLogger(__name__)
 
@@ -143,21 +144,35 @@ class PIIDetector:
             if term.lower() not in self.term_to_category:
                 self.term_to_category[term.lower()] = category
 
+        # Compiled once and shared by every text scan (verification runs one
+        # per conversation, and the lexicon is bigger than re's pattern cache)
+        self.text_patterns: List[Tuple[str, str, "re.Pattern"]] = [
+            (term.lower(), category, re.compile(r'\b' + re.escape(term.lower()) + r'\b'))
+            for term, category in self.sorted_terms
+        ]
+        # Any term at all - a cheap first pass before the per-term scan
+        self.any_term_pattern = re.compile(
+            r'\b(?:' + "|".join(re.escape(t) for t, _, _ in self.text_patterns) + r')\b'
+        )
+
     def detect(self, transcript: TranscriptionResult) -> List[PIIMatch]:
         """Detect all PII in a transcript. Returns list of PIIMatch objects."""
         all_words = transcript.get_all_words()
         if not all_words:
             return []
 
+        # Normalize each distinct token once, not every occurrence
+        normalized = all_words.map_tokens(normalize_word)
+
         matches: List[PIIMatch] = []
         matched_indices: Set[int] = set()
 
         # Layer 1: Exact matching (longest-first)
-        exact_matches = self._exact_match(all_words, matched_indices)
+        exact_matches = self._exact_match(all_words, normalized, matched_indices)
         matches.extend(exact_matches)
 
         # Layer 2: Fuzzy matching for unmatched words
-        fuzzy_matches = self._fuzzy_match(all_words, matched_indices)
+        fuzzy_matches = self._fuzzy_match(all_words, normalized, matched_indices)
         matches.extend(fuzzy_matches)
 
         # Sort by start time
@@ -172,12 +187,14 @@ class PIIDetector:
 
     def _exact_match(
         self,
-        words: List[WordTimestamp],
+        words: WordTable,
+        normalized: List[str],
         matched_indices: Set[int]
     ) -> List[PIIMatch]:
         """Layer 1: Exact matching, longest phrases first. Cities before colors."""
         matches: List[PIIMatch] = []
         n_words = len(words)
+        full_text: Optional[str] = None
 
         # Try to match phrases of decreasing length
         # Max phrase length we'll try (most multi-word cities are 3 words)
@@ -197,9 +214,7 @@ class PIIDetector:
                     break
 
                 # Build normalized phrase from words
-                word_slice = words[i:i + phrase_len]
-                phrase_words = [normalize_word(w.word) for w in word_slice]
-                phrase = " ".join(phrase_words)
+                phrase = " ".join(normalized[i:i + phrase_len])
 
                 # Check if this phrase is in our lexicon
                 for term, category in self.sorted_terms:
@@ -213,20 +228,21 @@ class PIIDetector:
                         # Special handling for "may"
                         if term_lower == "may":
                             # Get full text context
-                            full_text = " ".join(w.word for w in words)
-                            word_pos = sum(len(w.word) + 1 for w in words[:i])
+                            if full_text is None:
+                                full_text = " ".join(words.words())
+                            word_pos = sum(len(w) + 1 for w in words.words(0, i))
                             if not is_may_month(full_text, word_pos, word_pos + 3):
                                 continue
 
                         # Found exact match
-                        indices = list(range(i, i + phrase_len))
+                        indices = range(i, i + phrase_len)
                         matched_indices.update(indices)
 
                         match = PIIMatch(
-                            text=" ".join(w.word for w in word_slice),
+                            text=" ".join(words.words(i, i + phrase_len)),
                             category=category,
-                            start_time=word_slice[0].start,
-                            end_time=word_slice[-1].end,
+                            start_time=float(words.starts[i]),
+                            end_time=float(words.ends[i + phrase_len - 1]),
                             confidence=1.0,
                             word_indices=indices,
                             is_fuzzy=False
@@ -242,7 +258,8 @@ class PIIDetector:
 
     def _fuzzy_match(
         self,
-        words: List[WordTimestamp],
+        words: WordTable,
+        normalized: List[str],
         matched_indices: Set[int]
     ) -> List[PIIMatch]:
         """
@@ -273,12 +290,14 @@ class PIIDetector:
             "salon", "gallon", "talon",  # Not "salmon"
         }
 
-        for i, word_ts in enumerate(words):
+        # Fuzzy matches depend only on the normalized word, so each distinct
+        # word is compared against the lexicon once
+        best_by_word: Dict[str, Optional[Tuple[str, str, int]]] = {}
+
+        for i, word in enumerate(normalized):
             if i in matched_indices:
                 continue
 
-            word = normalize_word(word_ts.word)
-
             # Skip words in blacklist
             if word in FUZZY_BLACKLIST:
                 continue
@@ -290,36 +309,40 @@ class PIIDetector:
 
             # Find best fuzzy match
             best_match: Optional[Tuple[str, str, int]] = None  # (term, category, distance)
+            if word in best_by_word:
+                best_match = best_by_word[word]
+            else:
+                for term, category in self.sorted_terms:
+                    term_lower = term.lower()
 
-            for term, category in self.sorted_terms:
-                term_lower = term.lower()
+                    # Only fuzzy match single words
+                    if " " in term_lower:
+                        continue
 
-                # Only fuzzy match single words
-                if " " in term_lower:
-                    continue
+                    # Target term must also be long enough
+                    if len(term_lower) < 5:
+                        continue
 
-                # Target term must also be long enough
-                if len(term_lower) < 5:
-                    continue
+                    distance = levenshtein_distance(word, term_lower)
 
-                distance = levenshtein_distance(word, term_lower)
+                    if distance == 0:
+                        # This should have been caught by exact match
+                        continue
 
-                if distance == 0:
-                    # This should have been caught by exact match
-                    continue
+                    # For distance=2, require longer words (≥7 chars)
+                    if distance == 2 and len(word) < 7:
+                        continue
 
-                # For distance=2, require longer words (≥7 chars)
-                if distance == 2 and len(word) < 7:
-                    continue
+                    if distance <= FUZZY_MAX_DISTANCE:
+                        # Check relative distance (don't match if too much of word is different)
+                        relative_distance = distance / max(len(word), len(term_lower))
+                        if relative_distance > 0.25:  # Stricter threshold
+                            continue
 
-                if distance <= FUZZY_MAX_DISTANCE:
-                    # Check relative distance (don't match if too much of word is different)
-                    relative_distance = distance / max(len(word), len(term_lower))
-                    if relative_distance > 0.25:  # Stricter threshold
-                        continue
+                        if best_match is None or distance < best_match[2]:
+                            best_match = (term_lower, category, distance)
 
-                    if best_match is None or distance < best_match[2]:
-                        best_match = (term_lower, category, distance)
+                best_by_word[word] = best_match
 
             if best_match:
                 term, category, distance = best_match
@@ -328,11 +351,12 @@ class PIIDetector:
                 if confidence >= FUZZY_MIN_CONFIDENCE:
                     # Special handling for "may" fuzzy matches
                     if term == "may":
-                        full_text = " ".join(w.word for w in words)
-                        word_pos = sum(len(w.word) + 1 for w in words[:i])
+                        full_text = " ".join(words.words())
+                        word_pos = sum(len(w) + 1 for w in words.words(0, i))
                         if not is_may_month(full_text, word_pos, word_pos + len(word)):
                             continue
 
+                    word_ts = words[i]
                     matched_indices.add(i)
                     match = PIIMatch(
                         text=word_ts.word,
@@ -340,7 +364,7 @@ class PIIDetector:
                         start_time=word_ts.start,
                         end_time=word_ts.end,
                         confidence=confidence,
-                        word_indices=[i],
+                        word_indices=range(i, i + 1),
                         is_fuzzy=True
                     )
                     matches.append(match)
@@ -352,24 +376,32 @@ class PIIDetector:
 
         return matches
 
-    def detect_in_text(self, text: str) -> List[Dict]:
-        """Detect PII in plain text (used for verification)."""
+    def detect_in_text(self, text: str, begin: int = 0, stop: Optional[int] = None) -> List[Dict]:
+        """
+        Detect PII in plain text (used for verification).
+
+        Args:
+            text: Text to scan
+            begin: Scan only from this character offset...
+            stop: ...up to this one (None = end of text). Match offsets are
+                always relative to the whole text, which is also the context
+                for the "may" check.
+        """
         matches = []
         text_lower = text.lower()
+        if stop is None:
+            stop = len(text)
 
         # Track matched character positions
         matched_positions: Set[int] = set()
 
         # Match phrases (longest first)
-        for term, category in self.sorted_terms:
-            term_lower = term.lower()
-
+        for term_lower, category, pattern in self.text_patterns:
             # Find all occurrences
-            start = 0
+            start = begin
             while True:
                 # Use word boundary matching
-                pattern = r'\b' + re.escape(term_lower) + r'\b'
-                match = re.search(pattern, text_lower[start:], re.IGNORECASE)
+                match = pattern.search(text_lower[start:stop])
 
                 if not match:
                     break
@@ -405,6 +437,19 @@ class PIIDetector:
         matches.sort(key=lambda m: m["start"])
         return matches
 
+    def detect_in_spans(self, text: str, spans: List[Tuple[int, int]]) -> List[Dict]:
+        """
+        Detect PII in the given (start, end) character spans of text.
+        Each span gets one pass of the combined term pattern; only spans with a
+        candidate hit get the full longest-first scan.
+        """
+        text_lower = text.lower()
+        matches = []
+        for begin, stop in spans:
+            if self.any_term_pattern.search(text_lower[begin:stop]):
+                matches.extend(self.detect_in_text(text, begin, stop))
+        return matches
+
 
 def detect_pii(transcript: TranscriptionResult) -> List[PIIMatch]:
     """Convenience function to detect PII in a transcript."""
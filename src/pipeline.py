@@ -8,11 +8,14 @@ Main pipeline that runs all the steps:
 
 Each file is processed independently so one failure doesn't stop the batch.
 """
-import json
+import heapq
+import itertools
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Iterable, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -20,16 +23,65 @@ from .config import (
     ProcessingResult,
     OUTPUT_DIR,
     WHISPER_MODEL,
-    OUTPUT_AUDIO_FORMAT
+    OUTPUT_PROFILES,
+    DEFAULT_OUTPUT_PROFILE,
+    ASYNC_OUTPUT_WRITES,
+    MULTICHANNEL_REDACTION,
+    CHANNEL_WORKERS,
+    TRANSCRIPT_COMPRESSION,
+    EXPORT_WORD_TABLES,
+    SPECTRAL_PRECHECK,
+    VERIFY_AUDIT_RATE,
+    ASYNC_VERIFICATION,
+    VERIFY_WORKERS,
+    VERIFY_QUEUE_SIZE,
+    MANIFEST_UPDATE_INTERVAL_S,
+    STAGED_EXECUTION,
+    STAGE_WORKERS,
+    STAGE_QUEUE_SIZE,
+    JOURNAL_FILE,
+    JOURNAL_RESUME,
+    STREAMING_BATCH,
+    SCHEDULE_LONGEST_FIRST
+)
+from .transcriber import (
+    Transcriber, TranscriptionResult, merge_channel_transcripts, remove_checkpoints
 )
-from .transcriber import Transcriber, TranscriptionResult
 from .pii_detector import PIIDetector, PIIMatch
-from .text_redactor import TextRedactor, RedactedTranscript
-from .audio_redactor import AudioRedactor, BleepRegion
-from .verifier import Verifier, VerificationResult, VerificationStatus
+from .text_redactor import TextRedactor, RedactedTranscript, merge_redacted_transcripts
+from .audio_input import probe_audio
+from .audio_redactor import AudioRedactor, BleepRegion, ZERO_PII_MODES
+from .verifier import Verifier, VerificationResult
+from .bleep_check import SpectralChecker
+from .verify_policy import PolicyDecision, VerificationPolicy, load_previous_statuses
+from .output_writer import OutputWriter, atomic_path, write_json_atomic, write_json_rows_atomic
+from .serialization import (
+    check_compression,
+    find_transcript,
+    read_json,
+    remove_stale_variants,
+    write_transcript
+)
+from .export import WordExporter
+from .staged_executor import Stage, StagedExecutor
+from .journal import (
+    CHECKPOINTS,
+    RESUME_DONE,
+    ConversationState,
+    Journal,
+    source_fingerprint,
+    stage_outputs
+)
+from .timing import timed
+from .sharding import Shard, select_shard, shard_label, shard_name
+from .scheduling import ProgressEstimator, format_duration, longest_first, probe_durations
+from .report import ReportAccumulator, RowSpool
 
 logger = logging.getLogger(__name__)
 
+# Manifest qa_status of a conversation whose verification hasn't finished
+PENDING_VERIFICATION = "PENDING_VERIFICATION"
+
 
 @dataclass
 class ConversationOutput:
@@ -43,8 +95,88 @@ class ConversationOutput:
     pii_matches: List[PIIMatch] = field(default_factory=list)
     bleep_regions: List[BleepRegion] = field(default_factory=list)
     redacted_audio_path: Optional[str] = None
+    audio_mode: Optional[str] = None
     verification: Optional[VerificationResult] = None
+    policy: Optional[PolicyDecision] = None
     processing_time_s: float = 0.0
+    ready_at: Optional[float] = None     # When steps 1-4 finished (time.time())
+    verified_at: Optional[float] = None  # When verification finished
+    raw_transcript_path: Optional[str] = None  # Set once the raw transcript is on disk
+    resumed_from: Optional[str] = None   # Journal checkpoint resumed at (RESUME_DONE = skipped)
+    manifest_row: Optional[Dict[str, Any]] = None  # Journaled row of an earlier run's result
+    timings: Dict[str, float] = field(default_factory=dict)  # Seconds per stage (perf_counter)
+    io_bytes: Dict[str, int] = field(default_factory=dict)   # Bytes read + written per stage
+
+    @property
+    def verification_lag_s(self) -> Optional[float]:
+        """Time between the main stages finishing and verification finishing."""
+        if self.ready_at is None or self.verified_at is None:
+            return None
+        return self.verified_at - self.ready_at
+
+    @property
+    def pii_count(self) -> int:
+        """PII instances redacted (from the journal if completed in an earlier run)."""
+        if self.manifest_row is not None:
+            return self.manifest_row["pii_count"]
+        return len(self.pii_matches)
+
+    @property
+    def audio_duration(self) -> float:
+        """Audio duration in seconds (from the journal if completed in an earlier run)."""
+        if self.manifest_row is not None:
+            return self.manifest_row["duration_sec"]
+        return self.transcript_raw.audio_duration if self.transcript_raw else 0
+
+
+@dataclass
+class ConversationSummary:
+    """
+    What a streaming batch keeps of a conversation once its outputs are
+    written: everything else (transcripts, matches, bleep regions) is released.
+    """
+    conversation_id: str
+    success: bool
+    error: Optional[str] = None
+    stage: Optional[str] = None
+    pii_count: int = 0
+    qa_status: Optional[str] = None
+    redacted_audio_path: Optional[str] = None
+    processing_time_s: float = 0.0
+
+    @classmethod
+    def from_output(cls, output: ConversationOutput) -> "ConversationSummary":
+        return cls(
+            conversation_id=output.conversation_id,
+            success=output.success,
+            error=output.error,
+            stage=output.stage,
+            pii_count=output.pii_count if output.success else 0,
+            qa_status=output.verification.overall_status.value if output.verification else None,
+            redacted_audio_path=output.redacted_audio_path,
+            processing_time_s=output.processing_time_s
+        )
+
+
+@dataclass
+class _Job:
+    """A conversation moving through the pipeline's stages."""
+    audio_path: Path
+    output: ConversationOutput
+    inline_audio: bool = False  # Encode audio in the stage itself, not on the writer
+    channels: int = 1
+    needs_audio: bool = False   # Verification has to wait for the audio write
+    audio_future: Optional[Future] = None
+    failed: bool = False
+    resume_from: str = CHECKPOINTS[0]  # First journal checkpoint to redo
+    skip: bool = False                 # Completed in an earlier run
+    index: int = 0                     # Position in the batch
+    futures: List[Tuple[OutputWriter, Future]] = field(default_factory=list)  # Background jobs
+
+
+def _label(conversation_id: str, channel: Optional[int]) -> str:
+    """Conversation (and channel) for log messages."""
+    return conversation_id if channel is None else f"{conversation_id} channel {channel}"
 
 
 class Pipeline:
@@ -64,7 +196,21 @@ class Pipeline:
         output_dir: Optional[str] = None,
         whisper_model: str = WHISPER_MODEL,
         verify_audio: bool = True,
-        save_outputs: bool = True
+        save_outputs: bool = True,
+        async_writes: bool = ASYNC_OUTPUT_WRITES,
+        output_profile: str = DEFAULT_OUTPUT_PROFILE,
+        multichannel: bool = MULTICHANNEL_REDACTION,
+        transcript_compression: Optional[str] = TRANSCRIPT_COMPRESSION,
+        export_words: bool = EXPORT_WORD_TABLES,
+        spectral_precheck: bool = SPECTRAL_PRECHECK,
+        audit_rate: Optional[float] = VERIFY_AUDIT_RATE,
+        async_verification: bool = ASYNC_VERIFICATION,
+        staged: bool = STAGED_EXECUTION,
+        stage_workers: Optional[Dict[str, int]] = None,
+        resume: bool = JOURNAL_RESUME,
+        streaming: bool = STREAMING_BATCH,
+        shard: Optional[Shard] = None,
+        longest_first: bool = SCHEDULE_LONGEST_FIRST
     ):
         """
         Initialize the pipeline.
@@ -74,23 +220,133 @@ class Pipeline:
             whisper_model: Whisper model size
             verify_audio: Whether to re-transcribe and verify audio
             save_outputs: Whether to save files to disk
+            async_writes: Encode audio and write JSON on a background pool
+            output_profile: Name of the audio encoding profile (see OUTPUT_PROFILES)
+            multichannel: Transcribe and redact each channel separately (in
+                parallel) and keep the source channel layout
+            transcript_compression: Compress transcript JSON (None, "gzip" or "zstd")
+            export_words: Write word-level Parquet/npz tables under exports/
+            spectral_precheck: Check bleep regions with an FFT before audio
+                re-ASR, and skip re-ASR when they pass and all matches are exact
+            audit_rate: Re-ASR only high-risk files plus this share of the
+                rest (None = every file)
+            async_verification: Verify on a background pool so the next file
+                can start while this one is re-transcribed
+            staged: Run batches on the stage-pipelined executor, so different
+                files occupy different stages at the same time
+            stage_workers: Threads per stage (see STAGE_WORKERS); only with staged
+            resume: Skip conversations the journal shows complete and resume
+                failed ones after their last good checkpoint (the journal is
+                written either way when saving outputs)
+            streaming: Release each conversation once its outputs are written,
+                building the report and manifest incrementally; process_batch
+                then returns ConversationSummary objects
+            shard: (i, N) to process only the conversations hashing to shard
+                i of N, writing shard-suffixed manifest, report, journal and
+                exports (see sharding.py)
+            longest_first: Process a batch's longest files first (durations
+                read from the file headers); results stay in input order
         """
+        check_compression(transcript_compression)
+
         self.output_dir = Path(output_dir) if output_dir else OUTPUT_DIR
         self.whisper_model = whisper_model
         self.verify_audio = verify_audio
         self.save_outputs = save_outputs
+        self.writer = OutputWriter() if (async_writes and save_outputs) else None
+        self.verification_pool = OutputWriter(
+            max_workers=VERIFY_WORKERS,
+            max_pending=VERIFY_QUEUE_SIZE,
+            name="verifier"
+        ) if async_verification else None
+        self.output_profile = OUTPUT_PROFILES[output_profile]
+        self.multichannel = multichannel
+        self.transcript_compression = transcript_compression
+        self.export_words = export_words
+        self.staged = staged
+        self.stage_workers = {**STAGE_WORKERS, **(stage_workers or {})}
+        unknown = set(self.stage_workers) - set(STAGE_WORKERS)
+        if unknown:
+            raise ValueError(f"Unknown stages: {sorted(unknown)} (use {list(STAGE_WORKERS)})")
+        self.stage_metrics: Optional[Dict[str, Dict[str, Any]]] = None
+        self.batch_wall_s: Optional[float] = None
+        self.streaming = streaming
+        if shard is not None and not 0 <= shard[0] < shard[1]:
+            raise ValueError(f"Invalid shard {shard} (need 0 <= i < N)")
+        self.shard = shard
+        self.longest_first = longest_first
+        self.progress: Optional[ProgressEstimator] = None
+        self._durations: List[float] = []  # Header durations of the batch's files
 
         # Initialize components
-        self.transcriber = Transcriber(model_size=whisper_model)
+        self.transcriber = Transcriber(
+            model_size=whisper_model,
+            checkpoint_dir=str(self.output_dir / "checkpoints") if save_outputs else None,
+            # One model worker per channel thread, so channels really run in parallel
+            num_workers=CHANNEL_WORKERS if multichannel else 1
+        )
         self.detector = PIIDetector()
         self.text_redactor = TextRedactor()
-        self.audio_redactor = AudioRedactor()
-        self.verifier = Verifier()
+        self.audio_redactor = AudioRedactor(
+            profile=self.output_profile,
+            per_channel=multichannel
+        )
+        self.verifier = Verifier(
+            detector=self.detector,
+            spectral_checker=SpectralChecker(
+                frequency=self.audio_redactor.bleep_freq,
+                amplitude=self.audio_redactor.bleep_amp
+            ) if spectral_precheck else None
+        )
+        previous_statuses = None
+        if save_outputs:
+            previous_statuses = load_previous_statuses(
+                self.output_dir / "metadata" / "manifest.json"
+            )
+            if shard is not None:
+                # This shard's latest run wins over the last merge
+                previous_statuses.update(
+                    load_previous_statuses(self._batch_file("metadata", "manifest.json"))
+                )
+        self.policy = VerificationPolicy(audit_rate, previous_statuses=previous_statuses)
+
+        # Progress journal, for rerunning interrupted or failed batches
+        self.journal = Journal(
+            self._batch_file("checkpoints", JOURNAL_FILE)
+        ) if save_outputs else None
+        self.resume = resume
+        self._journal_states: Dict[str, ConversationState] = {}
+
+        # Batch in progress, for manifest updates from verification threads
+        self._batch_results: List[ConversationOutput] = []
+        self._earlier_results: List[ConversationOutput] = []  # Journaled, not in this batch
+        self._earlier_count = 0
+        self._manifest_lock = threading.Lock()
+        self._manifest_written_at = 0.0
+
+        # Streaming batch state: conversations whose background jobs are still
+        # running, and the accumulators finished ones are folded into
+        self._in_flight: Dict[int, _Job] = {}
+        self._summaries: List[Optional[ConversationSummary]] = []
+        self._report: Optional[ReportAccumulator] = None
+        self._manifest_spool: Optional[RowSpool] = None
+        self._exporter: Optional[WordExporter] = None
+        self._finalize_lock = threading.Lock()
 
         # Create output directories
         if save_outputs:
             self._create_output_dirs()
 
+    def _batch_file(self, subdir: str, name: str) -> Path:
+        """Path of a batch-level output file, suffixed with the shard if there is one."""
+        return self.output_dir / subdir / shard_name(name, self.shard)
+
+    @property
+    def _exports_dir(self) -> Path:
+        """Word export directory (one per shard, since exports replace their shard files)."""
+        exports = self.output_dir / "exports"
+        return exports / shard_label(self.shard) if self.shard is not None else exports
+
     def _create_output_dirs(self):
         """Create output directory structure."""
         dirs = [
@@ -98,7 +354,8 @@ class Pipeline:
             self.output_dir / "transcripts_raw" / "train",
             self.output_dir / "transcripts_deid" / "train",
             self.output_dir / "metadata",
-            self.output_dir / "qa"
+            self.output_dir / "qa",
+            self.output_dir / "checkpoints"
         ]
         for d in dirs:
             d.mkdir(parents=True, exist_ok=True)
@@ -113,238 +370,879 @@ class Pipeline:
         Returns:
             ConversationOutput with all results
         """
-        start_time = time.time()
+        return self._run_job(self._new_job(audio_path)).output
+
+    def _run_job(self, job: _Job) -> _Job:
+        """Run every stage of a job in this thread."""
+        for _, fn in self._stage_functions():
+            self._run_stage(job, fn)
+        return job
+
+    def _new_job(self, audio_path: str, inline_audio: bool = False) -> _Job:
+        """Start a conversation; its output is filled in stage by stage."""
         audio_path = Path(audio_path)
-        conversation_id = audio_path.stem
+        job = _Job(
+            audio_path=audio_path,
+            output=ConversationOutput(conversation_id=audio_path.stem, success=False),
+            inline_audio=inline_audio
+        )
+        if self.journal is not None:
+            self._resume(job)
+        if not job.skip:
+            logger.info(f"Processing conversation: {audio_path.stem}")
+        return job
 
-        logger.info(f"Processing conversation: {conversation_id}")
+    def _resume(self, job: _Job):
+        """Pick the job up where the journal says an earlier run left it."""
+        conversation_id = job.output.conversation_id
+        source = source_fingerprint(job.audio_path)
+        state = self._journal_states.get(conversation_id)
+        if state is not None:
+            job.resume_from = state.resume_point(
+                source, self._output_settings, self._verify_settings, self.output_dir
+            )
+            if state.changed(source, self._output_settings):
+                # Restarting from scratch: segments checkpointed from the old
+                # source or settings mustn't be resumed from either
+                remove_checkpoints(self.output_dir / "checkpoints", conversation_id)
+
+        if job.resume_from == RESUME_DONE:
+            job.skip = True
+            job.output = self._restored_output(state)
+            logger.info(f"Skipping {conversation_id}: completed in an earlier run")
+            return
+
+        if job.resume_from != CHECKPOINTS[0]:
+            job.output.resumed_from = job.resume_from
+            logger.info(f"Resuming {conversation_id} at {job.resume_from}")
+        self.journal.record(
+            conversation_id, "start",
+            source=source, settings=self._output_settings, resume_from=job.resume_from
+        )
+
+    def _restored_output(self, state: ConversationState) -> ConversationOutput:
+        """Output of a conversation from its journal state (no transcripts in memory)."""
+        if not state.complete:
+            failure = state.failure or {}
+            return ConversationOutput(
+                conversation_id=state.conversation_id,
+                success=False,
+                error=failure.get("error"),
+                stage=failure.get("stage")
+            )
 
-        output = ConversationOutput(
-            conversation_id=conversation_id,
-            success=False
+        verify = state.stages["verify"]
+        row = verify["row"]
+        audio = stage_outputs(state, "redact_audio")
+        return ConversationOutput(
+            conversation_id=state.conversation_id,
+            success=True,
+            redacted_audio_path=str(self.output_dir / audio[0]) if audio else None,
+            audio_mode=row["audio_mode"],
+            verification=VerificationResult.from_dict(verify["verification"]),
+            policy=(
+                PolicyDecision.from_dict(row["verification_policy"])
+                if row["verification_policy"] else None
+            ),
+            processing_time_s=verify.get("processing_time_s", 0.0),
+            resumed_from=RESUME_DONE,
+            manifest_row=row
         )
 
+    @property
+    def _output_settings(self) -> Dict[str, Any]:
+        """Settings that shape the outputs; changing any of them reprocesses everything."""
+        return {
+            "output_profile": self.output_profile.name,
+            "transcript_compression": self.transcript_compression,
+            "multichannel": self.multichannel,
+        }
+
+    @property
+    def _verify_settings(self) -> Dict[str, Any]:
+        """Settings that shape verification; changing any of them re-verifies."""
+        return {
+            "verify_audio": self.verify_audio,
+            "spectral_precheck": self.verifier.spectral_checker is not None,
+            "audit_rate": self.policy.audit_rate,
+        }
+
+    def _journal_stage(self, output: ConversationOutput, checkpoint: str, paths=(), **data):
+        """Record a completed checkpoint in the journal, if there is one."""
+        if self.journal is not None:
+            self.journal.record_stage(
+                output.conversation_id, checkpoint, self.output_dir, paths, **data
+            )
+
+    def _stage_functions(self) -> List[Tuple[str, Callable[[_Job], None]]]:
+        """The pipeline's stages in order, as (name, function)."""
+        return [
+            ("transcribe", self._stage_transcribe),
+            ("redact_text", self._stage_redact_text),
+            ("redact_audio", self._stage_redact_audio),
+            ("finish", self._stage_finish),
+        ]
+
+    def _run_stage(self, job: _Job, fn: Callable[[_Job], None]):
+        """
+        Run one stage of a conversation, unless an earlier one failed.
+        Failures are recorded on the output at the stage they happened.
+        """
+        if job.failed or job.skip:
+            return
+        output = job.output
+        started = time.perf_counter()
         try:
-            # Step 1: Transcription
-            logger.info(f"[1/5] Transcribing {conversation_id}...")
+            fn(job)
+
+        except FileNotFoundError as e:
+            job.failed = True
+            output.error = f"File not found: {e}"
+            logger.error(f"Failed {output.conversation_id} at {output.stage}: {output.error}")
+
+        except Exception as e:
+            job.failed = True
+            output.error = str(e)
+            logger.error(f"Failed {output.conversation_id} at {output.stage}: {output.error}")
+
+        finally:
+            output.processing_time_s += time.perf_counter() - started
+
+    def _stage_transcribe(self, job: _Job):
+        """Step 1 (steps 1-3 per channel for multi-channel files)."""
+        output = job.output
+        job.channels = self._channel_count(job.audio_path)
+        if job.resume_from != "transcribe":
+            # Transcribed in an earlier run (single-channel files only)
             output.stage = "transcription"
-            transcript = self.transcriber.transcribe(str(audio_path))
-            output.transcript_raw = transcript
+            with timed(output.timings, "resume_load"):
+                output.transcript_raw, path = self._load_raw_transcript(output.conversation_id)
+            output.raw_transcript_path = str(path)
+        elif job.channels > 1:
+            # Steps 1-3 per channel, channels in parallel
+            logger.info(
+                f"[1-3/5] Processing {job.channels} channels of {output.conversation_id}..."
+            )
+            output.stage = "channel_processing"
+            with timed(output.timings, "channel_processing"):
+                (
+                    output.transcript_raw,
+                    output.pii_matches,
+                    output.transcript_redacted
+                ) = self._process_channels(job.audio_path, job.channels)
+            logger.info(f"Found {len(output.pii_matches)} PII instances")
+        else:
+            self._transcribe(output, job.audio_path)
+            if self.journal is not None:
+                # Write the raw transcript now, so a rerun can skip transcription
+                path = self._write_transcript("transcripts_raw", output.transcript_raw)
+                output.raw_transcript_path = str(path)
+                self._journal_stage(output, "transcribe", [path])
 
-            # Step 2: PII Detection
-            logger.info(f"[2/5] Detecting PII in {conversation_id}...")
-            output.stage = "detection"
-            pii_matches = self.detector.detect(transcript)
-            output.pii_matches = pii_matches
+    def _stage_redact_text(self, job: _Job):
+        """Steps 2-3 (already done per channel for multi-channel files)."""
+        if job.channels == 1:
+            self._detect_and_redact(job.output, job.output.transcript_raw)
 
-            logger.info(f"Found {len(pii_matches)} PII instances")
+    def _stage_redact_audio(self, job: _Job):
+        """Step 4: audio redaction, on the background writer unless inline_audio."""
+        output = job.output
+        conversation_id = output.conversation_id
+        pii_matches = output.pii_matches
 
-            # Step 3: Text Redaction
-            logger.info(f"[3/5] Redacting transcript for {conversation_id}...")
-            output.stage = "text_redaction"
-            redacted_transcript = self.text_redactor.redact(transcript, pii_matches)
-            output.transcript_redacted = redacted_transcript
+        logger.info(f"[4/5] Redacting audio for {conversation_id}...")
+        output.stage = "audio_redaction"
 
-            # Step 4: Audio Redaction
-            logger.info(f"[4/5] Redacting audio for {conversation_id}...")
-            output.stage = "audio_redaction"
+        if self.save_outputs:
+            audio_output_path = (
+                self.output_dir / "audio" / "train" /
+                f"{conversation_id}.{self.output_profile.extension}"
+            )
+        else:
+            audio_output_path = None
 
-            if self.save_outputs:
-                audio_output_path = (
-                    self.output_dir / "audio" / "train" /
-                    f"{conversation_id}.{OUTPUT_AUDIO_FORMAT}"
-                )
-            else:
-                audio_output_path = None
+        output.audio_mode = self.audio_redactor.choose_mode(str(job.audio_path), pii_matches)
 
-            redacted_audio_path, bleep_regions = self.audio_redactor.redact(
-                str(audio_path),
-                pii_matches,
-                str(audio_output_path) if audio_output_path else None
+        if job.resume_from == "verify":
+            # The redacted audio from an earlier run is intact; only its regions are needed
+            output.redacted_audio_path = str(audio_output_path)
+            output.bleep_regions = self.audio_redactor.bleep_regions_for(
+                str(job.audio_path), pii_matches, output.audio_mode
             )
-            output.redacted_audio_path = redacted_audio_path
-            output.bleep_regions = bleep_regions
-
-            # Step 5: Verification
-            logger.info(f"[5/5] Verifying redaction for {conversation_id}...")
-            output.stage = "verification"
-            verification = self.verifier.verify(
-                redacted_transcript,
-                redacted_audio_path if self.verify_audio else None,
-                verify_audio=self.verify_audio
+            output.ready_at = time.time()
+            return
+
+        # Audio verification reads the output, so it has to exist first
+        job.needs_audio = self.verify_audio and output.audio_mode not in ZERO_PII_MODES
+        if self.writer and audio_output_path and not job.inline_audio:
+            output.redacted_audio_path = str(audio_output_path)
+            job.audio_future = self.writer.submit(
+                output, "audio_redaction",
+                self._write_audio, output, job.audio_path, pii_matches, audio_output_path
             )
-            output.verification = verification
+            job.futures.append((self.writer, job.audio_future))
+            if job.needs_audio and self.verification_pool is None:
+                job.audio_future.result()
+        else:
+            self._write_audio(output, job.audio_path, pii_matches, audio_output_path)
+        output.ready_at = time.time()
+
+    def _stage_finish(self, job: _Job):
+        """Step 5 (verification), saving outputs, and marking success."""
+        output = job.output
+        conversation_id = output.conversation_id
 
-            # Save outputs if requested
-            if self.save_outputs:
+        # Step 5: Verification
+        output.stage = "verification"
+        if self.verification_pool:
+            # Runs next to the following files; the manifest shows it as
+            # pending until it finishes
+            logger.info(f"[5/5] Queued verification for {conversation_id}")
+            future = self.verification_pool.submit(
+                output, output.stage, self._verify, output,
+                job.audio_future if job.needs_audio else None
+            )
+            job.futures.append((self.verification_pool, future))
+        else:
+            self._verify(output)
+
+        # Save outputs if requested
+        if self.save_outputs:
+            output.stage = "save_outputs"
+            if self.writer:
+                future = self.writer.submit(output, output.stage, self._save_outputs, output)
+                job.futures.append((self.writer, future))
+            else:
                 self._save_outputs(output)
 
-            # Mark success
-            output.success = True
-            output.stage = None
-            output.error = None
+        # Mark success
+        output.success = True
+        output.stage = None
+        output.error = None
+
+        logger.info(
+            f"Completed {conversation_id}: "
+            f"{len(output.pii_matches)} PII redacted, "
+            f"verification="
+            f"{output.verification.overall_status.value if output.verification else 'pending'}"
+        )
+
+    def _verify(self, output: ConversationOutput, audio_future: Optional[Future] = None):
+        """
+        Step 5: pick the audio verification policy and verify the redaction.
+        On the background pool, audio_future is the pending audio write.
+        """
+        if audio_future is not None:
+            try:
+                audio_future.result()
+            except Exception:
+                return  # The audio write's failure is recorded when the writer drains
+
+        logger.info(f"[5/5] Verifying redaction for {output.conversation_id}...")
+        unchanged = output.audio_mode in ZERO_PII_MODES
+        output.policy = self.policy.decide(
+            output.conversation_id,
+            output.transcript_raw,
+            output.pii_matches,
+            output.bleep_regions,
+            audio_unchanged=unchanged,
+            verify_audio=self.verify_audio
+        )
+        output.verification = self.verifier.verify(
+            output.transcript_redacted,
+            output.redacted_audio_path if self.verify_audio else None,
+            verify_audio=self.verify_audio,
+            audio_unchanged=unchanged,
+            bleep_regions=output.bleep_regions,
+            reasr=output.policy.reasr
+        )
+        output.timings.update(output.verification.timings)
+        if output.verification.audio_method == "reasr":
+            output.io_bytes["reasr"] = Path(output.redacted_audio_path).stat().st_size
+        output.verified_at = time.time()
+        self._journal_stage(
+            output, "verify",
+            settings=self._verify_settings,
+            row=self._manifest_row(output),
+            verification=output.verification.to_dict(),
+            processing_time_s=output.processing_time_s
+        )
 
+        if self.verification_pool is not None:
             logger.info(
-                f"Completed {conversation_id}: "
-                f"{len(pii_matches)} PII redacted, "
-                f"verification={verification.overall_status.value}"
+                f"Verified {output.conversation_id}: "
+                f"{output.verification.overall_status.value} "
+                f"({output.verification_lag_s:.1f}s after redaction)"
             )
+            self._update_manifest()
 
-        except FileNotFoundError as e:
-            output.error = f"File not found: {e}"
-            logger.error(f"Failed {conversation_id} at {output.stage}: {output.error}")
+    def _transcribe_and_redact(
+        self,
+        output: Optional[ConversationOutput],
+        audio_path: Path,
+        channel: Optional[int] = None
+    ) -> Tuple[TranscriptionResult, List[PIIMatch], RedactedTranscript]:
+        """
+        Steps 1-3: transcribe, detect and redact text.
+        With a channel, only that channel is used and matches are tagged with it.
+        Stage and results are recorded on output when one is given.
+        """
+        transcript = self._transcribe(output, audio_path, channel)
+        pii_matches, redacted_transcript = self._detect_and_redact(output, transcript, channel)
+        return transcript, pii_matches, redacted_transcript
 
-        except Exception as e:
-            output.error = str(e)
-            logger.error(f"Failed {conversation_id} at {output.stage}: {output.error}")
+    def _transcribe(
+        self,
+        output: Optional[ConversationOutput],
+        audio_path: Path,
+        channel: Optional[int] = None
+    ) -> TranscriptionResult:
+        """Step 1: transcribe (one channel, if given)."""
+        label = _label(audio_path.stem, channel)
 
-        finally:
-            output.processing_time_s = time.time() - start_time
+        # Step 1: Transcription
+        logger.info(f"[1/5] Transcribing {label}...")
+        if output is not None:
+            output.stage = "transcription"
+        with timed(output.timings if output is not None else None, "transcription"):
+            transcript = self.transcriber.transcribe(str(audio_path), channel=channel)
+        if output is not None:
+            output.transcript_raw = transcript
+            output.io_bytes["transcription"] = audio_path.stat().st_size
+        return transcript
+
+    def _detect_and_redact(
+        self,
+        output: Optional[ConversationOutput],
+        transcript: TranscriptionResult,
+        channel: Optional[int] = None
+    ) -> Tuple[List[PIIMatch], RedactedTranscript]:
+        """Steps 2-3: detect PII and redact the transcript; matches are tagged with channel."""
+        label = _label(transcript.conversation_id, channel)
+        track = output is not None
+        timings = output.timings if track else None
+
+        # Step 2: PII Detection
+        logger.info(f"[2/5] Detecting PII in {label}...")
+        if track:
+            output.stage = "detection"
+        with timed(timings, "detection"):
+            pii_matches = self.detector.detect(transcript)
+        for match in pii_matches:
+            match.channel = channel
+        if track:
+            output.pii_matches = pii_matches
+
+        logger.info(f"Found {len(pii_matches)} PII instances")
+
+        # Step 3: Text Redaction
+        logger.info(f"[3/5] Redacting transcript for {label}...")
+        if track:
+            output.stage = "text_redaction"
+        with timed(timings, "text_redaction"):
+            redacted_transcript = self.text_redactor.redact(transcript, pii_matches)
+        if track:
+            output.transcript_redacted = redacted_transcript
+
+        return pii_matches, redacted_transcript
+
+    def _channel_count(self, audio_path: Path) -> int:
+        """Number of channels to process separately (1 unless multichannel is on)."""
+        if not self.multichannel:
+            return 1
+        return probe_audio(str(audio_path)).channels
+
+    def _process_channels(
+        self,
+        audio_path: Path,
+        channels: int
+    ) -> Tuple[TranscriptionResult, List[PIIMatch], RedactedTranscript]:
+        """Run steps 1-3 on each channel in parallel and merge the results in time order."""
+        with ThreadPoolExecutor(max_workers=min(CHANNEL_WORKERS, channels)) as pool:
+            per_channel = list(pool.map(
+                lambda ch: self._transcribe_and_redact(None, audio_path, channel=ch),
+                range(channels)
+            ))
+
+        transcripts = [t for t, _, _ in per_channel]
+        transcript = merge_channel_transcripts(transcripts)
+        pii_matches = list(heapq.merge(
+            *(m for _, m, _ in per_channel), key=lambda m: m.start_time
+        ))
+        redacted = merge_redacted_transcripts(transcript, [r for _, _, r in per_channel])
+        return transcript, pii_matches, redacted
+
+    def _write_audio(
+        self,
+        output: ConversationOutput,
+        audio_path: Path,
+        pii_matches: List[PIIMatch],
+        audio_output_path: Optional[Path]
+    ):
+        """Redact and encode audio, renaming into place once complete."""
+        with timed(output.timings, "audio_redaction"):
+            if audio_output_path is None:
+                redacted_audio_path, bleep_regions = self.audio_redactor.redact(
+                    str(audio_path), pii_matches, None, mode=output.audio_mode
+                )
+            else:
+                with atomic_path(audio_output_path) as tmp_path:
+                    _, bleep_regions = self.audio_redactor.redact(
+                        str(audio_path), pii_matches, str(tmp_path), mode=output.audio_mode
+                    )
+                redacted_audio_path = str(audio_output_path)
+        output.io_bytes["audio_redaction"] = (
+            Path(audio_path).stat().st_size + Path(redacted_audio_path).stat().st_size
+        )
+        if audio_output_path is not None:
+            # The regions actually bleeped, for the review tool
+            regions_path = (
+                self.output_dir / "qa" / "bleep_regions" / f"{output.conversation_id}.json"
+            )
+            regions_path.parent.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(regions_path, [region.to_dict() for region in bleep_regions])
+            self._journal_stage(output, "redact_audio", [audio_output_path, regions_path])
 
-        return output
+        output.redacted_audio_path = redacted_audio_path
+        output.bleep_regions = bleep_regions
 
     def _save_outputs(self, output: ConversationOutput):
         """Save outputs to disk."""
         conv_id = output.conversation_id
 
-        # Save raw transcript
-        if output.transcript_raw:
-            raw_path = self.output_dir / "transcripts_raw" / "train" / f"{conv_id}.json"
-            with open(raw_path, "w") as f:
-                json.dump(output.transcript_raw.to_dict(), f, indent=2)
-
-        # Save redacted transcript
-        if output.transcript_redacted:
-            deid_path = self.output_dir / "transcripts_deid" / "train" / f"{conv_id}.json"
-            with open(deid_path, "w") as f:
-                json.dump(output.transcript_redacted.to_dict(), f, indent=2)
+        # Save raw (unless already written after transcription) and redacted transcripts
+        paths = []
+        with timed(output.timings, "save_outputs"):
+            if output.raw_transcript_path:
+                paths.append(Path(output.raw_transcript_path))
+            elif output.transcript_raw:
+                paths.append(self._write_transcript("transcripts_raw", output.transcript_raw))
+            if output.transcript_redacted:
+                written = self._write_transcript("transcripts_deid", output.transcript_redacted)
+                paths.append(written)
+                output.io_bytes["save_outputs"] = written.stat().st_size
+        self._journal_stage(output, "save", paths)
 
         logger.debug(f"Saved outputs for {conv_id}")
 
+    def _write_transcript(self, subdir: str, transcript: Any) -> Path:
+        """
+        Write a transcript under subdir/train, dropping copies left by an
+        earlier run with a different compression setting.
+        """
+        directory = self.output_dir / subdir / "train"
+        path = write_transcript(directory, transcript, self.transcript_compression)
+        remove_stale_variants(directory, transcript.conversation_id, keep=path)
+        return path
+
+    def _load_raw_transcript(self, conversation_id: str) -> Tuple[TranscriptionResult, Path]:
+        """Raw transcript saved by an earlier run, and its path."""
+        path = find_transcript(self.output_dir / "transcripts_raw" / "train", conversation_id)
+        if path is None:
+            raise FileNotFoundError(f"No raw transcript for {conversation_id}")
+        return TranscriptionResult.from_dict(read_json(path)), path
+
+    def flush(self):
+        """Wait for background writes and verifications; failures are recorded on their outputs."""
+        if self.writer:
+            self.writer.drain()
+        if self.verification_pool:
+            self.verification_pool.drain()
+
     def process_batch(
         self,
         audio_paths: List[str],
         continue_on_error: bool = True
-    ) -> List[ConversationOutput]:
+    ) -> List[Any]:
         """
         Process multiple conversations.
 
         Args:
-            audio_paths: List of audio file paths
+            audio_paths: List of audio file paths (only this pipeline's
+                shard of them is processed, if it has one)
             continue_on_error: Continue processing if one file fails
+                (failures are always contained per file when staged)
 
         Returns:
-            List of ConversationOutput objects
+            List of ConversationOutput objects, or ConversationSummary
+            objects when streaming
         """
-        results = []
+        self._batch_results = []
+        self._manifest_written_at = 0.0
+        self.stage_metrics = None
+        if self.shard is not None:
+            selected = select_shard(audio_paths, self.shard)
+            logger.info(
+                f"Shard {self.shard[0]}/{self.shard[1]}: "
+                f"{len(selected)} of {len(audio_paths)} conversations"
+            )
+            audio_paths = selected
         total = len(audio_paths)
+        started = time.perf_counter()
+        order = self._schedule(audio_paths)
+        if self.streaming:
+            self._start_streaming(total)
+        self._load_journal(audio_paths)
 
         logger.info(f"Processing batch of {total} conversations")
 
-        for i, audio_path in enumerate(audio_paths, 1):
-            logger.info(f"[{i}/{total}] Processing {Path(audio_path).stem}")
+        if self.staged:
+            results = self._process_batch_staged(audio_paths, order)
+        else:
+            results = [None] * total
+            for n, i in enumerate(order, 1):
+                audio_path = audio_paths[i]
+                logger.info(f"[{n}/{total}] Processing {Path(audio_path).stem}")
 
-            try:
-                result = self.process_conversation(audio_path)
-                results.append(result)
-
-            except Exception as e:
-                if continue_on_error:
-                    logger.error(f"Failed to process {audio_path}: {e}")
-                    results.append(ConversationOutput(
-                        conversation_id=Path(audio_path).stem,
-                        success=False,
-                        error=str(e),
-                        stage="unknown"
-                    ))
+                try:
+                    job = self._new_job(audio_path)
+                    job.index = i
+                    self._run_job(job)
+
+                except Exception as e:
+                    if continue_on_error:
+                        job = self._failed_job(audio_path, i, e)
+                    else:
+                        raise
+
+                self._progress_done(job)
+                if self.streaming:
+                    self._track(job)
                 else:
-                    raise
+                    results[i] = job.output
+                    with self._manifest_lock:
+                        self._batch_results.append(job.output)
+                    self._update_manifest()
+
+        # Background writes must land before reporting, and may turn successes into failures
+        self.flush()
+        self.batch_wall_s = time.perf_counter() - started
+
+        if self.streaming:
+            return self._finish_streaming()
+
+        if self.journal is not None:
+            for r in results:
+                if not r.success:
+                    self.journal.record(r.conversation_id, "failed", stage=r.stage, error=r.error)
+
+        # Reports and the manifest cover every conversation in the journal,
+        # not just this batch
+        merged = results + self._earlier_results
+
+        if self.export_words and self.save_outputs:
+            self._export_word_tables(merged)
 
         # Generate summary report and metadata
-        self._generate_report(results)
-        self._generate_metadata_manifest(results)
+        self._generate_report(merged)
+        self._batch_results = results  # Input order for the final manifest
+        self._update_manifest(force=True)
+        self._batch_results = []
 
         return results
 
-    def _generate_metadata_manifest(self, results: List[ConversationOutput]):
-        """Generate metadata manifest in the format requested by customer."""
-        if not self.save_outputs:
+    def _load_journal(self, audio_paths: List[str]):
+        """Read the journal: what to resume, and what earlier runs finished."""
+        self._journal_states = {}
+        self._earlier_results = []
+        self._earlier_count = 0
+        if self.journal is None:
             return
 
-        manifest_rows = []
-        for r in results:
-            if not r.success:
+        states = self.journal.load()
+        if self.resume:
+            self._journal_states = states
+
+        batch = {Path(p).stem for p in audio_paths}
+        for conversation_id in sorted(states):
+            state = states[conversation_id]
+            if conversation_id in batch:
                 continue
+            if state.complete:
+                if not all(
+                    state.outputs_valid(c, self.output_dir, check_hashes=False)
+                    for c in ("redact_audio", "save")
+                ):
+                    continue  # Outputs removed since
+            elif state.failure is None:
+                continue  # Interrupted, nothing to report
+            self._earlier_count += 1
+            if self.streaming:
+                self._stream_output(self._restored_output(state), earlier=True)
+            else:
+                self._earlier_results.append(self._restored_output(state))
+
+        if self._earlier_count:
+            logger.info(
+                f"Journal: {self._earlier_count} conversations from earlier runs "
+                f"carried into the manifest and report"
+            )
 
-            # Build metadata row matching the requested schema
-            row = {
-                "conversation_id": r.conversation_id,
-                "duration_sec": r.transcript_raw.audio_duration if r.transcript_raw else 0,
-                "num_speakers": 2,  # Dataset is 2-person conversations
-                "sample_rate": 16000,
-                "has_pii": len(r.pii_matches) > 0,
-                "pii_count": len(r.pii_matches),
-                "deid_version": datetime.now().strftime("%Y-%m-%d_v1"),
-                "qa_status": r.verification.overall_status.value if r.verification else "pending"
-            }
-            manifest_rows.append(row)
+    def _schedule(self, audio_paths: List[str]) -> List[int]:
+        """
+        Read the batch's durations from the file headers and pick the
+        processing order (indices into audio_paths). Also starts the ETA.
+        """
+        probe_started = time.perf_counter()
+        self._durations = probe_durations(audio_paths)
+        self.progress = ProgressEstimator(self._durations)
+        if not self.longest_first:
+            return list(range(len(audio_paths)))
+
+        logger.info(
+            f"Scheduling {len(audio_paths)} files longest first "
+            f"({format_duration(self.progress.total_audio_s)} of audio; "
+            f"headers read in {time.perf_counter() - probe_started:.1f}s)"
+        )
+        return longest_first(self._durations)
+
+    def _progress_done(self, job: _Job):
+        """Count a file towards the batch progress and log the ETA."""
+        audio_s = self._durations[job.index]
+        if job.skip:
+            self.progress.skip(audio_s)  # Took no time; would skew the real-time factor
+        else:
+            self.progress.done(audio_s)
+            logger.info(f"Progress: {self.progress.status()}")
+
+    def _failed_job(self, audio_path: str, index: int, error: Exception) -> _Job:
+        """A job for a file that failed outside its stages (it runs no stages)."""
+        logger.error(f"Failed to process {audio_path}: {error}")
+        return _Job(
+            audio_path=Path(audio_path),
+            output=ConversationOutput(
+                conversation_id=Path(audio_path).stem,
+                success=False,
+                error=str(error),
+                stage="unknown"
+            ),
+            index=index,
+            failed=True
+        )
+
+    def _process_batch_staged(
+        self,
+        audio_paths: List[str],
+        order: List[int]
+    ) -> List[ConversationOutput]:
+        """
+        Run the batch on the staged executor: each stage has its own threads
+        (stage_workers) and a bounded queue in front of it, so e.g. one file
+        is transcribed while the previous one's audio is encoded.
+        Files enter in the given order; outputs come back in input order.
+        """
+        stage_functions = self._stage_functions()
+
+        def step(fn: Callable[[_Job], None], last: bool) -> Callable[[_Job], None]:
+            def run(job: _Job):
+                self._run_stage(job, fn)
+                if last:
+                    self._progress_done(job)
+                if last and self.streaming:
+                    self._track(job)
+                elif last:
+                    with self._manifest_lock:
+                        self._batch_results.append(job.output)
+                    self._update_manifest()
+            return run
+
+        def new_jobs():
+            for index in order:
+                try:
+                    job = self._new_job(audio_paths[index], inline_audio=True)
+                except Exception as e:
+                    # E.g. an unreadable journal entry: fail this file, not the batch
+                    job = self._failed_job(audio_paths[index], index, e)
+                job.index = index
+                yield job
+
+        executor = StagedExecutor(
+            [
+                Stage(name, step(fn, k == len(stage_functions) - 1), self.stage_workers[name])
+                for k, (name, fn) in enumerate(stage_functions)
+            ],
+            queue_size=STAGE_QUEUE_SIZE
+        )
+        jobs = executor.run(new_jobs(), collect=not self.streaming)
+        self.stage_metrics = {name: m.to_dict() for name, m in executor.metrics.items()}
+        outputs: List[Optional[ConversationOutput]] = [None] * len(jobs)
+        for job in jobs:
+            outputs[job.index] = job.output
+        return outputs
+
+    def _start_streaming(self, total: int):
+        """Set up the accumulators a streaming batch folds conversations into."""
+        self._in_flight = {}
+        self._summaries = [None] * total
+        self._report = ReportAccumulator(
+            RowSpool(self._batch_file("qa", ".report_rows.jsonl")) if self.save_outputs else None
+        )
+        self._manifest_spool = RowSpool(
+            self._batch_file("metadata", ".manifest_rows.jsonl")
+        ) if self.save_outputs else None
+        self._exporter = WordExporter(
+            self._exports_dir
+        ) if self.export_words and self.save_outputs else None
+
+    def _track(self, job: _Job):
+        """Hold a job until its background writes and verification finish, then finalize it."""
+        with self._manifest_lock:
+            self._in_flight[job.index] = job
+        self._finalize_done()
+
+    def _finalize_done(self):
+        """Finalize the tracked jobs whose background jobs have all finished."""
+        with self._finalize_lock:
+            with self._manifest_lock:
+                done = [
+                    job for job in self._in_flight.values()
+                    if all(future.done() for _, future in job.futures)
+                ]
+            for job in done:
+                self._finalize(job)
+        self._update_manifest()
+
+    def _finalize(self, job: _Job):
+        """
+        Settle a finished job's background work, fold it into the report,
+        manifest and export, and keep only its summary.
+        """
+        output = job.output
+        for pool, future in job.futures:
+            pool.collect(future)  # Records the failure on output, if any
+        if not output.success and self.journal is not None:
+            self.journal.record(
+                output.conversation_id, "failed", stage=output.stage, error=output.error
+            )
+        self._summaries[job.index] = ConversationSummary.from_output(output)
+        self._stream_output(output, index=job.index)
+
+    def _stream_output(
+        self,
+        output: ConversationOutput,
+        earlier: bool = False,
+        index: Optional[int] = None
+    ):
+        """Add a conversation to the streaming accumulators (and stop tracking its job)."""
+        self._report.add(output, earlier=earlier)
+        row = None
+        if output.success:
+            if self._exporter is not None:
+                self._export_output(self._exporter, output)
+            row = output.manifest_row or self._manifest_row(output)
+
+        # Spooled and untracked together, so a manifest update sees it exactly once
+        with self._manifest_lock:
+            if row is not None and self._manifest_spool is not None:
+                self._manifest_spool.append(row)
+            if index is not None:
+                del self._in_flight[index]
+
+    def _finish_streaming(self) -> List[ConversationSummary]:
+        """Finalize the last jobs and write the report, manifest and export."""
+        self._finalize_done()
+        if self._exporter is not None:
+            self._exporter.close()
+        self._write_report(self._report)
+        self._update_manifest(force=True)
+
+        summaries = self._summaries
+        self._report.rows.close()
+        if self._manifest_spool is not None:
+            self._manifest_spool.close()
+        self._report = self._manifest_spool = self._exporter = None
+        self._summaries = []
+        return summaries
+
+    def _update_manifest(self, force: bool = False):
+        """
+        Rewrite the manifest for the batch in progress, at most once per
+        MANIFEST_UPDATE_INTERVAL_S unless forced. Called as conversations
+        finish and as their background verifications complete.
+        """
+        with self._manifest_lock:
+            now = time.time()
+            if not force and now - self._manifest_written_at < MANIFEST_UPDATE_INTERVAL_S:
+                return
+            self._manifest_written_at = now
+            if self.streaming:
+                if self._manifest_spool is None:
+                    return
+                # Finalized conversations, then the ones still waiting on background jobs
+                self._generate_metadata_manifest(itertools.chain(
+                    self._manifest_spool,
+                    self._manifest_rows(job.output for job in self._in_flight.values())
+                ))
+            else:
+                self._generate_metadata_manifest(self._manifest_rows(
+                    list(self._batch_results) + self._earlier_results
+                ))
+
+    def _export_word_tables(self, results: List[ConversationOutput]):
+        """Write word-level tables for the successful conversations."""
+        exporter = WordExporter(self._exports_dir)
+        for r in results:
+            if r.success:
+                self._export_output(exporter, r)
+        exporter.close()
+
+    def _export_output(self, exporter: WordExporter, r: ConversationOutput):
+        """Add one successful conversation to the word tables."""
+        if r.transcript_raw and r.transcript_redacted:
+            exporter.add(r.transcript_raw, r.transcript_redacted, r.pii_matches)
+        elif r.resumed_from == RESUME_DONE:
+            # Completed earlier: rebuild the text side from the saved raw transcript
+            transcript, _ = self._load_raw_transcript(r.conversation_id)
+            pii_matches, redacted = self._detect_and_redact(None, transcript)
+            exporter.add(transcript, redacted, pii_matches)
+
+    def _manifest_row(self, r: ConversationOutput) -> Dict[str, Any]:
+        """Metadata row for one conversation, matching the requested schema."""
+        return {
+            "conversation_id": r.conversation_id,
+            "duration_sec": r.audio_duration,
+            "num_speakers": 2,  # Dataset is 2-person conversations
+            "sample_rate": self.output_profile.sample_rate,
+            "has_pii": r.pii_count > 0,
+            "pii_count": r.pii_count,
+            "deid_version": datetime.now().strftime("%Y-%m-%d_v1"),
+            "audio_mode": r.audio_mode,
+            "qa_status": (
+                r.verification.overall_status.value if r.verification
+                else PENDING_VERIFICATION
+            ),
+            "verification_policy": r.policy.to_dict() if r.policy else None
+        }
+
+    def _manifest_rows(self, results: Iterable[ConversationOutput]) -> Iterable[Dict[str, Any]]:
+        """Manifest rows of the successful conversations."""
+        return (r.manifest_row or self._manifest_row(r) for r in results if r.success)
+
+    def _generate_metadata_manifest(self, rows: Iterable[Dict[str, Any]]):
+        """Generate metadata manifest in the format requested by customer."""
+        if not self.save_outputs:
+            return
 
         # Save as JSON (parquet requires pyarrow, keep it simple)
-        manifest_path = self.output_dir / "metadata" / "manifest.json"
+        manifest_path = self._batch_file("metadata", "manifest.json")
         manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(manifest_path, "w") as f:
-            json.dump(manifest_rows, f, indent=2)
+        write_json_rows_atomic(manifest_path, rows)
 
         logger.info(f"Saved metadata manifest to {manifest_path}")
 
     def _generate_report(self, results: List[ConversationOutput]):
         """Generate a summary report of processing."""
-        successes = [r for r in results if r.success]
-        failures = [r for r in results if not r.success]
-
-        # Count verification statuses
-        status_counts = {s.value: 0 for s in VerificationStatus}
-        for r in successes:
-            if r.verification:
-                status_counts[r.verification.overall_status.value] += 1
-
-        # Total PII counts and duration
-        total_pii = sum(len(r.pii_matches) for r in successes)
-        total_duration = sum(
-            r.transcript_raw.audio_duration if r.transcript_raw else 0
-            for r in successes
-        )
-
-        report = {
-            "timestamp": datetime.now().isoformat(),
-            "summary": {
-                "total_conversations": len(results),
-                "successful": len(successes),
-                "failed": len(failures),
-                "total_duration_sec": round(total_duration, 1),
-                "total_duration_min": round(total_duration / 60, 1),
-                "total_pii_redacted": total_pii
-            },
-            "verification_status": status_counts,
-            "failures": [
-                {
-                    "conversation_id": r.conversation_id,
-                    "stage": r.stage,
-                    "error": r.error
-                }
-                for r in failures
-            ],
-            "processing_times": {
-                r.conversation_id: r.processing_time_s
-                for r in results
-            }
-        }
+        report = ReportAccumulator()
+        earlier = {id(r) for r in self._earlier_results}
+        for r in results:
+            report.add(r, earlier=id(r) in earlier)
+        self._write_report(report)
 
-        # Save report
+    def _write_report(self, report: ReportAccumulator):
+        """Save the processing report and log its summary."""
         if self.save_outputs:
-            report_path = self.output_dir / "qa" / "processing_report.json"
-            with open(report_path, "w") as f:
-                json.dump(report, f, indent=2)
+            report_path = self._batch_file("qa", "processing_report.json")
+            report.write(report_path, self.stage_metrics, self.batch_wall_s)
 
             logger.info(f"Saved processing report to {report_path}")
 
@@ -353,11 +1251,11 @@ class Pipeline:
             f"\n{'='*60}\n"
             f"PROCESSING COMPLETE\n"
             f"{'='*60}\n"
-            f"Total: {len(results)}\n"
-            f"Success: {len(successes)}\n"
-            f"Failed: {len(failures)}\n"
-            f"PII Redacted: {total_pii}\n"
-            f"Verification: {status_counts}\n"
+            f"Total: {report.total}\n"
+            f"Success: {report.successful}\n"
+            f"Failed: {len(report.failures)}\n"
+            f"PII Redacted: {report.total_pii}\n"
+            f"Verification: {report.status_counts}\n"
             f"{'='*60}"
         )
 
@@ -366,8 +1264,21 @@ def run_pipeline(
     audio_paths: List[str],
     output_dir: Optional[str] = None,
     whisper_model: str = "base",
-    verify_audio: bool = True
-) -> List[ConversationOutput]:
+    verify_audio: bool = True,
+    output_profile: str = DEFAULT_OUTPUT_PROFILE,
+    multichannel: bool = MULTICHANNEL_REDACTION,
+    transcript_compression: Optional[str] = TRANSCRIPT_COMPRESSION,
+    export_words: bool = EXPORT_WORD_TABLES,
+    spectral_precheck: bool = SPECTRAL_PRECHECK,
+    audit_rate: Optional[float] = VERIFY_AUDIT_RATE,
+    async_verification: bool = ASYNC_VERIFICATION,
+    staged: bool = STAGED_EXECUTION,
+    stage_workers: Optional[Dict[str, int]] = None,
+    resume: bool = JOURNAL_RESUME,
+    streaming: bool = STREAMING_BATCH,
+    shard: Optional[Shard] = None,
+    longest_first: bool = SCHEDULE_LONGEST_FIRST
+) -> List[Any]:
     """
     Convenience function to run the pipeline.
 
@@ -376,13 +1287,41 @@ def run_pipeline(
         output_dir: Output directory
         whisper_model: Whisper model size
         verify_audio: Whether to verify audio redaction
+        output_profile: Audio encoding profile name
+        multichannel: Redact each channel separately and keep the layout
+        transcript_compression: Compress transcript JSON (None, "gzip" or "zstd")
+        export_words: Write word-level Parquet/npz tables under exports/
+        spectral_precheck: Check bleeps spectrally before audio re-ASR
+        audit_rate: Re-ASR high-risk files plus this share of the rest
+            (None = every file)
+        async_verification: Verify on a background pool
+        staged: Run the batch on the stage-pipelined executor
+        stage_workers: Threads per stage, overriding STAGE_WORKERS
+        resume: Skip completed conversations and resume failed ones
+        streaming: Keep only a summary of each conversation once its outputs
+            are written (flat memory on large batches)
+        shard: (i, N) to process only shard i of N
+        longest_first: Process the longest files first
 
     Returns:
-        List of ConversationOutput objects
+        List of ConversationOutput objects (ConversationSummary when streaming)
     """
     pipeline = Pipeline(
         output_dir=output_dir,
         whisper_model=whisper_model,
-        verify_audio=verify_audio
+        verify_audio=verify_audio,
+        output_profile=output_profile,
+        multichannel=multichannel,
+        transcript_compression=transcript_compression,
+        export_words=export_words,
+        spectral_precheck=spectral_precheck,
+        audit_rate=audit_rate,
+        async_verification=async_verification,
+        staged=staged,
+        stage_workers=stage_workers,
+        resume=resume,
+        streaming=streaming,
+        shard=shard,
+        longest_first=longest_first
     )
     return pipeline.process_batch(audio_paths)
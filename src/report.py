@@ -0,0 +1,273 @@
+"""
+Processing report, aggregated one conversation at a time.
+ReportAccumulator folds each finished conversation into counters and
+per-stage timing columns as soon as it's done, so a batch never has to keep
+its conversations (transcripts, matches, bleep regions) around just to
+report on them at the end.
+
+The report's per-conversation sections (processing times, stage timings,
+audio modes) are kept as rows in a RowSpool: in memory by default, or in a
+JSONL file for memory-bounded batches, streamed into the report when it's
+written.
+"""
+import logging
+import os
+import threading
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .output_writer import write_json_sections_atomic
+from .serialization import dumps, loads
+from .timing import StageStats, percentiles
+from .verifier import VerificationStatus
+from .verify_policy import DECISION_AUDIT, summarize_decisions
+
+logger = logging.getLogger(__name__)
+
+
+class RowSpool:
+    """Rows in append order: in memory, or in a JSONL file when given a path."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize the spool. A file left by an earlier run is truncated.
+
+        Args:
+            path: JSONL file to keep the rows in (None: keep them in memory)
+        """
+        self.path = Path(path) if path is not None else None
+        self._rows: List[Any] = []
+        self._lock = threading.Lock()
+        self._file = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "wb")
+
+    def append(self, row: Any) -> None:
+        with self._lock:
+            if self._file is None:
+                self._rows.append(row)
+            else:
+                self._file.write(dumps(row) + b"\n")
+
+    def __iter__(self) -> Iterator[Any]:
+        """Rows appended so far, in order (later appends aren't included)."""
+        with self._lock:
+            if self._file is None:
+                return iter(list(self._rows))
+            self._file.flush()
+            return self._read(self._file.tell())
+
+    def _read(self, size: int) -> Iterator[Any]:
+        """Rows in the first size bytes of the spool file."""
+        with open(self.path, "rb") as f:
+            read = 0
+            for line in f:
+                read += len(line)
+                if read > size:
+                    break
+                yield loads(line)
+
+    def close(self) -> None:
+        """Drop the rows (and remove the file)."""
+        with self._lock:
+            self._rows = []
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                os.unlink(self.path)
+
+
+class ReportAccumulator:
+    """Processing report of a batch, built one conversation at a time."""
+
+    def __init__(self, rows: Optional[RowSpool] = None):
+        """
+        Initialize the accumulator.
+
+        Args:
+            rows: Spool for the per-conversation sections (default: in memory)
+        """
+        self.rows = rows if rows is not None else RowSpool()
+        self.total = 0
+        self.successful = 0
+        self.failures: List[Dict[str, Any]] = []
+        self.total_pii = 0
+        self.total_duration = 0.0
+        self.status_counts = {s.value: 0 for s in VerificationStatus}
+        self.audio_methods: Dict[str, int] = {}
+        self.spectral_flagged = 0
+        self.decisions: Dict[str, int] = {}
+        self.failed_audits = 0
+        self.pending = 0
+        self.resumed: Dict[str, int] = {}
+        self.earlier_runs = 0
+        self._lag_total = 0.0
+        self._lag_count = 0
+        self._lag_max: Optional[float] = None
+        self._timed_audio = 0.0
+        self._processing_s = array("d")
+        self._stages = StageStats()
+
+    def add(self, r: Any, earlier: bool = False) -> None:
+        """
+        Add one finished conversation.
+
+        Args:
+            r: ConversationOutput (after its background jobs finished)
+            earlier: Completed or failed in an earlier run (from the journal)
+        """
+        self.total += 1
+        if earlier:
+            self.earlier_runs += 1
+        elif r.resumed_from:
+            # Where this run picked the conversation up (RESUME_DONE: skipped)
+            self.resumed[r.resumed_from] = self.resumed.get(r.resumed_from, 0) + 1
+
+        if r.success:
+            self._add_success(r)
+        else:
+            self.failures.append({
+                "conversation_id": r.conversation_id,
+                "stage": r.stage,
+                "error": r.error
+            })
+
+        # Stage timings of the conversations processed in this run
+        if r.timings:
+            audio_s = r.audio_duration
+            self._timed_audio += audio_s
+            self._processing_s.append(r.processing_time_s)
+            self._stages.add(
+                r.timings, r.io_bytes, audio_s,
+                len(r.transcript_raw.get_all_words()) if r.transcript_raw else 0
+            )
+
+        self.rows.append({
+            "conversation_id": r.conversation_id,
+            "processing_time_s": r.processing_time_s,
+            "timings": (
+                {stage: round(t, 4) for stage, t in r.timings.items()} if r.timings else None
+            ),
+            "audio_mode": r.audio_mode if r.success else None,
+            "success": r.success
+        })
+
+    def _add_success(self, r: Any) -> None:
+        self.successful += 1
+        self.total_pii += r.pii_count
+        self.total_duration += r.audio_duration
+
+        verification = r.verification
+        if verification is None:
+            self.pending += 1
+        else:
+            self.status_counts[verification.overall_status.value] += 1
+            # How audio was verified, and how many files had a bleep flagged
+            if verification.audio_method:
+                method = verification.audio_method
+                self.audio_methods[method] = self.audio_methods.get(method, 0) + 1
+            if verification.spectral and not verification.spectral["passed"]:
+                self.spectral_flagged += 1
+
+        if r.policy:
+            self.decisions[r.policy.decision] = self.decisions.get(r.policy.decision, 0) + 1
+            # Audited files that didn't pass estimate the leak rate of the unaudited ones
+            if (
+                r.policy.decision == DECISION_AUDIT and verification
+                and verification.audio_status not in (
+                    VerificationStatus.PASS, VerificationStatus.PASS_WITH_NOTE
+                )
+            ):
+                self.failed_audits += 1
+
+        # Time from redaction to verification (background verification only)
+        lag = r.verification_lag_s
+        if lag is not None:
+            self._lag_total += lag
+            self._lag_count += 1
+            self._lag_max = lag if self._lag_max is None else max(self._lag_max, lag)
+
+    def summary(
+        self,
+        stage_metrics: Optional[Dict[str, Dict[str, Any]]] = None,
+        batch_wall_s: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        The report without its per-conversation sections.
+
+        Args:
+            stage_metrics: Staged executor metrics, if the batch was staged
+            batch_wall_s: Wall-clock seconds of the batch
+        """
+        timed_audio = self._timed_audio
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "summary": {
+                "total_conversations": self.total,
+                "successful": self.successful,
+                "failed": len(self.failures),
+                "total_duration_sec": round(self.total_duration, 1),
+                "total_duration_min": round(self.total_duration / 60, 1),
+                "total_pii_redacted": self.total_pii
+            },
+            "verification_status": dict(self.status_counts),
+            "audio_verification": {
+                "methods": dict(self.audio_methods),
+                "spectral_flagged": self.spectral_flagged
+            },
+            "verification_lag_s": {
+                "mean": round(self._lag_total / self._lag_count, 3) if self._lag_count else None,
+                "max": round(self._lag_max, 3) if self._lag_max is not None else None,
+                "samples": self._lag_count,
+                "pending": self.pending
+            },
+            "stage_metrics": stage_metrics,
+            "performance": {
+                "clock": "perf_counter",
+                "batch": {
+                    "files": len(self._processing_s),
+                    "audio_s": round(timed_audio, 3),
+                    "wall_s": round(batch_wall_s, 3) if batch_wall_s else None,
+                    "rtf": (
+                        round(batch_wall_s / timed_audio, 4)
+                        if batch_wall_s and timed_audio else None
+                    )
+                },
+                "processing_s": percentiles(self._processing_s),
+                "stages": self._stages.summary()
+            },
+            "resume": {
+                "resumed_from": dict(self.resumed),
+                "earlier_runs": self.earlier_runs
+            },
+            "verification_policy": summarize_decisions(self.decisions, self.failed_audits),
+            "failures": list(self.failures)
+        }
+
+    def sections(self) -> Dict[str, Iterator]:
+        """The per-conversation sections, as (conversation_id, value) pairs read from the rows."""
+        return {
+            "processing_times": (
+                (row["conversation_id"], row["processing_time_s"]) for row in self.rows
+            ),
+            "stage_timings": (
+                (row["conversation_id"], row["timings"])
+                for row in self.rows if row["timings"]
+            ),
+            "audio_modes": (
+                (row["conversation_id"], row["audio_mode"])
+                for row in self.rows if row["success"]
+            )
+        }
+
+    def write(
+        self,
+        path: Path,
+        stage_metrics: Optional[Dict[str, Dict[str, Any]]] = None,
+        batch_wall_s: Optional[float] = None
+    ) -> None:
+        """Write the full report as JSON, streaming the per-conversation sections."""
+        write_json_sections_atomic(path, self.summary(stage_metrics, batch_wall_s), self.sections())
@@ -0,0 +1,276 @@
+"""
+Reviewer tooling - pull short original/redacted clips around bleep regions.
+Reads only the frames it needs (seek + read), with a small LRU cache of
+decoded blocks, so latency doesn't depend on recording length. Files are
+opened through the audio input layer, so originals in compressed formats
+work too (those decode up to the clip rather than seeking to it).
+"""
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import (
+    OUTPUT_DIR,
+    OUTPUT_PROFILES,
+    DEFAULT_OUTPUT_PROFILE,
+    REVIEW_CONTEXT_S,
+    REVIEW_CACHE_BLOCKS,
+    REVIEW_BLOCK_FRAMES,
+    PIIMatch
+)
+from .audio_input import AudioSource, open_audio, probe_audio
+from .audio_redactor import AudioRedactor, BleepRegion
+from .serialization import find_transcript, read_json
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ClipPair:
+    """Original and redacted audio for the same time range."""
+    conversation_id: str
+    start_time: float
+    end_time: float
+    original: np.ndarray
+    original_sample_rate: int
+    redacted: np.ndarray
+    redacted_sample_rate: int
+    region: Optional[BleepRegion] = None
+
+
+class BlockCache:
+    """LRU cache of fixed-size decoded blocks, read with seek()."""
+
+    def __init__(
+        self,
+        max_blocks: int = REVIEW_CACHE_BLOCKS,
+        block_frames: int = REVIEW_BLOCK_FRAMES
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_blocks: Number of decoded blocks to keep
+            block_frames: Frames per block
+        """
+        self.max_blocks = max_blocks
+        self.block_frames = block_frames
+        self._blocks: "OrderedDict[Tuple[str, int], np.ndarray]" = OrderedDict()
+        self._sources: Dict[str, AudioSource] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _source(self, path: str) -> AudioSource:
+        """Open source for path (opened once, kept until close())."""
+        source = self._sources.get(path)
+        if source is None:
+            source = self._sources[path] = open_audio(path)
+        return source
+
+    def _block(self, path: str, index: int) -> np.ndarray:
+        """Get one block, decoding it on a miss."""
+        key = (path, index)
+        block = self._blocks.get(key)
+        if block is not None:
+            self._blocks.move_to_end(key)
+            self.hits += 1
+            return block
+
+        self.misses += 1
+        source = self._source(path)
+        source.seek(index * self.block_frames)
+        block = source.read(self.block_frames, dtype="float32", always_2d=True)
+
+        self._blocks[key] = block
+        if len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+        return block
+
+    def read(self, path: str, start_time: float, end_time: float) -> Tuple[np.ndarray, int]:
+        """Read [start_time, end_time) from path. Returns (audio, sample_rate)."""
+        info = self._source(path).info()
+        sample_rate = info.samplerate
+        start = max(0, int(start_time * sample_rate))
+        end = min(info.frames, int(end_time * sample_rate))
+        if end <= start:
+            return np.empty((0, info.channels), dtype=np.float32), sample_rate
+
+        first = start // self.block_frames
+        last = (end - 1) // self.block_frames
+        blocks = [self._block(path, i) for i in range(first, last + 1)]
+        audio = blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+
+        offset = first * self.block_frames
+        return audio[start - offset:end - offset], sample_rate
+
+    def close(self) -> None:
+        """Close the open files and drop the cached blocks."""
+        for source in self._sources.values():
+            source.close()
+        self._sources.clear()
+        self._blocks.clear()
+
+
+class ClipExtractor:
+    """
+    Extracts original/redacted clips for a processed conversation.
+
+    Bleep regions are the ones the run recorded in qa/bleep_regions/. For
+    outputs written before those were recorded, they are rebuilt from the
+    de-identified transcript's redaction log with audio_redactor's
+    settings, which only match the run's if the same settings are passed in.
+    """
+
+    def __init__(
+        self,
+        output_dir: Optional[str] = None,
+        output_profile: str = DEFAULT_OUTPUT_PROFILE,
+        audio_redactor: Optional[AudioRedactor] = None,
+        cache: Optional[BlockCache] = None
+    ):
+        """
+        Initialize the extractor.
+
+        Args:
+            output_dir: Pipeline output directory
+            output_profile: Encoding profile the outputs were written with
+            audio_redactor: Redactor with the run's bleep settings (only used
+                for outputs without recorded regions)
+            cache: Block cache (shared between original and redacted files)
+        """
+        self.output_dir = Path(output_dir) if output_dir else OUTPUT_DIR
+        self.profile = OUTPUT_PROFILES[output_profile]
+        self.audio_redactor = audio_redactor or AudioRedactor()
+        self.cache = cache or BlockCache()
+        self._metadata: Dict[str, Tuple[str, List[BleepRegion]]] = {}
+
+    def close(self) -> None:
+        """Close the audio files the cache holds open."""
+        self.cache.close()
+
+    def _paths(self, conversation_id: str) -> Tuple[Optional[Path], Optional[Path], Path]:
+        """Raw transcript, de-identified transcript and redacted audio paths."""
+        return (
+            find_transcript(self.output_dir / "transcripts_raw" / "train", conversation_id),
+            find_transcript(self.output_dir / "transcripts_deid" / "train", conversation_id),
+            self.output_dir / "audio" / "train" / f"{conversation_id}.{self.profile.extension}",
+        )
+
+    def _recorded_regions(self, conversation_id: str) -> Optional[List[BleepRegion]]:
+        """The bleep regions the run wrote, or None if it didn't record them."""
+        path = self.output_dir / "qa" / "bleep_regions" / f"{conversation_id}.json"
+        if not path.exists():
+            return None
+        return [BleepRegion.from_dict(region) for region in read_json(path)]
+
+    def _load(self, conversation_id: str) -> Tuple[str, List[BleepRegion]]:
+        """Load (original audio path, bleep regions) for a conversation."""
+        if conversation_id in self._metadata:
+            return self._metadata[conversation_id]
+
+        raw_path, deid_path, audio_path = self._paths(conversation_id)
+        if raw_path is None or deid_path is None:
+            raise FileNotFoundError(f"Missing transcripts for {conversation_id}")
+        if not audio_path.exists():
+            raise FileNotFoundError(f"Missing output for {conversation_id}: {audio_path}")
+
+        original_audio = read_json(raw_path)["audio_path"]
+        regions = self._recorded_regions(conversation_id)
+        if regions is None:
+            logger.warning(
+                f"No recorded bleep regions for {conversation_id}; rebuilding them from "
+                "the redaction log with the given redactor settings"
+            )
+            regions = self._rebuild_regions(deid_path, audio_path)
+
+        self._metadata[conversation_id] = (original_audio, regions)
+        return original_audio, regions
+
+    def _rebuild_regions(self, deid_path: Path, audio_path: Path) -> List[BleepRegion]:
+        """Bleep regions from the de-identified transcript's redaction log."""
+        redactions = read_json(deid_path)["redactions"]
+
+        matches = [
+            PIIMatch(
+                text=r["original"],
+                category=r["category"],
+                start_time=r["start_time"],
+                end_time=r["end_time"],
+                confidence=r["confidence"],
+                word_indices=[],
+                is_fuzzy=r["is_fuzzy"]
+            )
+            for r in redactions
+        ]
+        return self.audio_redactor.calculate_bleep_regions(
+            matches, probe_audio(str(audio_path)).duration
+        )
+
+    def regions(self, conversation_id: str) -> List[BleepRegion]:
+        """Bleep regions for a conversation, in time order."""
+        return self._load(conversation_id)[1]
+
+    def clip(
+        self,
+        conversation_id: str,
+        start_time: float,
+        end_time: float,
+        region: Optional[BleepRegion] = None
+    ) -> ClipPair:
+        """Get original and redacted audio for a time range."""
+        original_path, _ = self._load(conversation_id)
+        redacted_path = str(self._paths(conversation_id)[2])
+
+        original, original_rate = self.cache.read(original_path, start_time, end_time)
+        redacted, redacted_rate = self.cache.read(redacted_path, start_time, end_time)
+
+        return ClipPair(
+            conversation_id=conversation_id,
+            start_time=start_time,
+            end_time=end_time,
+            original=original,
+            original_sample_rate=original_rate,
+            redacted=redacted,
+            redacted_sample_rate=redacted_rate,
+            region=region
+        )
+
+    def region_clip(
+        self,
+        conversation_id: str,
+        region_index: int,
+        context_s: float = REVIEW_CONTEXT_S
+    ) -> ClipPair:
+        """Get a clip around one bleep region, with context_s on either side."""
+        regions = self.regions(conversation_id)
+        if not 0 <= region_index < len(regions):
+            raise IndexError(
+                f"{conversation_id} has {len(regions)} bleep regions, no region {region_index}"
+            )
+
+        region = regions[region_index]
+        return self.clip(
+            conversation_id,
+            max(0.0, region.start_time - context_s),
+            region.end_time + context_s,
+            region=region
+        )
+
+
+def save_clip_pair(pair: ClipPair, output_dir: str, name: Optional[str] = None) -> Tuple[str, str]:
+    """Write a clip pair as <name>_original.wav and <name>_redacted.wav."""
+    import soundfile as sf
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    name = name or f"{pair.conversation_id}_{pair.start_time:.2f}-{pair.end_time:.2f}"
+
+    original_path = output_dir / f"{name}_original.wav"
+    redacted_path = output_dir / f"{name}_redacted.wav"
+    sf.write(str(original_path), pair.original, pair.original_sample_rate)
+    sf.write(str(redacted_path), pair.redacted, pair.redacted_sample_rate)
+    return str(original_path), str(redacted_path)
@@ -0,0 +1,142 @@
+"""
+Duration-aware batch scheduling.
+Batches start with the longest recordings: each input's duration is read
+from its file header (no decoding), and files are handed out longest first.
+The pipeline's workers take the next file as soon as they're free, so this
+is longest-processing-time-first list scheduling: a long recording no
+longer arrives at the end of the list to run alone while the other workers
+sit idle.
+
+The same durations drive the progress ETA: remaining audio seconds times the
+real-time factor observed so far.
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .audio_input import probe_audio
+from .config import PROBE_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+def _probe(path: str) -> Optional[float]:
+    """Duration from the header, or None if no decoder can read it."""
+    try:
+        return probe_audio(path).duration
+    except Exception:
+        return None
+
+
+def probe_durations(audio_paths: Sequence[str], workers: int = PROBE_WORKERS) -> List[float]:
+    """
+    Duration of each input in seconds, from the file headers.
+
+    Files no decoder can open (they'll fail when processed) or whose header
+    has no duration are estimated from their size at the median bytes per
+    second of the others, or 0 if there are none.
+
+    Args:
+        audio_paths: Input files
+        workers: Threads reading headers (helps on network storage)
+
+    Returns:
+        Durations in input order
+    """
+    if not audio_paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(workers, len(audio_paths))) as pool:
+        probed = list(pool.map(_probe, audio_paths))
+
+    unknown = [i for i, d in enumerate(probed) if not d]
+    if not unknown:
+        return probed
+
+    sizes = [_size(p) for p in audio_paths]
+    rates = [sizes[i] / d for i, d in enumerate(probed) if d and sizes[i]]
+    bytes_per_s = float(np.median(rates)) if rates else None
+    logger.info(f"No header duration for {len(unknown)} files; estimating from file size")
+    return [
+        d if d else (sizes[i] / bytes_per_s if bytes_per_s else 0.0)
+        for i, d in enumerate(probed)
+    ]
+
+
+def _size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def longest_first(durations: Sequence[float]) -> List[int]:
+    """Indices ordered by duration, longest first (ties keep input order)."""
+    return sorted(range(len(durations)), key=lambda i: -durations[i])
+
+
+def format_duration(seconds: float) -> str:
+    """Compact duration: 1h02m, 3m05s or 12s."""
+    seconds = int(round(seconds))
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class ProgressEstimator:
+    """Batch progress and ETA from the real-time factor observed so far."""
+
+    def __init__(self, durations: Sequence[float]):
+        """
+        Initialize the estimator; the clock starts now.
+
+        Args:
+            durations: Audio seconds of every file in the batch
+        """
+        self.total_files = len(durations)
+        self.total_audio_s = float(sum(durations))
+        self.done_files = 0
+        self.done_audio_s = 0.0
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def done(self, audio_s: float) -> None:
+        """Record a finished file of audio_s seconds."""
+        with self._lock:
+            self.done_files += 1
+            self.done_audio_s += audio_s
+
+    def skip(self, audio_s: float) -> None:
+        """Drop a file that needs no processing (completed in an earlier run)."""
+        with self._lock:
+            self.total_files -= 1
+            self.total_audio_s -= audio_s
+
+    @property
+    def rtf(self) -> Optional[float]:
+        """Wall seconds per audio second so far (None before any audio is done)."""
+        if not self.done_audio_s:
+            return None
+        return (time.perf_counter() - self._started) / self.done_audio_s
+
+    def eta_s(self) -> Optional[float]:
+        """Seconds until the batch finishes at the observed rate."""
+        rtf = self.rtf
+        if rtf is None:
+            return None
+        return rtf * max(self.total_audio_s - self.done_audio_s, 0.0)
+
+    def status(self) -> str:
+        """One-line progress for the log."""
+        rtf, eta = self.rtf, self.eta_s()
+        return (
+            f"{self.done_files}/{self.total_files} files, "
+            f"{format_duration(self.done_audio_s)} of {format_duration(self.total_audio_s)} audio"
+            + (f", RTF {rtf:.2f}, ETA {format_duration(eta)}" if rtf is not None else "")
+        )
@@ -0,0 +1,265 @@
+"""
+Transcript serialization.
+Writes transcripts as compact JSON, streamed straight from the transcript
+objects (no intermediate dict), optionally gzip or zstd compressed.
+Uses orjson for encoding/decoding when it's installed.
+
+Readers should go through read_json() / find_transcript() / iter_json_files(),
+which handle every variant (.json, .json.gz, .json.zst).
+"""
+import gzip
+import json
+import logging
+from pathlib import Path
+from typing import IO, Any, Iterator, List, Optional, Sequence, Union
+
+from .config import (
+    TRANSCRIPT_COMPRESSION,
+    GZIP_LEVEL,
+    ZSTD_LEVEL,
+    DEID_INCLUDE_ORIGINAL_TEXT
+)
+from .output_writer import atomic_path
+from .word_table import WordSlice
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+COMPRESSIONS = ("gzip", "zstd")
+
+# Suffix for each compression setting; readers try them in this order
+TRANSCRIPT_SUFFIXES = {None: ".json", "gzip": ".json.gz", "zstd": ".json.zst"}
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj as compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _zstd():
+    """Import zstandard, which is only needed for .zst files."""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstd compression needs the 'zstandard' package") from None
+    return zstandard
+
+
+def check_compression(compression: Optional[str]) -> None:
+    """Fail early on an unknown compression or a missing zstandard package."""
+    if compression not in TRANSCRIPT_SUFFIXES:
+        raise ValueError(f"Unknown compression: {compression} (use one of {COMPRESSIONS})")
+    if compression == "zstd":
+        _zstd()
+
+
+def _compression_for(path: Path) -> Optional[str]:
+    """Infer compression from a file name."""
+    name = path.name
+    if name.endswith(".gz"):
+        return "gzip"
+    if name.endswith(".zst"):
+        return "zstd"
+    return None
+
+
+def transcript_path(directory: Path, conversation_id: str, compression: Optional[str]) -> Path:
+    """Output path for a transcript with the given compression."""
+    return Path(directory) / f"{conversation_id}{TRANSCRIPT_SUFFIXES[compression]}"
+
+
+def find_transcript(directory: Path, conversation_id: str) -> Optional[Path]:
+    """Find a conversation's transcript in directory, whatever its compression."""
+    for suffix in TRANSCRIPT_SUFFIXES.values():
+        path = Path(directory) / f"{conversation_id}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def iter_json_files(directory: Path) -> Iterator[Path]:
+    """All JSON files (any compression) in directory, sorted by name."""
+    directory = Path(directory)
+    paths = []
+    for suffix in TRANSCRIPT_SUFFIXES.values():
+        paths.extend(p for p in directory.glob(f"*{suffix}") if not p.name.startswith("."))
+    return iter(sorted(paths))
+
+
+def conversation_id_from_path(path: Path) -> str:
+    """Strip .json / .json.gz / .json.zst from a transcript file name."""
+    name = Path(path).name
+    for suffix in sorted(TRANSCRIPT_SUFFIXES.values(), key=len, reverse=True):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return Path(path).stem
+
+
+def open_for_write(path: Path, compression: Optional[str]) -> IO[bytes]:
+    """Open a binary stream that compresses into path."""
+    if compression is None:
+        return open(path, "wb")
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=GZIP_LEVEL)
+    if compression == "zstd":
+        zstandard = _zstd()
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(open(path, "wb"))
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Read a JSON file, decompressing based on its suffix."""
+    path = Path(path)
+    compression = _compression_for(path)
+    if compression == "gzip":
+        with gzip.open(path, "rb") as f:
+            return loads(f.read())
+    if compression == "zstd":
+        zstandard = _zstd()
+        with open(path, "rb") as f:
+            return loads(zstandard.ZstdDecompressor().stream_reader(f).read())
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def _word_chunks(words: Sequence, confidence: bool, token_cache: dict) -> Iterator[str]:
+    """
+    Encode a segment's words. Table-backed slices are read column-wise, with
+    each distinct token encoded once per table (token_cache).
+    """
+    if isinstance(words, WordSlice):
+        table = words.table
+        tokens = token_cache.get(id(table))
+        if tokens is None:
+            tokens = token_cache[id(table)] = [dumps(t).decode("utf-8") for t in table.tokens]
+        ids = table.token_ids[words.start:words.stop].tolist()
+        starts = table.starts[words.start:words.stop].tolist()
+        ends = table.ends[words.start:words.stop].tolist()
+        if confidence:
+            confidences = table.confidences[words.start:words.stop].tolist()
+            for t, s, e, c in zip(ids, starts, ends, confidences):
+                yield f'{{"word":{tokens[t]},"start":{s!r},"end":{e!r},"confidence":{c!r}}}'
+        else:
+            for t, s, e in zip(ids, starts, ends):
+                yield f'{{"word":{tokens[t]},"start":{s!r},"end":{e!r}}}'
+        return
+
+    for w in words:
+        word = dumps(w.word).decode("utf-8")
+        if confidence:
+            yield (f'{{"word":{word},"start":{float(w.start)!r},"end":{float(w.end)!r},'
+                   f'"confidence":{float(w.confidence)!r}}}')
+        else:
+            yield f'{{"word":{word},"start":{float(w.start)!r},"end":{float(w.end)!r}}}'
+
+
+def _segment_chunks(segments: Sequence, confidence: bool) -> Iterator[str]:
+    """Encode a list of segments, one segment per chunk."""
+    token_cache: dict = {}
+    yield "["
+    for i, seg in enumerate(segments):
+        channel = f',"channel":{seg.channel}' if seg.channel is not None else ""
+        yield (
+            f'{"," if i else ""}{{"text":{dumps(seg.text).decode("utf-8")},'
+            f'"start":{float(seg.start)!r},"end":{float(seg.end)!r},'
+            f'"words":[{",".join(_word_chunks(seg.words, confidence, token_cache))}]{channel}}}'
+        )
+    yield "]"
+
+
+def _field(name: str, value: Any) -> str:
+    return f'"{name}":{dumps(value).decode("utf-8")}'
+
+
+def iter_transcript_json(transcript: Any, include_original_text: bool = True) -> Iterator[str]:
+    """
+    Encode a TranscriptionResult or RedactedTranscript as compact JSON chunks.
+    Produces the same document as json.dumps(transcript.to_dict()), except that
+    a redacted transcript can leave out original_text.
+    """
+    if hasattr(transcript, "redaction_logs"):
+        head = [_field("conversation_id", transcript.conversation_id)]
+        if include_original_text:
+            head.append(_field("original_text", transcript.original_text))
+        head.append(_field("redacted_text", transcript.redacted_text))
+        yield "{" + ",".join(head) + ',"segments":'
+        yield from _segment_chunks(transcript.redacted_segments, confidence=False)
+
+        yield ',"redactions":['
+        for i, log in enumerate(transcript.redaction_logs):
+            yield (
+                f'{"," if i else ""}{{{_field("original", log.original_text)},'
+                f'{_field("replacement", log.replacement)},{_field("category", log.category)},'
+                f'"start_time":{float(log.start_time)!r},"end_time":{float(log.end_time)!r},'
+                f'"confidence":{float(log.confidence)!r},'
+                f'"is_fuzzy":{"true" if log.is_fuzzy else "false"}}}'
+            )
+        yield f'],"pii_count":{len(transcript.redaction_logs)}}}'
+        return
+
+    yield "{" + ",".join([
+        _field("conversation_id", transcript.conversation_id),
+        _field("audio_path", transcript.audio_path),
+        _field("audio_duration", transcript.audio_duration),
+        _field("language", transcript.language),
+        _field("language_probability", transcript.language_probability),
+    ]) + ',"segments":'
+    yield from _segment_chunks(transcript.segments, confidence=True)
+    yield "}"
+
+
+def write_transcript(
+    directory: Path,
+    transcript: Any,
+    compression: Optional[str] = TRANSCRIPT_COMPRESSION,
+    include_original_text: bool = DEID_INCLUDE_ORIGINAL_TEXT
+) -> Path:
+    """
+    Stream a transcript to <directory>/<conversation_id>.json[.gz|.zst].
+    Written under a temp name and renamed into place when complete.
+
+    Args:
+        directory: Output directory
+        transcript: TranscriptionResult or RedactedTranscript
+        compression: None, "gzip" or "zstd"
+        include_original_text: Keep original_text in redacted transcripts
+            (it duplicates the raw transcript)
+
+    Returns:
+        Path of the written file
+    """
+    path = transcript_path(directory, transcript.conversation_id, compression)
+    with atomic_path(path) as tmp:
+        with open_for_write(tmp, compression) as f:
+            for chunk in iter_transcript_json(transcript, include_original_text):
+                f.write(chunk.encode("utf-8"))
+    return path
+
+
+def transcript_text(data: dict) -> str:
+    """Full text of a loaded raw transcript."""
+    return " ".join(seg["text"].strip() for seg in data.get("segments", []))
+
+
+def remove_stale_variants(directory: Path, conversation_id: str, keep: Path) -> List[Path]:
+    """Delete a conversation's transcripts in other compressions than keep."""
+    removed = []
+    for suffix in TRANSCRIPT_SUFFIXES.values():
+        path = Path(directory) / f"{conversation_id}{suffix}"
+        if path != keep and path.exists():
+            path.unlink()
+            removed.append(path)
+    return removed
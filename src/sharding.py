@@ -0,0 +1,321 @@
+"""
+Deterministic sharding for multi-node batches.
+Each node runs with --shard i/N and processes the conversations whose id
+hashes to shard i, so N nodes started against the same input directory and
+shared output directory split the work without coordinating. Per-conversation
+outputs never collide; the batch-level files (manifest, report, journal,
+word exports) get a shard suffix:
+
+    metadata/manifest.shard-0-of-4.json
+    qa/processing_report.shard-0-of-4.json
+
+merge_shards() combines the shard manifests and reports into the usual
+metadata/manifest.json and qa/processing_report.json.
+"""
+import hashlib
+import logging
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .output_writer import write_json_atomic, write_json_rows_atomic
+from .serialization import read_json
+from .timing import WORD_STAGES, percentiles
+from .verify_policy import summarize_decisions
+
+logger = logging.getLogger(__name__)
+
+Shard = Tuple[int, int]  # (index, count), index in [0, count)
+
+_SHARD_FILE = re.compile(
+    r"^(?P<stem>.+)\.shard-(?P<index>\d+)-of-(?P<count>\d+)(?P<suffix>\.[^.]+)$"
+)
+
+
+def parse_shard(spec: str) -> Shard:
+    """Parse "i/N" (0 <= i < N) into (i, N)."""
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard {spec!r} (expected i/N, e.g. 0/4)") from None
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard {spec!r} (need 0 <= i < N)")
+    return index, count
+
+
+def shard_of(conversation_id: str, count: int) -> int:
+    """Shard a conversation belongs to (stable across machines and runs)."""
+    digest = hashlib.sha256(conversation_id.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count
+
+
+def select_shard(audio_paths: Sequence[str], shard: Shard) -> List[str]:
+    """The paths whose conversation id (file stem) falls in shard, in input order."""
+    index, count = shard
+    return [p for p in audio_paths if shard_of(Path(p).stem, count) == index]
+
+
+def shard_label(shard: Shard) -> str:
+    """Shard label used in file and directory names (shard-0-of-4)."""
+    return f"shard-{shard[0]}-of-{shard[1]}"
+
+
+def shard_name(name: str, shard: Optional[Shard]) -> str:
+    """File name with the shard label before its extension ("manifest.shard-0-of-4.json")."""
+    if shard is None:
+        return name
+    path = Path(name)
+    return f"{path.stem}.{shard_label(shard)}{path.suffix}"
+
+
+def find_shard_files(directory: Path, name: str) -> Dict[Shard, Path]:
+    """Shard variants of name in directory, by (index, count)."""
+    stem, suffix = Path(name).stem, Path(name).suffix
+    found = {}
+    for path in Path(directory).glob(f"{stem}.shard-*{suffix}"):
+        match = _SHARD_FILE.match(path.name)
+        if match and match["stem"] == stem and match["suffix"] == suffix:
+            found[(int(match["index"]), int(match["count"]))] = path
+    return found
+
+
+def _add_counts(total: Dict[str, int], counts: Dict[str, int]) -> None:
+    for key, value in counts.items():
+        total[key] = total.get(key, 0) + value
+
+
+def _merge_stage_metrics(shard_metrics: List[Optional[Dict[str, Any]]]) -> Optional[Dict]:
+    """Staged executor metrics summed over the shards that ran staged."""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for metrics in shard_metrics:
+        for name, m in (metrics or {}).items():
+            total = merged.setdefault(name, {
+                "workers": 0, "items": 0, "busy_s": 0.0, "max_queue_depth": 0,
+                "mean_queue_depth": 0.0
+            })
+            total["workers"] += m["workers"]
+            total["busy_s"] = round(total["busy_s"] + m["busy_s"], 3)
+            total["max_queue_depth"] = max(total["max_queue_depth"], m["max_queue_depth"])
+            # Weighted by items; divided out below
+            total["mean_queue_depth"] += m["mean_queue_depth"] * m["items"]
+            total["items"] += m["items"]
+    for total in merged.values():
+        items = total["items"]
+        total["mean_queue_depth"] = round(total["mean_queue_depth"] / items, 2) if items else 0.0
+    return merged or None
+
+
+def _merge_stages(
+    shard_stages: List[Dict[str, Dict[str, Any]]],
+    stage_timings: Dict[str, Dict[str, float]],
+    durations: Dict[str, float]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-stage statistics over all shards: totals and throughput from the
+    shard totals, percentiles recomputed from the per-conversation timings.
+    Per-file RTF percentiles cover the conversations in the manifest (the
+    successful ones), since only those have a recorded duration.
+    """
+    totals: Dict[str, Dict[str, float]] = {}
+    for stages in shard_stages:
+        for stage, shard_stats in stages.items():
+            total = totals.setdefault(stage, {"files": 0, "audio_s": 0.0, "total_s": 0.0,
+                                              "words": 0, "bytes": 0})
+            for key in total:
+                total[key] += shard_stats.get(key, 0) or 0
+
+    merged = {}
+    for stage, total in totals.items():
+        rows = [(t[stage], durations.get(cid, 0.0)) for cid, t in stage_timings.items()
+                if stage in t]
+        seconds = np.array([s for s, _ in rows], dtype=np.float64)
+        audio = np.array([a for _, a in rows], dtype=np.float64)
+        total_s, total_audio = total["total_s"], total["audio_s"]
+        stats: Dict[str, Any] = {
+            "files": int(total["files"]),
+            "audio_s": round(total_audio, 3),
+            "total_s": round(total_s, 4),
+            "mean_s": round(total_s / total["files"], 4) if total["files"] else None,
+            **{f"{k}_s": v for k, v in percentiles(seconds).items()},
+            "rtf": round(total_s / total_audio, 4) if total_audio else None,
+            **{
+                f"rtf_{k}": v
+                for k, v in percentiles(seconds[audio > 0] / audio[audio > 0]).items()
+            },
+        }
+        if stage in WORD_STAGES:
+            stats["words"] = int(total["words"])
+            stats["words_per_s"] = round(total["words"] / total_s, 1) if total_s else None
+        if total["bytes"]:
+            stats["bytes"] = int(total["bytes"])
+            stats["bytes_per_s"] = round(total["bytes"] / total_s, 1) if total_s else None
+        merged[stage] = stats
+    return merged
+
+
+def merge_reports(
+    reports: Dict[Shard, Dict[str, Any]],
+    manifest_rows: List[Dict[str, Any]],
+    missing: Sequence[int] = ()
+) -> Dict[str, Any]:
+    """
+    Combine shard processing reports into one.
+
+    Args:
+        reports: Shard report by (index, count)
+        manifest_rows: Merged manifest (for per-file durations)
+        missing: Shard indices with no report
+
+    Returns:
+        Report in the processing_report.json layout, plus a "shards" section
+    """
+    summary = {"total_conversations": 0, "successful": 0, "failed": 0,
+               "total_duration_sec": 0.0, "total_pii_redacted": 0}
+    status_counts: Dict[str, int] = {}
+    methods: Dict[str, int] = {}
+    spectral_flagged = 0
+    lag_total, lag_samples, lag_max, pending = 0.0, 0, None, 0
+    resumed: Dict[str, int] = {}
+    earlier_runs = 0
+    decisions: Dict[str, int] = {}
+    audit_failures = 0
+    failures: List[Dict[str, Any]] = []
+    processing_times: Dict[str, float] = {}
+    stage_timings: Dict[str, Dict[str, float]] = {}
+    audio_modes: Dict[str, Optional[str]] = {}
+    batch: Dict[str, Any] = {"files": 0, "audio_s": 0.0, "wall_s": None, "node_s": 0.0}
+
+    for shard in sorted(reports):
+        report = reports[shard]
+        for key in summary:
+            summary[key] += report["summary"][key]
+        _add_counts(status_counts, report["verification_status"])
+        _add_counts(methods, report["audio_verification"]["methods"])
+        spectral_flagged += report["audio_verification"]["spectral_flagged"]
+
+        lag = report["verification_lag_s"]
+        samples = lag.get("samples", 0)
+        if samples and lag["mean"] is not None:
+            lag_total += lag["mean"] * samples
+            lag_samples += samples
+        if lag["max"] is not None:
+            lag_max = lag["max"] if lag_max is None else max(lag_max, lag["max"])
+        pending += lag["pending"]
+
+        _add_counts(resumed, report["resume"]["resumed_from"])
+        earlier_runs += report["resume"]["earlier_runs"]
+        _add_counts(decisions, report["verification_policy"]["decisions"])
+        audit_failures += report["verification_policy"]["audit_failures"]
+
+        shard_batch = report["performance"]["batch"]
+        batch["files"] += shard_batch["files"]
+        batch["audio_s"] += shard_batch["audio_s"]
+        if shard_batch["wall_s"] is not None:
+            # Shards run side by side: the batch takes as long as the slowest one
+            batch["wall_s"] = max(batch["wall_s"] or 0.0, shard_batch["wall_s"])
+            batch["node_s"] += shard_batch["wall_s"]
+
+        failures.extend(report["failures"])
+        processing_times.update(report["processing_times"])
+        stage_timings.update(report["stage_timings"])
+        audio_modes.update(report["audio_modes"])
+
+    durations = {row["conversation_id"]: row["duration_sec"] for row in manifest_rows}
+    wall_s = batch["wall_s"]
+    total_duration = summary["total_duration_sec"]
+    shard_reports = [reports[s] for s in sorted(reports)]
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "summary": {
+            **summary,
+            "total_duration_sec": round(total_duration, 1),
+            "total_duration_min": round(total_duration / 60, 1)
+        },
+        "verification_status": status_counts,
+        "audio_verification": {"methods": methods, "spectral_flagged": spectral_flagged},
+        "verification_lag_s": {
+            "mean": round(lag_total / lag_samples, 3) if lag_samples else None,
+            "max": lag_max,
+            "samples": lag_samples,
+            "pending": pending
+        },
+        "stage_metrics": _merge_stage_metrics([r["stage_metrics"] for r in shard_reports]),
+        "performance": {
+            "clock": "perf_counter",
+            "batch": {
+                "files": batch["files"],
+                "audio_s": round(batch["audio_s"], 3),
+                "wall_s": wall_s,
+                "node_s": round(batch["node_s"], 3),
+                "rtf": round(wall_s / batch["audio_s"], 4) if wall_s and batch["audio_s"] else None
+            },
+            "processing_s": percentiles(
+                [t for cid, t in processing_times.items() if cid in stage_timings]
+            ),
+            "stages": _merge_stages(
+                [r["performance"]["stages"] for r in shard_reports], stage_timings, durations
+            )
+        },
+        "resume": {"resumed_from": resumed, "earlier_runs": earlier_runs},
+        "verification_policy": summarize_decisions(decisions, audit_failures),
+        "shards": {
+            "count": next(iter(reports))[1] if reports else None,
+            "merged": sorted(index for index, _ in reports),
+            "missing": list(missing)
+        },
+        "failures": failures,
+        "processing_times": processing_times,
+        "stage_timings": stage_timings,
+        "audio_modes": audio_modes
+    }
+
+
+def merge_shards(output_dir: Path, count: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Merge the shard manifests and reports under output_dir into
+    metadata/manifest.json and qa/processing_report.json.
+
+    Args:
+        output_dir: Pipeline output directory shared by the shards
+        count: Number of shards (default: the one shard count found on disk)
+
+    Returns:
+        The merged report
+    """
+    output_dir = Path(output_dir)
+    manifests = find_shard_files(output_dir / "metadata", "manifest.json")
+    reports = find_shard_files(output_dir / "qa", "processing_report.json")
+
+    counts = {c for _, c in list(manifests) + list(reports)}
+    if count is None:
+        if not counts:
+            raise ValueError(f"No shard manifests or reports under {output_dir}")
+        if len(counts) > 1:
+            raise ValueError(
+                f"Shard outputs for several shard counts {sorted(counts)} under "
+                f"{output_dir}; pass the shard count"
+            )
+        count = counts.pop()
+    manifests = {s: p for s, p in manifests.items() if s[1] == count}
+    reports = {s: p for s, p in reports.items() if s[1] == count}
+
+    missing = [i for i in range(count) if (i, count) not in reports]
+    if missing:
+        logger.warning(f"No report for shards {missing} of {count}; merging the rest")
+
+    rows = []
+    for shard in sorted(manifests):
+        rows.extend(read_json(manifests[shard]))
+    rows.sort(key=lambda row: row["conversation_id"])
+
+    report = merge_reports({s: read_json(p) for s, p in reports.items()}, rows, missing)
+
+    write_json_rows_atomic(output_dir / "metadata" / "manifest.json", rows)
+    write_json_atomic(output_dir / "qa" / "processing_report.json", report)
+    logger.info(
+        f"Merged {len(reports)} of {count} shards: {len(rows)} conversations in the manifest"
+    )
+    return report
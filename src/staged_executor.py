@@ -0,0 +1,172 @@
+"""
+Stage-pipelined executor.
+Runs items through a fixed sequence of stages, each with its own worker
+threads, connected by bounded queues. Different items occupy different
+stages at the same time, and a full queue blocks the stage feeding it, so a
+slow stage throttles the ones before it instead of piling up work in memory.
+
+Stage functions mutate the item they're given; items come back in input order.
+"""
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()  # End-of-input marker, one per worker
+
+
+@dataclass
+class Stage:
+    """One stage: a function applied to each item, on `workers` threads."""
+    name: str
+    fn: Callable[[Any], None]
+    workers: int = 1
+
+
+@dataclass
+class StageMetrics:
+    """Counters for one stage, filled in while the executor runs."""
+    name: str
+    workers: int
+    items: int = 0
+    busy_s: float = 0.0
+    max_queue_depth: int = 0
+    _depth_total: int = 0
+
+    def record(self, depth: int, busy_s: float) -> None:
+        """Record one item: the queue depth it left behind and its run time."""
+        self.items += 1
+        self.busy_s += busy_s
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+        self._depth_total += depth
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "workers": self.workers,
+            "items": self.items,
+            "busy_s": round(self.busy_s, 3),
+            "max_queue_depth": self.max_queue_depth,
+            "mean_queue_depth": round(self._depth_total / self.items, 2) if self.items else 0.0
+        }
+
+
+class StagedExecutor:
+    """Runs items through stages with per-stage worker pools and bounded queues."""
+
+    def __init__(
+        self,
+        stages: List[Stage],
+        queue_size: int,
+        on_error: Optional[Callable[[Any, str, BaseException], None]] = None
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            stages: Stages in order
+            queue_size: Capacity of the queue in front of each stage
+            on_error: Called with (item, stage name, exception) when a stage
+                function raises; the item still moves on to the next stage
+        """
+        self.stages = stages
+        self.queue_size = queue_size
+        self.on_error = on_error
+        self.metrics: Dict[str, StageMetrics] = {}
+
+    def run(self, items: Iterable[Any], collect: bool = True) -> List[Any]:
+        """
+        Push items through every stage and wait for all of them.
+
+        Args:
+            items: Items to process (consumed lazily, as the first queue has room)
+            collect: Keep the finished items and return them; without it an
+                item is dropped after its last stage
+
+        Returns:
+            The items in input order (empty without collect)
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        self.metrics = {s.name: StageMetrics(s.name, s.workers) for s in self.stages}
+        results: Dict[int, Any] = {}
+        results_lock = threading.Lock()
+        threads = []
+
+        for k, stage in enumerate(self.stages):
+            remaining = [stage.workers]  # Workers of this stage still running
+            lock = threading.Lock()
+            for w in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(k, queues, remaining, lock, results if collect else None, results_lock),
+                    name=f"stage-{stage.name}-{w}",
+                    daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+
+        count = 0
+        try:
+            for count, item in enumerate(items, 1):
+                queues[0].put((count - 1, item))  # Blocks while the first stage is backed up
+        finally:
+            # Even if items raised: let the items already queued finish, so no
+            # worker is left running after run() returns
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+
+        return [results[i] for i in range(count)] if collect else []
+
+    def _worker(
+        self,
+        k: int,
+        queues: List[queue.Queue],
+        remaining: List[int],
+        lock: threading.Lock,
+        results: Optional[Dict[int, Any]],
+        results_lock: threading.Lock
+    ) -> None:
+        """Take items from stage k's queue, run the stage, pass them on."""
+        stage = self.stages[k]
+        metrics = self.metrics[stage.name]
+        last = k == len(self.stages) - 1
+
+        while True:
+            entry = queues[k].get()
+            if entry is _DONE:
+                break
+            index, item = entry
+            depth = queues[k].qsize()
+
+            started = time.perf_counter()
+            try:
+                stage.fn(item)
+            except Exception as e:
+                logger.error(f"Stage {stage.name} failed: {e}")
+                if self.on_error is not None:
+                    self.on_error(item, stage.name, e)
+            busy = time.perf_counter() - started
+
+            with lock:
+                metrics.record(depth, busy)
+
+            if last:
+                if results is not None:
+                    with results_lock:
+                        results[index] = item
+            else:
+                queues[k + 1].put((index, item))
+
+        # The last worker out tells the next stage there's nothing more coming
+        with lock:
+            remaining[0] -= 1
+            finished = remaining[0] == 0
+        if finished and not last:
+            for _ in range(self.stages[k + 1].workers):
+                queues[k + 1].put(_DONE)
@@ -1,13 +1,15 @@
 """
 Text redaction - replaces PII in transcripts with labels like [CITY], [STATE], [DAY].
 """
+import heapq
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from .config import PIIMatch, WordTimestamp
 from .lexicon import CATEGORY_LABELS
 from .transcriber import TranscriptionResult, TranscriptionSegment
+from .word_table import word_dicts, word_strings
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,9 @@ class RedactedTranscript:
     redacted_text: str
     redacted_segments: List[TranscriptionSegment]
     redaction_logs: List[RedactionLog]
+    # (start, end) character offsets of each label in redacted_text,
+    # or None if unknown (verification then scans the whole text)
+    label_spans: Optional[List[Tuple[int, int]]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -44,10 +49,8 @@ class RedactedTranscript:
                     "text": seg.text,
                     "start": seg.start,
                     "end": seg.end,
-                    "words": [
-                        {"word": w.word, "start": w.start, "end": w.end}
-                        for w in seg.words
-                    ]
+                    "words": word_dicts(seg.words, confidence=False),
+                    **({"channel": seg.channel} if seg.channel is not None else {})
                 }
                 for seg in self.redacted_segments
             ],
@@ -89,58 +92,87 @@ class TextRedactor:
         Returns:
             RedactedTranscript with original and redacted text
         """
-        # Build set of word indices to redact
-        word_to_match: Dict[int, PIIMatch] = {}
-        for match in pii_matches:
-            for idx in match.word_indices:
-                word_to_match[idx] = match
-
-        # Get all words
-        all_words = transcript.get_all_words()
+        # Walk segments and matches together, in word order. The detector
+        # never returns overlapping matches, so one cursor into each is enough.
+        matches = sorted(
+            (m for m in pii_matches if m.word_indices),
+            key=lambda m: m.word_indices[0]
+        )
 
-        # Process segments
         redacted_segments = []
         redaction_logs = []
+        original_parts = []
+        redacted_parts = []
+        label_spans = []
+        text_offset = 0  # Where the current segment starts in the redacted full text
 
-        global_word_idx = 0
+        next_match = 0
+        skip_to = 0     # Words before this index belong to an already placed match
+        seg_start = 0   # Global index of the segment's first word
 
         for segment in transcript.segments:
+            seg_end = seg_start + len(segment.words)
+            original_parts.append(segment.text.strip())
+
+            untouched = skip_to <= seg_start and (
+                next_match == len(matches)
+                or matches[next_match].word_indices[0] >= seg_end
+            )
+            if untouched:
+                # No PII in this segment: reuse it as is
+                redacted_segments.append(segment)
+                redacted_parts.append(segment.text)
+                text_offset += len(segment.text) + 1
+                seg_start = seg_end
+                continue
+
             redacted_words = []
             redacted_word_timestamps = []
-
-            for word_ts in segment.words:
-                if global_word_idx in word_to_match:
-                    match = word_to_match[global_word_idx]
-
-                    # Only replace on first word of multi-word match
-                    if global_word_idx == match.word_indices[0]:
-                        label = self.labels.get(match.category, f"[{match.category.upper()}]")
-                        redacted_words.append(label)
-
-                        # Create a word timestamp for the label
-                        redacted_word_timestamps.append(WordTimestamp(
-                            word=label,
-                            start=match.start_time,
-                            end=match.end_time,
-                            confidence=match.confidence
-                        ))
-
-                        # Log the redaction
-                        redaction_logs.append(RedactionLog(
-                            original_text=match.text,
-                            replacement=label,
-                            category=match.category,
-                            start_time=match.start_time,
-                            end_time=match.end_time,
-                            confidence=match.confidence,
-                            is_fuzzy=match.is_fuzzy
-                        ))
-                    # Skip subsequent words in multi-word match
-                else:
-                    redacted_words.append(word_ts.word)
-                    redacted_word_timestamps.append(word_ts)
-
-                global_word_idx += 1
+            pos = max(skip_to, seg_start)
+            line_len = 0  # Characters so far in this segment, one space after each word
+
+            while next_match < len(matches) and matches[next_match].word_indices[0] < seg_end:
+                match = matches[next_match]
+                first = match.word_indices[0]
+
+                # Copy the words before the match
+                before = segment.words[pos - seg_start:max(pos, first) - seg_start]
+                before_words = word_strings(before)
+                redacted_words.extend(before_words)
+                redacted_word_timestamps.extend(before)
+                line_len += sum(map(len, before_words)) + len(before_words)
+
+                # Replace the whole match (possibly multi-word) with one label
+                label = self.labels.get(match.category, f"[{match.category.upper()}]")
+                redacted_words.append(label)
+                label_spans.append((text_offset + line_len, text_offset + line_len + len(label)))
+                line_len += len(label) + 1
+                redacted_word_timestamps.append(WordTimestamp(
+                    word=label,
+                    start=match.start_time,
+                    end=match.end_time,
+                    confidence=match.confidence
+                ))
+
+                # Log the redaction
+                redaction_logs.append(RedactionLog(
+                    original_text=match.text,
+                    replacement=label,
+                    category=match.category,
+                    start_time=match.start_time,
+                    end_time=match.end_time,
+                    confidence=match.confidence,
+                    is_fuzzy=match.is_fuzzy
+                ))
+
+                # A match can run into the next segment
+                pos = max(pos, match.word_indices[-1] + 1)
+                next_match += 1
+
+            after = segment.words[min(pos, seg_end) - seg_start:]
+            redacted_words.extend(word_strings(after))
+            redacted_word_timestamps.extend(after)
+            skip_to = pos
 
             # Create redacted segment
             redacted_text = " ".join(redacted_words)
@@ -148,19 +180,24 @@ class TextRedactor:
                 text=redacted_text,
                 start=segment.start,
                 end=segment.end,
-                words=redacted_word_timestamps
+                words=redacted_word_timestamps,
+                channel=segment.channel
             ))
+            redacted_parts.append(redacted_text)
+            text_offset += len(redacted_text) + 1
+            seg_start = seg_end
 
         # Build full texts
-        original_text = transcript.get_full_text()
-        redacted_full_text = " ".join(seg.text for seg in redacted_segments)
+        original_text = " ".join(original_parts)
+        redacted_full_text = " ".join(redacted_parts)
 
         result = RedactedTranscript(
             conversation_id=transcript.conversation_id,
             original_text=original_text,
             redacted_text=redacted_full_text,
             redacted_segments=redacted_segments,
-            redaction_logs=redaction_logs
+            redaction_logs=redaction_logs,
+            label_spans=label_spans
         )
 
         logger.info(
@@ -170,6 +207,31 @@ class TextRedactor:
         return result
 
 
+def merge_redacted_transcripts(
+    transcript: TranscriptionResult,
+    parts: List[RedactedTranscript]
+) -> RedactedTranscript:
+    """
+    Combine per-channel redacted transcripts into one, in time order.
+
+    Args:
+        transcript: The merged raw transcript (for the original text)
+        parts: Redacted transcript for each channel
+    """
+    segments = list(heapq.merge(*(p.redacted_segments for p in parts), key=lambda s: s.start))
+    logs = list(heapq.merge(*(p.redaction_logs for p in parts), key=lambda log: log.start_time))
+
+    # label_spans stays unset: interleaving channels moves every offset, so
+    # verification falls back to scanning the whole merged text
+    return RedactedTranscript(
+        conversation_id=transcript.conversation_id,
+        original_text=transcript.get_full_text(),
+        redacted_text=" ".join(seg.text for seg in segments),
+        redacted_segments=segments,
+        redaction_logs=logs
+    )
+
+
 def redact_text(
     transcript: TranscriptionResult,
     pii_matches: List[PIIMatch]
@@ -0,0 +1,119 @@
+"""
+Stage timing and throughput statistics for the processing report.
+Stages are timed with time.perf_counter() (monotonic, high resolution) and
+summarized per stage across the batch:
+
+- total and p50/p95/p99 seconds per file
+- real-time factor (stage seconds / audio seconds; below 1 is faster than real time)
+- words/sec for the text stages, bytes/sec for the stages that read or write audio
+
+StageStats accumulates these one conversation at a time. The percentiles need
+every sample, so it keeps each conversation's seconds and audio duration per
+stage (two floats in a flat array) rather than the conversation outputs.
+"""
+import time
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+from .config import REPORT_PERCENTILES
+
+# Stages whose throughput is reported in words/sec
+WORD_STAGES = ("detection", "text_redaction", "verify_text")
+
+
+@contextmanager
+def timed(timings: Optional[Dict[str, float]], stage: str) -> Iterator[None]:
+    """Add the time spent in the block to timings[stage] (nothing if timings is None)."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - started
+
+
+def percentiles(
+    values: Union[Sequence[float], np.ndarray],
+    points: Sequence[int] = REPORT_PERCENTILES
+) -> Dict[str, Optional[float]]:
+    """{"p50": ..., "p95": ..., ...} of values (linear interpolation)."""
+    if not len(values):
+        return {f"p{p}": None for p in points}
+    result = np.percentile(np.asarray(values, dtype=np.float64), points)
+    return {f"p{p}": round(float(v), 4) for p, v in zip(points, result)}
+
+
+@dataclass
+class _StageColumn:
+    """One stage's per-file seconds and audio durations, and running totals."""
+    seconds: array = field(default_factory=lambda: array("d"))
+    audio: array = field(default_factory=lambda: array("d"))
+    words: int = 0
+    bytes: int = 0
+
+
+class StageStats:
+    """Per-stage statistics, accumulated one conversation at a time."""
+
+    def __init__(self):
+        self._stages: Dict[str, _StageColumn] = {}
+
+    def add(
+        self,
+        timings: Dict[str, float],
+        io_bytes: Dict[str, int],
+        audio_s: float,
+        words: int
+    ) -> None:
+        """
+        Add one conversation.
+
+        Args:
+            timings: Stage -> seconds
+            io_bytes: Stage -> bytes read + written
+            audio_s: Audio duration in seconds
+            words: Words in the raw transcript
+        """
+        for stage, seconds in timings.items():
+            column = self._stages.get(stage)
+            if column is None:
+                column = self._stages[stage] = _StageColumn()
+            column.seconds.append(seconds)
+            column.audio.append(audio_s)
+            column.words += words
+            column.bytes += io_bytes.get(stage, 0)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Dict of stage name to statistics, in order of first appearance."""
+        summary = {}
+        for stage, column in self._stages.items():
+            seconds = np.frombuffer(column.seconds, dtype=np.float64)
+            audio = np.frombuffer(column.audio, dtype=np.float64)
+            files = len(seconds)
+            total_s = float(seconds.sum())
+            total_audio = float(audio.sum())
+
+            stats: Dict[str, Any] = {
+                "files": files,
+                "audio_s": round(total_audio, 3),
+                "total_s": round(total_s, 4),
+                "mean_s": round(total_s / files, 4),
+                **{f"{k}_s": v for k, v in percentiles(seconds).items()},
+                "rtf": round(total_s / total_audio, 4) if total_audio else None,
+                **{
+                    f"rtf_{k}": v
+                    for k, v in percentiles(seconds[audio > 0] / audio[audio > 0]).items()
+                },
+            }
+            if stage in WORD_STAGES:
+                stats["words"] = column.words
+                stats["words_per_s"] = round(column.words / total_s, 1) if total_s else None
+            if column.bytes:
+                stats["bytes"] = column.bytes
+                stats["bytes_per_s"] = round(column.bytes / total_s, 1) if total_s else None
+            summary[stage] = stats
+        return summary
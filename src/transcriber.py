@@ -4,17 +4,28 @@ Chose faster-whisper over WhisperX for better Apple Silicon support.
 Provides word-level timestamps needed for audio redaction.
 """
 import os
+import glob
+import json
 import logging
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Sequence
+from dataclasses import dataclass, field
+import heapq
+
+import numpy as np
 
 # Suppress duplicate library warnings
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
 
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, decode_audio
 
+from .audio_input import open_audio
+from .journal import source_fingerprint
+from .word_table import WordTable, word_dicts
 from .config import (
+    SAMPLE_RATE,
+    AUDIO_BLOCK_FRAMES,
     WHISPER_MODEL,
     WHISPER_DEVICE,
     WHISPER_COMPUTE_TYPE,
@@ -32,7 +43,39 @@ class TranscriptionSegment:
     text: str
     start: float
     end: float
-    words: List[WordTimestamp]
+    words: Sequence[WordTimestamp]  # A WordSlice once the segment is in a TranscriptionResult
+    channel: Optional[int] = None  # Source channel in per-channel mode
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        data = {
+            "text": self.text,
+            "start": self.start,
+            "end": self.end,
+            "words": word_dicts(self.words)
+        }
+        if self.channel is not None:
+            data["channel"] = self.channel
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TranscriptionSegment":
+        """Rebuild a segment from its dictionary form."""
+        return cls(
+            text=data["text"],
+            start=data["start"],
+            end=data["end"],
+            words=[
+                WordTimestamp(
+                    word=w["word"],
+                    start=w["start"],
+                    end=w["end"],
+                    confidence=w.get("confidence", 1.0)
+                )
+                for w in data["words"]
+            ],
+            channel=data.get("channel")
+        )
 
 
 @dataclass
@@ -44,13 +87,20 @@ class TranscriptionResult:
     segments: List[TranscriptionSegment]
     language: str
     language_probability: float
+    words: WordTable = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Move all words into one columnar table; segments become views into it."""
+        self.words = WordTable.from_words(w for seg in self.segments for w in seg.words)
+        start = 0
+        for seg in self.segments:
+            stop = start + len(seg.words)
+            seg.words = self.words[start:stop]
+            start = stop
 
-    def get_all_words(self) -> List[WordTimestamp]:
-        """Get all words from all segments."""
-        all_words = []
-        for segment in self.segments:
-            all_words.extend(segment.words)
-        return all_words
+    def get_all_words(self) -> WordTable:
+        """Get all words from all segments (a view, not a copy)."""
+        return self.words
 
     def get_full_text(self) -> str:
         """Get the full transcript text."""
@@ -64,20 +114,21 @@ class TranscriptionResult:
             "audio_duration": self.audio_duration,
             "language": self.language,
             "language_probability": self.language_probability,
-            "segments": [
-                {
-                    "text": seg.text,
-                    "start": seg.start,
-                    "end": seg.end,
-                    "words": [
-                        {"word": w.word, "start": w.start, "end": w.end, "confidence": w.confidence}
-                        for w in seg.words
-                    ]
-                }
-                for seg in self.segments
-            ]
+            "segments": [seg.to_dict() for seg in self.segments]
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TranscriptionResult":
+        """Rebuild a transcript from its dictionary form (e.g. a saved raw transcript)."""
+        return cls(
+            conversation_id=data["conversation_id"],
+            audio_path=data["audio_path"],
+            audio_duration=data["audio_duration"],
+            segments=[TranscriptionSegment.from_dict(seg) for seg in data["segments"]],
+            language=data["language"],
+            language_probability=data["language_probability"]
+        )
+
 
 class Transcriber:
     """Transcribes audio files using faster-whisper with word timestamps."""
@@ -86,7 +137,9 @@ class Transcriber:
         self,
         model_size: str = WHISPER_MODEL,
         device: str = WHISPER_DEVICE,
-        compute_type: str = WHISPER_COMPUTE_TYPE
+        compute_type: str = WHISPER_COMPUTE_TYPE,
+        checkpoint_dir: Optional[str] = None,
+        num_workers: int = 1
     ):
         """
         Initialize the transcriber.
@@ -95,15 +148,28 @@ class Transcriber:
             model_size: Whisper model size (tiny, base, small, medium, large-v3)
             device: Device to use (auto, cpu, cuda, mps)
             compute_type: Compute type (float16, float32, int8)
+            checkpoint_dir: Directory for per-conversation segment checkpoints
+                (None disables checkpointing)
+            num_workers: Concurrent transcribe() calls the model runs in
+                parallel (e.g. one per channel in multi-channel mode)
         """
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+        self.num_workers = num_workers
         self._model: Optional[WhisperModel] = None
+        self._model_lock = threading.Lock()
 
     def _get_model(self) -> WhisperModel:
-        """Lazy-load the Whisper model."""
-        if self._model is None:
+        """Lazy-load the Whisper model (once, even when called from several threads)."""
+        if self._model is not None:
+            return self._model
+
+        with self._model_lock:
+            if self._model is not None:
+                return self._model
+
             logger.info(f"Loading Whisper model: {self.model_size}")
 
             # Determine device and compute type
@@ -129,17 +195,19 @@ class Transcriber:
             self._model = WhisperModel(
                 self.model_size,
                 device=device,
-                compute_type=compute_type
+                compute_type=compute_type,
+                num_workers=self.num_workers
             )
 
-        return self._model
+            return self._model
 
-    def transcribe(self, audio_path: str) -> TranscriptionResult:
+    def transcribe(self, audio_path: str, channel: Optional[int] = None) -> TranscriptionResult:
         """
         Transcribe an audio file.
 
         Args:
             audio_path: Path to the audio file (WAV, 16kHz, mono)
+            channel: Transcribe only this channel (None mixes all channels)
 
         Returns:
             TranscriptionResult with segments and word timestamps
@@ -153,13 +221,35 @@ class Transcriber:
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
         conversation_id = audio_path.stem
-        logger.info(f"Transcribing: {conversation_id}")
+        channel_label = f" (channel {channel})" if channel is not None else ""
+        logger.info(f"Transcribing: {conversation_id}{channel_label}")
 
         model = self._get_model()
 
+        # Resume from a previous partial run if a checkpoint exists
+        checkpoint_key = conversation_id if channel is None else f"{conversation_id}.ch{channel}"
+        checkpoint_path = self._checkpoint_path(checkpoint_key)
+        checkpoint_header = self._checkpoint_header(audio_path)
+        segments = self._load_checkpoint(checkpoint_path, checkpoint_header)
+        offset = segments[-1].end if segments else 0.0
+
+        if channel is not None:
+            audio_input = load_channel(str(audio_path), channel)
+        elif offset > 0:
+            audio_input = decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE)
+        else:
+            audio_input = str(audio_path)
+
+        if offset > 0:
+            logger.info(
+                f"Resuming {conversation_id}{channel_label} from checkpoint: "
+                f"{len(segments)} segments, seeking to {offset:.1f}s"
+            )
+            audio_input = audio_input[int(offset * SAMPLE_RATE):]
+
         # Transcribe with word timestamps
         segments_iter, info = model.transcribe(
-            str(audio_path),
+            audio_input,
             language=WHISPER_LANGUAGE,
             beam_size=WHISPER_BEAM_SIZE,
             word_timestamps=True,
@@ -169,44 +259,170 @@ class Transcriber:
             )
         )
 
-        # Convert to our data structures
-        segments = []
-        for segment in segments_iter:
-            words = []
-            if segment.words:
-                for word_info in segment.words:
-                    words.append(WordTimestamp(
-                        word=word_info.word.strip(),
-                        start=word_info.start,
-                        end=word_info.end,
-                        confidence=word_info.probability if hasattr(word_info, 'probability') else 1.0
-                    ))
-
-            segments.append(TranscriptionSegment(
-                text=segment.text.strip(),
-                start=segment.start,
-                end=segment.end,
-                words=words
-            ))
+        # Convert to our data structures, checkpointing each completed segment
+        checkpoint_file = None
+        if checkpoint_path is not None:
+            checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            new_checkpoint = not checkpoint_path.exists()
+            checkpoint_file = open(checkpoint_path, "a")
+            if new_checkpoint:
+                checkpoint_file.write(json.dumps(checkpoint_header) + "\n")
+
+        try:
+            for segment in segments_iter:
+                words = []
+                if segment.words:
+                    for word_info in segment.words:
+                        words.append(WordTimestamp(
+                            word=word_info.word.strip(),
+                            start=word_info.start + offset,
+                            end=word_info.end + offset,
+                            confidence=word_info.probability if hasattr(word_info, 'probability') else 1.0
+                        ))
+
+                # Text is the words joined by single spaces (Whisper's own text
+                # can differ in spacing), so a redacted segment rebuilt from
+                # its words reads the same as an untouched one
+                transcribed = TranscriptionSegment(
+                    text=" ".join(w.word for w in words),
+                    start=segment.start + offset,
+                    end=segment.end + offset,
+                    words=words,
+                    channel=channel
+                )
+                segments.append(transcribed)
+
+                if checkpoint_file is not None:
+                    checkpoint_file.write(json.dumps(transcribed.to_dict()) + "\n")
+                    checkpoint_file.flush()
+                    os.fsync(checkpoint_file.fileno())
+        finally:
+            if checkpoint_file is not None:
+                checkpoint_file.close()
 
         result = TranscriptionResult(
             conversation_id=conversation_id,
             audio_path=str(audio_path),
-            audio_duration=info.duration,
+            audio_duration=info.duration + offset,
             segments=segments,
             language=info.language,
             language_probability=info.language_probability
         )
 
+        # Transcription finished, so the checkpoint is no longer needed
+        if checkpoint_path is not None and checkpoint_path.exists():
+            checkpoint_path.unlink()
+
         word_count = len(result.get_all_words())
         logger.info(
             f"Transcribed {conversation_id}: "
             f"{len(segments)} segments, {word_count} words, "
-            f"{info.duration:.1f}s audio"
+            f"{result.audio_duration:.1f}s audio"
         )
 
         return result
 
+    def _checkpoint_path(self, conversation_id: str) -> Optional[Path]:
+        """Get the checkpoint file path for a conversation."""
+        if self.checkpoint_dir is None:
+            return None
+        return self.checkpoint_dir / f"{conversation_id}.jsonl"
+
+    def _checkpoint_header(self, audio_path: Path) -> Dict[str, Any]:
+        """First line of a checkpoint: what its segments were transcribed from."""
+        return {"checkpoint": {"source": source_fingerprint(audio_path), "model": self.model_size}}
+
+    def _load_checkpoint(
+        self,
+        checkpoint_path: Optional[Path],
+        header: Dict[str, Any]
+    ) -> List[TranscriptionSegment]:
+        """
+        Load completed segments from a checkpoint file.
+
+        A checkpoint written for a different source file (same conversation
+        id, new size or mtime) or a different model is deleted rather than
+        resumed from. A worker killed mid-write can leave a truncated last
+        line, so parsing stops at the first line that isn't valid JSON.
+        """
+        if checkpoint_path is None or not checkpoint_path.exists():
+            return []
+
+        segments = []
+        with open(checkpoint_path) as f:
+            try:
+                stale = json.loads(f.readline()) != header
+            except json.JSONDecodeError:
+                stale = True
+
+            if not stale:
+                for line in f:
+                    try:
+                        segments.append(TranscriptionSegment.from_dict(json.loads(line)))
+                    except (json.JSONDecodeError, KeyError):
+                        logger.warning(f"Ignoring truncated checkpoint entry in {checkpoint_path}")
+                        break
+
+        if stale:
+            logger.warning(
+                f"Discarding checkpoint {checkpoint_path}: "
+                "written for a different source file or model"
+            )
+            checkpoint_path.unlink()
+            return []
+
+        # Rewrite without the truncated tail so new segments append cleanly
+        with open(checkpoint_path, "w") as f:
+            f.write(json.dumps(header) + "\n")
+            for seg in segments:
+                f.write(json.dumps(seg.to_dict()) + "\n")
+
+        return segments
+
+
+def remove_checkpoints(checkpoint_dir: Path, conversation_id: str) -> None:
+    """Delete a conversation's segment checkpoints (whole-file and per-channel)."""
+    checkpoint_dir = Path(checkpoint_dir)
+    paths = [checkpoint_dir / f"{conversation_id}.jsonl"]
+    paths += checkpoint_dir.glob(f"{glob.escape(conversation_id)}.ch*.jsonl")
+    for path in paths:
+        if path.exists():
+            path.unlink()
+            logger.info(f"Removed stale checkpoint {path}")
+
+
+def load_channel(audio_path: str, channel: int) -> np.ndarray:
+    """
+    Decode a single channel as float32 at SAMPLE_RATE.
+    Reads block by block, so only the one channel is ever held in memory;
+    sources at another rate are decoded through PyAV, which resamples each
+    block on the fly.
+    """
+    with open_audio(audio_path, samplerate=SAMPLE_RATE) as f:
+        if channel >= f.channels:
+            raise ValueError(f"{audio_path} has {f.channels} channel(s), no channel {channel}")
+
+        chunks = []
+        while True:
+            block = f.read(AUDIO_BLOCK_FRAMES, dtype="float32", always_2d=True)
+            if len(block) == 0:
+                break
+            chunks.append(block[:, channel].copy())
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.float32)
+
+
+def merge_channel_transcripts(results: List[TranscriptionResult]) -> TranscriptionResult:
+    """Combine per-channel transcripts into one, with segments in time order."""
+    first = results[0]
+    return TranscriptionResult(
+        conversation_id=first.conversation_id,
+        audio_path=first.audio_path,
+        audio_duration=max(r.audio_duration for r in results),
+        segments=list(heapq.merge(*(r.segments for r in results), key=lambda s: s.start)),
+        language=first.language,
+        language_probability=min(r.language_probability for r in results)
+    )
+
 
 def transcribe_audio(audio_path: str, model_size: str = "base") -> TranscriptionResult:
     """
@@ -4,19 +4,25 @@ Text: re-scan redacted transcript for remaining PII
 Audio: re-transcribe redacted audio and look for leaks
 """
 import logging
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+import threading
+from typing import Any, List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 from .config import (
     VERIFY_PASS_THRESHOLD,
     VERIFY_REVIEW_THRESHOLD,
     VERIFY_FAIL_THRESHOLD,
-    FUZZY_MIN_CONFIDENCE
+    FUZZY_MIN_CONFIDENCE,
+    SPECTRAL_SKIP_REASR,
+    SPECTRAL_SKIP_MIN_CONFIDENCE
 )
+from .audio_redactor import BleepRegion
+from .bleep_check import BleepCheckResult, SpectralChecker
 from .pii_detector import PIIDetector
 from .transcriber import Transcriber, TranscriptionResult
 from .text_redactor import RedactedTranscript
+from .timing import timed
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +33,7 @@ class VerificationStatus(Enum):
     PASS_WITH_NOTE = "PASS_WITH_NOTE"  # Low-confidence matches only (likely noise)
     REVIEW_REQUIRED = "REVIEW_REQUIRED"  # Some high-confidence matches
     FAIL = "FAIL"                    # Multiple PII instances leaked
+    NOT_VERIFIED = "NOT_VERIFIED"    # Audio not checked (sampled out by the policy)
 
 
 @dataclass
@@ -38,6 +45,10 @@ class VerificationResult:
     text_pii_found: List[Dict]
     audio_pii_found: List[Dict]
     notes: List[str]
+    text_coverage: Dict[str, Any] = field(default_factory=dict)
+    audio_method: Optional[str] = None  # "reasr", "spectral", "sampled_out" or "unchanged"
+    spectral: Optional[Dict[str, Any]] = None
+    timings: Dict[str, float] = field(default_factory=dict)  # Seconds per step; not serialized
 
     @property
     def overall_status(self) -> VerificationStatus:
@@ -51,6 +62,9 @@ class VerificationResult:
             return VerificationStatus.FAIL
         if VerificationStatus.REVIEW_REQUIRED in statuses:
             return VerificationStatus.REVIEW_REQUIRED
+        # A clean transcript doesn't vouch for audio nobody checked
+        if VerificationStatus.NOT_VERIFIED in statuses:
+            return VerificationStatus.NOT_VERIFIED
         if VerificationStatus.PASS_WITH_NOTE in statuses:
             return VerificationStatus.PASS_WITH_NOTE
         return VerificationStatus.PASS
@@ -64,22 +78,53 @@ class VerificationResult:
             "audio_status": self.audio_status.value if self.audio_status else None,
             "text_pii_found": self.text_pii_found,
             "audio_pii_found": self.audio_pii_found,
-            "notes": self.notes
+            "notes": self.notes,
+            "text_coverage": self.text_coverage,
+            "audio_method": self.audio_method,
+            "spectral": self.spectral
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "VerificationResult":
+        """Rebuild a result from its dictionary form."""
+        return cls(
+            conversation_id=data["conversation_id"],
+            text_status=VerificationStatus(data["text_status"]),
+            audio_status=VerificationStatus(data["audio_status"]) if data["audio_status"] else None,
+            text_pii_found=data["text_pii_found"],
+            audio_pii_found=data["audio_pii_found"],
+            notes=data["notes"],
+            text_coverage=data.get("text_coverage", {}),
+            audio_method=data.get("audio_method"),
+            spectral=data.get("spectral")
+        )
+
 
 class Verifier:
     """Verifies PII redaction in text and audio."""
 
-    def __init__(self, transcriber: Optional[Transcriber] = None):
+    def __init__(
+        self,
+        transcriber: Optional[Transcriber] = None,
+        detector: Optional[PIIDetector] = None,
+        spectral_checker: Optional[SpectralChecker] = None,
+        skip_reasr: bool = SPECTRAL_SKIP_REASR
+    ):
         """
         Initialize the verifier.
 
         Args:
             transcriber: Transcriber instance for audio verification
+            detector: Detector to share (e.g. the pipeline's); built if None
+            spectral_checker: Checks bleep regions before re-ASR (None = no check)
+            skip_reasr: Skip re-ASR when the spectral check passes and every
+                match was exact and high-confidence
         """
-        self.detector = PIIDetector()
+        self.detector = detector or PIIDetector()
         self.transcriber = transcriber
+        self.spectral_checker = spectral_checker
+        self.skip_reasr = skip_reasr
+        self._transcriber_lock = threading.Lock()  # Verification may run on several threads
 
     def _determine_status(
         self,
@@ -133,28 +178,43 @@ class Verifier:
         """
         Verify that redacted transcript contains no PII.
 
+        When the redactor recorded where its labels are, only the text
+        between labels is scanned; otherwise the whole text is.
+
         Args:
             redacted_transcript: The redacted transcript to verify
 
         Returns:
-            Tuple of (status, pii_found, notes)
+            Tuple of (status, pii_found, notes, coverage)
         """
         logger.info(f"Verifying text redaction for {redacted_transcript.conversation_id}")
 
-        # Scan redacted text for remaining PII
-        pii_found = self.detector.detect_in_text(redacted_transcript.redacted_text)
-
-        # Filter out our own labels (they contain category names which might match)
-        # e.g., "[CITY]" should not match as a city
-        pii_found = [
-            p for p in pii_found
-            if not p["text"].startswith("[") and not p["text"].endswith("]")
-        ]
-
+        text = redacted_transcript.redacted_text
+        label_spans = redacted_transcript.label_spans
+
+        if label_spans is not None:
+            gaps = unredacted_spans(len(text), label_spans)
+            pii_found = self.detector.detect_in_spans(text, gaps)
+        else:
+            # Scan redacted text for remaining PII
+            gaps = [(0, len(text))]
+            pii_found = self.detector.detect_in_text(text)
+
+            # Filter out our own labels (they contain category names which might match)
+            # e.g., "[CITY]" should not match as a city
+            pii_found = [
+                p for p in pii_found
+                if not p["text"].startswith("[") and not p["text"].endswith("]")
+            ]
+
+        coverage = text_coverage(text, label_spans, gaps)
         status, notes = self._determine_status(pii_found, "text")
 
-        logger.info(f"Text verification: {status.value}, {len(pii_found)} PII found")
-        return status, pii_found, notes
+        logger.info(
+            f"Text verification: {status.value}, {len(pii_found)} PII found, "
+            f"{coverage['scanned_chars']}/{coverage['total_chars']} chars scanned"
+        )
+        return status, pii_found, notes, coverage
 
     def verify_audio(
         self,
@@ -175,9 +235,10 @@ class Verifier:
         """
         logger.info(f"Verifying audio redaction for {conversation_id}")
 
-        if self.transcriber is None:
-            # Use a small model for verification (faster)
-            self.transcriber = Transcriber(model_size="base")
+        with self._transcriber_lock:
+            if self.transcriber is None:
+                # Use a small model for verification (faster)
+                self.transcriber = Transcriber(model_size="base")
 
         # Re-transcribe redacted audio
         try:
@@ -211,11 +272,45 @@ class Verifier:
         logger.info(f"Audio verification: {status.value}, {len(pii_found)} PII found")
         return status, pii_found, notes
 
+    def verify_bleeps(
+        self,
+        redacted_audio_path: str,
+        bleep_regions: List[BleepRegion]
+    ) -> tuple:
+        """
+        Spectral check of the bleep regions.
+
+        Args:
+            redacted_audio_path: Path to redacted audio file
+            bleep_regions: Regions the audio redactor bleeped
+
+        Returns:
+            Tuple of (BleepCheckResult, notes)
+        """
+        result: BleepCheckResult = self.spectral_checker.check(redacted_audio_path, bleep_regions)
+        notes = []
+        for region in result.flagged:
+            notes.append(
+                f"Audio: bleep at {region['start_time']:.2f}-{region['end_time']:.2f}s "
+                f"failed spectral check ({', '.join(region['issues'])})"
+            )
+        return result, notes
+
+    def _can_skip_reasr(self, redacted_transcript: RedactedTranscript) -> bool:
+        """Whether every redaction came from a high-confidence exact match."""
+        return self.skip_reasr and all(
+            not log.is_fuzzy and log.confidence >= SPECTRAL_SKIP_MIN_CONFIDENCE
+            for log in redacted_transcript.redaction_logs
+        )
+
     def verify(
         self,
         redacted_transcript: RedactedTranscript,
         redacted_audio_path: Optional[str] = None,
-        verify_audio: bool = True
+        verify_audio: bool = True,
+        audio_unchanged: bool = False,
+        bleep_regions: Optional[List[BleepRegion]] = None,
+        reasr: Optional[bool] = None
     ) -> VerificationResult:
         """
         Perform full verification of redaction.
@@ -224,26 +319,73 @@ class Verifier:
             redacted_transcript: Redacted transcript to verify
             redacted_audio_path: Path to redacted audio (optional)
             verify_audio: Whether to verify audio (set False to skip)
+            audio_unchanged: No PII was detected and the audio was passed
+                through, so re-transcribing it can't find anything new
+            bleep_regions: Bleep regions written into the audio; enables the
+                spectral pre-check when a spectral checker is set
+            reasr: Re-ASR decision from a sampling policy: True always
+                re-transcribes, False only does so if the spectral check
+                flags a bleep, None lets the spectral check decide
 
         Returns:
             VerificationResult
         """
         conversation_id = redacted_transcript.conversation_id
         notes = []
+        timings: Dict[str, float] = {}
 
         # Verify text
-        text_status, text_pii, text_notes = self.verify_text(redacted_transcript)
+        with timed(timings, "verify_text"):
+            text_status, text_pii, text_notes, coverage = self.verify_text(redacted_transcript)
         notes.extend(text_notes)
 
         # Verify audio if requested and path provided
         audio_status = None
         audio_pii = []
-
-        if verify_audio and redacted_audio_path:
-            audio_status, audio_pii, audio_notes = self.verify_audio(
-                redacted_audio_path, conversation_id
-            )
-            notes.extend(audio_notes)
+        audio_method = None
+        spectral = None
+
+        if verify_audio and redacted_audio_path and audio_unchanged:
+            audio_status = VerificationStatus.PASS
+            audio_method = "unchanged"
+            notes.append("Audio: no PII detected, audio passed through unchanged; re-ASR skipped")
+        elif verify_audio and redacted_audio_path:
+            if self.spectral_checker is not None and bleep_regions:
+                with timed(timings, "spectral_check"):
+                    spectral, spectral_notes = self.verify_bleeps(
+                        redacted_audio_path, bleep_regions
+                    )
+                notes.extend(spectral_notes)
+
+            spectral_failed = spectral is not None and not spectral.passed
+            if reasr is False and not spectral_failed:
+                audio_method = "sampled_out"
+                if spectral is not None:
+                    audio_status = VerificationStatus.PASS
+                else:
+                    audio_status = VerificationStatus.NOT_VERIFIED
+                notes.append("Audio: low risk and not drawn for audit; re-ASR skipped")
+            elif (
+                reasr is None and spectral is not None and spectral.passed
+                and self._can_skip_reasr(redacted_transcript)
+            ):
+                audio_status = VerificationStatus.PASS
+                audio_method = "spectral"
+                notes.append(
+                    "Audio: all bleeps passed spectral check, matches exact; re-ASR skipped"
+                )
+            else:
+                with timed(timings, "reasr"):
+                    audio_status, audio_pii, audio_notes = self.verify_audio(
+                        redacted_audio_path, conversation_id
+                    )
+                audio_method = "reasr"
+                notes.extend(audio_notes)
+                # A bad bleep needs a human even if re-ASR hears nothing
+                if spectral_failed and audio_status in (
+                    VerificationStatus.PASS, VerificationStatus.PASS_WITH_NOTE
+                ):
+                    audio_status = VerificationStatus.REVIEW_REQUIRED
 
         return VerificationResult(
             conversation_id=conversation_id,
@@ -251,10 +393,47 @@ class Verifier:
             audio_status=audio_status,
             text_pii_found=text_pii,
             audio_pii_found=audio_pii,
-            notes=notes
+            notes=notes,
+            text_coverage=coverage,
+            audio_method=audio_method,
+            spectral=spectral.to_dict() if spectral is not None else None,
+            timings=timings
         )
 
 
+def unredacted_spans(length: int, label_spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """The (start, end) spans of a text of this length that aren't labels."""
+    gaps = []
+    pos = 0
+    for start, end in label_spans:
+        if start > pos:
+            gaps.append((pos, start))
+        pos = max(pos, end)
+    if pos < length:
+        gaps.append((pos, length))
+    return gaps
+
+
+def text_coverage(
+    text: str,
+    label_spans: Optional[List[Tuple[int, int]]],
+    scanned: List[Tuple[int, int]]
+) -> Dict[str, Any]:
+    """Coverage statistics for a text verification pass."""
+    labels = label_spans or []
+    redacted_chars = sum(end - start for start, end in labels)
+    scanned_chars = sum(end - start for start, end in scanned)
+    return {
+        "mode": "spans" if label_spans is not None else "full",
+        "total_chars": len(text),
+        "labels": len(labels),
+        "redacted_chars": redacted_chars,
+        "scanned_spans": len(scanned),
+        "scanned_chars": scanned_chars,
+        "scanned_fraction": round(scanned_chars / len(text), 4) if text else 1.0
+    }
+
+
 def verify_redaction(
     redacted_transcript: RedactedTranscript,
     redacted_audio_path: Optional[str] = None,
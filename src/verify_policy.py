@@ -0,0 +1,244 @@
+"""
+Risk-scored sampling for audio verification.
+Re-ASR of the redacted audio is the most expensive step. Instead of running
+it on every file, each file gets a risk score from data the pipeline already
+has, and re-ASR runs on:
+
+- every file scoring at or above RISK_THRESHOLD
+- a random audit sample (VERIFY_AUDIT_RATE) of the rest
+
+Audit draws hash (seed, conversation_id), so the sample is reproducible and
+independent of batch order. The decision and score go into manifest.json.
+"""
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from .audio_redactor import BleepRegion
+from .config import (
+    PIIMatch,
+    VERIFY_AUDIT_SEED,
+    RISK_THRESHOLD,
+    RISK_WEIGHTS,
+    RISK_LOW_CONFIDENCE,
+    RISK_CONTEXT_S,
+    RISK_EDGE_MARGIN_MS
+)
+from .serialization import read_json
+from .transcriber import TranscriptionResult
+
+logger = logging.getLogger(__name__)
+
+# Decisions, recorded in the manifest
+DECISION_ALL = "all"                  # Policy off: every file is verified
+DECISION_HIGH_RISK = "high_risk"      # Score at or above the threshold
+DECISION_AUDIT = "audit"              # Low risk, drawn for the random audit
+DECISION_SAMPLED_OUT = "sampled_out"  # Low risk, not drawn: no re-ASR
+DECISION_UNCHANGED = "unchanged"      # No PII, audio passed through
+DECISION_DISABLED = "disabled"        # Audio verification turned off
+REASR_DECISIONS = (DECISION_HIGH_RISK, DECISION_AUDIT)
+
+# Earlier statuses that make a file risky
+RISKY_STATUSES = ("REVIEW_REQUIRED", "FAIL")
+
+
+@dataclass
+class PolicyDecision:
+    """How one file's audio gets verified, and why."""
+    decision: str
+    risk_score: float = 0.0
+    risk_factors: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def reasr(self) -> Optional[bool]:
+        """Force re-ASR (True), skip it (False) or leave it to the verifier (None)."""
+        if self.decision in REASR_DECISIONS:
+            return True
+        if self.decision == DECISION_SAMPLED_OUT:
+            return False
+        return None
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "decision": self.decision,
+            "risk_score": round(self.risk_score, 3),
+            "risk_factors": self.risk_factors
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PolicyDecision":
+        """Rebuild a decision from its dictionary form."""
+        return cls(data["decision"], data["risk_score"], data["risk_factors"])
+
+
+def risk_factors(
+    transcript: TranscriptionResult,
+    pii_matches: Sequence[PIIMatch],
+    bleep_regions: Sequence[BleepRegion],
+    previous_status: Optional[str] = None,
+    low_confidence: float = RISK_LOW_CONFIDENCE,
+    context_s: float = RISK_CONTEXT_S,
+    edge_margin_ms: float = RISK_EDGE_MARGIN_MS
+) -> Dict[str, int]:
+    """
+    Count the things that make a redaction likely to leak.
+
+    Args:
+        transcript: Raw transcript
+        pii_matches: Detected PII
+        bleep_regions: Bleep regions written into the audio
+        previous_status: QA status of this conversation in an earlier run
+        low_confidence: Word confidence counted as low
+        context_s: Window around each match for low-confidence words
+        edge_margin_ms: PII words closer than this to a bleep edge count
+
+    Returns:
+        Dict of factor name to count
+    """
+    fuzzy = sum(1 for m in pii_matches if m.is_fuzzy)
+
+    # Low-confidence words within context_s of any match (PII words included:
+    # a shaky PII word may have shaky timestamps too)
+    low_conf = 0
+    words = transcript.get_all_words() if transcript is not None else []
+    if len(words) and pii_matches:
+        # Only low-confidence words can count, so test just those
+        low = np.flatnonzero(words.confidences < low_confidence)
+        starts, ends = words.starts[low], words.ends[low]
+        near = np.zeros(len(low), dtype=bool)
+        for m in pii_matches:
+            near |= (ends >= m.start_time - context_s) & (starts <= m.end_time + context_s)
+        low_conf = int(np.count_nonzero(near))
+
+    # PII words that leave less than edge_margin_ms of bleep on either side,
+    # e.g. padding clamped at the start or end of the file
+    margin_s = edge_margin_ms / 1000
+    edge = 0
+    for region in bleep_regions:
+        for m in region.pii_matches:
+            if min(m.start_time - region.start_time, region.end_time - m.end_time) < margin_s:
+                edge += 1
+
+    return {
+        "fuzzy_matches": fuzzy,
+        "low_confidence_words": low_conf,
+        "edge_matches": edge,
+        "history": int(previous_status in RISKY_STATUSES),
+    }
+
+
+def risk_score(factors: Dict[str, int], weights: Dict[str, float] = RISK_WEIGHTS) -> float:
+    """Weighted sum of risk factors."""
+    return float(sum(weights.get(name, 0.0) * count for name, count in factors.items()))
+
+
+def audit_draw(conversation_id: str, seed: int = VERIFY_AUDIT_SEED) -> float:
+    """Stable uniform draw in [0, 1) for a conversation."""
+    digest = hashlib.sha256(f"{seed}:{conversation_id}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2 ** 64
+
+
+def load_previous_statuses(manifest_path: Path) -> Dict[str, str]:
+    """conversation_id -> qa_status from an earlier run's manifest, if there is one."""
+    try:
+        rows = read_json(manifest_path)
+    except (OSError, ValueError):
+        return {}
+    return {
+        row["conversation_id"]: row.get("qa_status")
+        for row in rows
+        if isinstance(row, dict) and "conversation_id" in row
+    }
+
+
+class VerificationPolicy:
+    """Decides which files get audio re-ASR."""
+
+    def __init__(
+        self,
+        audit_rate: Optional[float],
+        threshold: float = RISK_THRESHOLD,
+        seed: int = VERIFY_AUDIT_SEED,
+        weights: Optional[Dict[str, float]] = None,
+        previous_statuses: Optional[Dict[str, str]] = None
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            audit_rate: Share of low-risk files to audit (None = verify everything)
+            threshold: Risk score at which a file is always verified
+            seed: Seed for the audit draws
+            weights: Risk factor weights (default: RISK_WEIGHTS)
+            previous_statuses: conversation_id -> earlier QA status
+        """
+        if audit_rate is not None and not 0.0 <= audit_rate <= 1.0:
+            raise ValueError(f"audit_rate must be between 0 and 1, got {audit_rate}")
+        self.audit_rate = audit_rate
+        self.threshold = threshold
+        self.seed = seed
+        self.weights = weights or RISK_WEIGHTS
+        self.previous_statuses = previous_statuses or {}
+
+    def decide(
+        self,
+        conversation_id: str,
+        transcript: TranscriptionResult,
+        pii_matches: Sequence[PIIMatch],
+        bleep_regions: Sequence[BleepRegion],
+        audio_unchanged: bool = False,
+        verify_audio: bool = True
+    ) -> PolicyDecision:
+        """
+        Score a file and decide how to verify its audio.
+
+        Args:
+            conversation_id: Conversation ID
+            transcript: Raw transcript
+            pii_matches: Detected PII
+            bleep_regions: Bleep regions written into the audio
+            audio_unchanged: No PII, so the audio was passed through
+            verify_audio: Audio verification is on at all
+
+        Returns:
+            PolicyDecision
+        """
+        if not verify_audio:
+            return PolicyDecision(DECISION_DISABLED)
+        if audio_unchanged:
+            return PolicyDecision(DECISION_UNCHANGED)
+
+        factors = risk_factors(
+            transcript, pii_matches, bleep_regions,
+            self.previous_statuses.get(conversation_id)
+        )
+        score = risk_score(factors, self.weights)
+
+        if self.audit_rate is None:
+            decision = DECISION_ALL
+        elif score >= self.threshold:
+            decision = DECISION_HIGH_RISK
+        elif audit_draw(conversation_id, self.seed) < self.audit_rate:
+            decision = DECISION_AUDIT
+        else:
+            decision = DECISION_SAMPLED_OUT
+
+        logger.info(f"Verification policy for {conversation_id}: {decision} (risk {score:.2f})")
+        return PolicyDecision(decision, score, factors)
+
+
+def summarize_decisions(counts: Dict[str, int], failed_audits: int) -> Dict:
+    """Batch summary of policy decisions (decision -> files) for the processing report."""
+    audited = counts.get(DECISION_AUDIT, 0)
+    low_risk = audited + counts.get(DECISION_SAMPLED_OUT, 0)
+    return {
+        "decisions": counts,
+        "reasr_files": sum(counts.get(d, 0) for d in REASR_DECISIONS),
+        "audit_fraction": round(audited / low_risk, 4) if low_risk else None,
+        "audit_failures": failed_audits,
+    }
@@ -0,0 +1,234 @@
+"""
+Columnar word storage for transcripts.
+An hour of audio is ~10k words. Instead of one object per word, a transcript
+keeps numpy columns (start, end, confidence, token id) plus an interned token
+table; segments and words are lightweight views into it. This cuts memory
+several times and lets the detector and serializers work on whole columns.
+"""
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+class WordTable(Sequence):
+    """All words of a transcript, stored as columns."""
+
+    __slots__ = ("tokens", "token_ids", "starts", "ends", "confidences")
+
+    def __init__(
+        self,
+        tokens: List[str],
+        token_ids: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        confidences: np.ndarray
+    ):
+        """
+        Initialize the table. Use from_words() to build one from word objects.
+
+        Args:
+            tokens: Distinct word strings (the interned token table)
+            token_ids: Index into tokens for each word (int32)
+            starts: Word start times in seconds (float64)
+            ends: Word end times in seconds (float64)
+            confidences: Word confidences (float64)
+        """
+        self.tokens = tokens
+        self.token_ids = token_ids
+        self.starts = starts
+        self.ends = ends
+        self.confidences = confidences
+
+    @classmethod
+    def from_words(cls, words: Iterable[Any]) -> "WordTable":
+        """Build a table from anything with word/start/end/confidence attributes."""
+        index: Dict[str, int] = {}
+        tokens: List[str] = []
+        token_ids: List[int] = []
+        starts: List[float] = []
+        ends: List[float] = []
+        confidences: List[float] = []
+
+        for w in words:
+            token_id = index.get(w.word)
+            if token_id is None:
+                token_id = index[w.word] = len(tokens)
+                tokens.append(w.word)
+            token_ids.append(token_id)
+            starts.append(w.start)
+            ends.append(w.end)
+            confidences.append(w.confidence)
+
+        return cls(
+            tokens,
+            np.array(token_ids, dtype=np.int32),
+            np.array(starts, dtype=np.float64),
+            np.array(ends, dtype=np.float64),
+            np.array(confidences, dtype=np.float64)
+        )
+
+    def __len__(self) -> int:
+        return len(self.token_ids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                return [WordView(self, k) for k in range(start, stop, step)]
+            return WordSlice(self, start, max(start, stop))
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("word index out of range")
+        return WordView(self, i)
+
+    def __iter__(self):
+        return (WordView(self, i) for i in range(len(self)))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns (excluding the token strings)."""
+        return (self.token_ids.nbytes + self.starts.nbytes
+                + self.ends.nbytes + self.confidences.nbytes)
+
+    def words(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Word strings for a range of words."""
+        tokens = self.tokens
+        return [tokens[t] for t in self.token_ids[start:stop].tolist()]
+
+    def map_tokens(self, fn: Callable[[str], Any]) -> List[Any]:
+        """
+        Apply fn once per distinct token and return the result for every word.
+        Repeated words (most of a conversation) are only processed once.
+        """
+        mapped = [fn(t) for t in self.tokens]
+        return [mapped[t] for t in self.token_ids.tolist()]
+
+    def to_dicts(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None,
+        confidence: bool = True
+    ) -> List[Dict]:
+        """Serialize a range of words column-wise, for JSON output."""
+        words = self.words(start, stop)
+        starts = self.starts[start:stop].tolist()
+        ends = self.ends[start:stop].tolist()
+        if not confidence:
+            return [{"word": w, "start": s, "end": e} for w, s, e in zip(words, starts, ends)]
+        confidences = self.confidences[start:stop].tolist()
+        return [
+            {"word": w, "start": s, "end": e, "confidence": c}
+            for w, s, e, c in zip(words, starts, ends, confidences)
+        ]
+
+
+class WordView:
+    """One word of a WordTable. Same attributes as WordTimestamp, but read-only."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: WordTable, index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def word(self) -> str:
+        return self._table.tokens[self._table.token_ids[self._index]]
+
+    @property
+    def start(self) -> float:
+        return float(self._table.starts[self._index])
+
+    @property
+    def end(self) -> float:
+        return float(self._table.ends[self._index])
+
+    @property
+    def confidence(self) -> float:
+        return float(self._table.confidences[self._index])
+
+    def __eq__(self, other):
+        try:
+            return (self.word, self.start, self.end, self.confidence) == (
+                other.word, other.start, other.end, other.confidence
+            )
+        except AttributeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"WordView(word={self.word!r}, start={self.start}, end={self.end}, "
+                f"confidence={self.confidence})")
+
+
+class WordSlice(Sequence):
+    """A contiguous run of words in a WordTable (a segment's words)."""
+
+    __slots__ = ("table", "start", "stop")
+
+    def __init__(self, table: WordTable, start: int, stop: int):
+        self.table = table
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                return [WordView(self.table, self.start + k) for k in range(start, stop, step)]
+            return WordSlice(self.table, self.start + start, self.start + max(start, stop))
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("word index out of range")
+        return WordView(self.table, self.start + i)
+
+    def __iter__(self):
+        return (WordView(self.table, i) for i in range(self.start, self.stop))
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or len(self) != len(other):
+            return False
+        return all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"WordSlice({self.words()!r})"
+
+    def words(self) -> List[str]:
+        """Word strings in this slice."""
+        return self.table.words(self.start, self.stop)
+
+    def to_dicts(self, confidence: bool = True) -> List[Dict]:
+        """Serialize the slice column-wise."""
+        return self.table.to_dicts(self.start, self.stop, confidence)
+
+
+def word_strings(words: Sequence) -> List[str]:
+    """Word strings of a word list (column path for table-backed slices)."""
+    if isinstance(words, WordSlice):
+        return words.words()
+    return [w.word for w in words]
+
+
+def word_dicts(words: Sequence, confidence: bool = True) -> List[Dict]:
+    """
+    Serialize a word list for JSON.
+    Table-backed slices take the column path; mixed lists (redacted segments
+    with label words) fall back to per-word attribute access.
+    """
+    if isinstance(words, WordSlice):
+        return words.to_dicts(confidence)
+    if confidence:
+        return [
+            {"word": w.word, "start": w.start, "end": w.end, "confidence": w.confidence}
+            for w in words
+        ]
+    return [{"word": w.word, "start": w.start, "end": w.end} for w in words]
@@ -5,18 +5,27 @@ and tone generation.
 """
 import pytest
 import numpy as np
+import soundfile as sf
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.audio_redactor import (
+    MODE_FLOAT32,
+    MODE_PASSTHROUGH,
+    MODE_PCM16,
+    MODE_TRANSCODE,
     AudioRedactor,
+    apply_bleeps,
     generate_bleep_tone,
+    get_tone_table,
     merge_overlapping_regions,
     BleepRegion
 )
-from src.config import PIIMatch, MIN_BLEEP_DURATION_MS, PADDING_BEFORE_MS, PADDING_AFTER_MS
+from src.config import (
+    PIIMatch, OUTPUT_PROFILES, MIN_BLEEP_DURATION_MS, PADDING_BEFORE_MS, PADDING_AFTER_MS
+)
 
 
 class TestBleepDuration:
@@ -129,6 +138,32 @@ class TestRegionMerging:
         merged = merge_overlapping_regions(regions, min_gap_s=0.1)
         assert len(merged) == 2
 
+    def test_long_run_of_adjacent_matches(self):
+        """A spoken list of PII merges into one region holding every match in order."""
+        redactor = AudioRedactor()
+        pii = [
+            PIIMatch("red", "color", 0.3 * i, 0.3 * i + 0.25, 1.0, [i])
+            for i in reversed(range(2000))
+        ]
+
+        regions = redactor.calculate_bleep_regions(pii, audio_duration=1000.0)
+
+        assert len(regions) == 1
+        assert [m.word_indices[0] for m in regions[0].pii_matches] == list(range(2000))
+        assert regions[0].end_time == pytest.approx(0.3 * 1999 + 0.25 + 0.15)
+
+    def test_containing_region_keeps_running_end(self):
+        """A short region inside a long one must not shrink the merged end."""
+        regions = [
+            BleepRegion(start_time=1.0, end_time=5.0, bleep_duration=4.0, pii_matches=[]),
+            BleepRegion(start_time=2.0, end_time=2.5, bleep_duration=0.5, pii_matches=[]),
+            BleepRegion(start_time=5.05, end_time=6.0, bleep_duration=0.95, pii_matches=[]),
+        ]
+
+        merged = merge_overlapping_regions(regions, min_gap_s=0.1)
+        assert len(merged) == 1
+        assert merged[0].end_time == 6.0
+
 
 class TestBleepToneGeneration:
     """Test bleep tone audio generation."""
@@ -155,6 +190,214 @@ class TestBleepToneGeneration:
         bleep = generate_bleep_tone(0.4, 16000)
         assert bleep.dtype == np.float32
 
+    def test_tone_table_is_cached(self):
+        """Repeated requests should reuse the same table."""
+        table = get_tone_table(8000, 16000)
+        assert get_tone_table(4000, 16000) is table
+
+    def test_applied_bleep_matches_generated_tone(self):
+        """Bleeps written in place should equal the standalone tone."""
+        audio = np.ones(16000 * 3, dtype=np.float32)
+        region = BleepRegion(start_time=1.0, end_time=1.5, bleep_duration=0.5, pii_matches=[])
+
+        apply_bleeps(audio, [region], 16000)
+
+        np.testing.assert_array_equal(audio[16000:24000], generate_bleep_tone(0.5, 16000))
+        assert np.all(audio[:16000] == 1.0)
+        assert np.all(audio[24000:] == 1.0)
+
+
+class TestStreamingRedaction:
+    """Test that block-streaming redaction matches the in-memory path."""
+
+    @pytest.fixture
+    def pii(self):
+        return [
+            PIIMatch("Monday", "day", 0.5, 0.9, 1.0, [0]),
+            PIIMatch("Houston", "city", 1.95, 2.3, 1.0, [5]),
+            PIIMatch("blue", "color", 4.8, 5.0, 1.0, [9]),
+        ]
+
+    @pytest.mark.parametrize("channels", [1, 2])
+    def test_bit_identical_to_in_memory(self, tmp_path, pii, channels):
+        rng = np.random.default_rng(0)
+        shape = (16000 * 5, channels) if channels > 1 else (16000 * 5,)
+        source = tmp_path / "conv.wav"
+        sf.write(str(source), rng.uniform(-0.5, 0.5, shape).astype(np.float32), 16000)
+
+        # Small odd block size so bleeps straddle block boundaries
+        streaming = AudioRedactor(streaming=True, block_frames=4099)
+        in_memory = AudioRedactor(streaming=False)
+        out_stream, regions_stream = streaming.redact(str(source), pii, str(tmp_path / "s.flac"))
+        out_memory, regions_memory = in_memory.redact(str(source), pii, str(tmp_path / "m.flac"))
+
+        data_stream, _ = sf.read(out_stream, dtype="int16")
+        data_memory, _ = sf.read(out_memory, dtype="int16")
+        np.testing.assert_array_equal(data_stream, data_memory)
+        assert len(regions_stream) == len(regions_memory)
+
+
+class TestPCM16Redaction:
+    """Test the int16-native redaction path."""
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        rng = np.random.default_rng(1)
+        path = tmp_path / "conv.wav"
+        data = rng.integers(-20000, 20000, 16000 * 3, dtype=np.int16)
+        sf.write(str(path), data, 16000, subtype="PCM_16")
+        return path, data
+
+    def test_pcm16_source_uses_native_mode(self, source, tmp_path):
+        path, _ = source
+        pii = [PIIMatch("Monday", "day", 1.0, 1.3, 1.0, [0])]
+        assert AudioRedactor().choose_mode(str(path), pii) == MODE_PCM16
+        assert AudioRedactor(native_pcm16=False).choose_mode(str(path), pii) == MODE_FLOAT32
+
+        float_path = tmp_path / "float.wav"
+        sf.write(str(float_path), np.zeros(1600, dtype=np.float32), 16000, subtype="FLOAT")
+        assert AudioRedactor().choose_mode(str(float_path), pii) == MODE_FLOAT32
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_untouched_samples_preserved_exactly(self, source, tmp_path, streaming):
+        path, data = source
+        pii = [PIIMatch("Monday", "day", 1.0, 1.3, 1.0, [0])]
+        redactor = AudioRedactor(streaming=streaming, block_frames=5000)
+
+        out_path, regions = redactor.redact(str(path), pii, str(tmp_path / "out.flac"))
+        out, _ = sf.read(out_path, dtype="int16")
+
+        start = int(regions[0].start_time * 16000)
+        end = int(regions[0].end_time * 16000)
+        assert sf.info(out_path).subtype == "PCM_16"
+        np.testing.assert_array_equal(out[:start], data[:start])
+        np.testing.assert_array_equal(out[end:], data[end:])
+        assert np.abs(out[start:end]).max() <= int(0.5 * 32767) + 1
+
+
+class TestZeroPIIFastPath:
+    """Test that files without PII skip bleeping entirely."""
+
+    def test_flac_source_is_linked(self, tmp_path):
+        source = tmp_path / "conv.flac"
+        sf.write(str(source), np.zeros(16000, dtype=np.int16), 16000, subtype="PCM_16")
+        redactor = AudioRedactor()
+
+        assert redactor.choose_mode(str(source), []) == MODE_PASSTHROUGH
+        out_path, regions = redactor.redact(str(source), [], str(tmp_path / "out" / "conv.flac"))
+
+        assert regions == []
+        assert Path(out_path).read_bytes() == source.read_bytes()
+
+    def test_wav_source_is_transcoded(self, tmp_path):
+        source = tmp_path / "conv.wav"
+        data = np.arange(-8000, 8000, dtype=np.int16)
+        sf.write(str(source), data, 16000, subtype="PCM_16")
+        redactor = AudioRedactor()
+
+        assert redactor.choose_mode(str(source), []) == MODE_TRANSCODE
+        out_path, _ = redactor.redact(str(source), [], str(tmp_path / "conv.flac"))
+
+        out, _ = sf.read(out_path, dtype="int16")
+        assert sf.info(out_path).format == "FLAC"
+        np.testing.assert_array_equal(out, data)
+
+    def test_other_rate_is_resampled(self, tmp_path):
+        source = tmp_path / "conv.flac"
+        sf.write(str(source), np.zeros(44100 * 2, dtype=np.int16), 44100, subtype="PCM_16")
+        redactor = AudioRedactor()
+
+        assert redactor.choose_mode(str(source), []) == MODE_TRANSCODE
+        out_path, _ = redactor.redact(str(source), [], str(tmp_path / "out" / "conv.flac"))
+
+        info = sf.info(out_path)
+        assert info.samplerate == 16000
+        assert info.frames == pytest.approx(16000 * 2, rel=0.01)
+
+    def test_compression_level_is_transcoded(self, tmp_path):
+        source = tmp_path / "conv.flac"
+        sf.write(str(source), np.zeros(16000, dtype=np.int16), 16000, subtype="PCM_16")
+
+        redactor = AudioRedactor(profile=OUTPUT_PROFILES["archive"])
+        assert redactor.choose_mode(str(source), []) == MODE_TRANSCODE
+
+
+class TestEncodingProfiles:
+    """Test that output profiles control format and subtype."""
+
+    @pytest.mark.parametrize("name,fmt,subtype", [
+        ("default", "FLAC", "PCM_16"),
+        ("archive", "FLAC", "PCM_16"),
+        ("hires", "FLAC", "PCM_24"),
+        ("wav", "WAV", "PCM_16"),
+    ])
+    def test_profile_output(self, tmp_path, name, fmt, subtype):
+        source = tmp_path / "conv.wav"
+        sf.write(str(source), np.zeros(16000 * 2, dtype=np.int16), 16000, subtype="PCM_16")
+        pii = [PIIMatch("Monday", "day", 0.5, 0.9, 1.0, [0])]
+
+        redactor = AudioRedactor(profile=OUTPUT_PROFILES[name])
+        out_path, _ = redactor.redact(str(source), pii)
+
+        info = sf.info(out_path)
+        assert out_path.endswith(f".{OUTPUT_PROFILES[name].extension}")
+        assert (info.format, info.subtype) == (fmt, subtype)
+
+    def test_profile_sample_rate(self, tmp_path):
+        source = tmp_path / "conv.wav"
+        sf.write(str(source), np.zeros(8000 * 2, dtype=np.int16), 8000, subtype="PCM_16")
+        pii = [PIIMatch("Monday", "day", 0.5, 0.9, 1.0, [0])]
+
+        out_path, regions = AudioRedactor().redact(str(source), pii, str(tmp_path / "conv.flac"))
+
+        out, rate = sf.read(out_path, dtype="int16")
+        assert rate == 16000
+        assert len(out) == pytest.approx(16000 * 2, rel=0.01)
+        start = int(regions[0].start_time * rate)
+        end = int(regions[0].end_time * rate)
+        assert np.abs(out[start:end]).max() > 0
+        assert not out[end + 160:].any()
+
+
+class TestCompressedInputs:
+    """Test that compressed formats stream through the block redaction path."""
+
+    @pytest.fixture
+    def m4a_path(self, tmp_path):
+        av = pytest.importorskip("av")
+        path = tmp_path / "conv.m4a"
+        rate = 44100
+        t = np.arange(rate * 3) / rate
+        tone = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)[None, :]
+
+        container = av.open(str(path), "w")
+        stream = container.add_stream("aac", rate=rate, layout="mono")
+        for i in range(0, tone.shape[1], 1024):
+            frame = av.AudioFrame.from_ndarray(
+                np.ascontiguousarray(tone[:, i:i + 1024]), format="fltp", layout="mono"
+            )
+            frame.sample_rate = rate
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+        container.close()
+        return path
+
+    def test_m4a_redacted_and_resampled(self, m4a_path, tmp_path):
+        pii = [PIIMatch("Monday", "day", 1.0, 1.4, 1.0, [0])]
+        redactor = AudioRedactor()
+
+        out_path, regions = redactor.redact(str(m4a_path), pii, str(tmp_path / "conv.flac"))
+        out, rate = sf.read(out_path, dtype="float32")
+
+        assert rate == 16000
+        assert len(out) == pytest.approx(3 * 16000, rel=0.02)
+        start = int(regions[0].start_time * rate)
+        np.testing.assert_allclose(
+            out[start + 400:start + 800], generate_bleep_tone(0.1, rate)[400:800], atol=1e-3
+        )
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,138 @@
+"""
+Tests for the spectral bleep check.
+"""
+import pytest
+import numpy as np
+import soundfile as sf
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.audio_redactor import AudioRedactor
+from src.bleep_check import SpectralChecker
+from src.config import PIIMatch
+from src.text_redactor import RedactedTranscript, RedactionLog
+from src.verifier import Verifier, VerificationStatus
+
+
+def make_match(start, end, confidence=1.0, is_fuzzy=False):
+    return PIIMatch(
+        text="Monday", category="day", start_time=start, end_time=end,
+        confidence=confidence, word_indices=[0], is_fuzzy=is_fuzzy
+    )
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Six seconds of broadband noise standing in for speech."""
+    rng = np.random.default_rng(0)
+    path = tmp_path / "source.wav"
+    sf.write(str(path), rng.integers(-8000, 8000, 16000 * 6, dtype=np.int16), 16000,
+             subtype="PCM_16")
+    return path
+
+
+@pytest.fixture
+def redacted(source, tmp_path):
+    matches = [make_match(1.0, 1.4), make_match(3.0, 3.8)]
+    path, regions = AudioRedactor().redact(str(source), matches, str(tmp_path / "out.flac"))
+    return path, regions
+
+
+class TestSpectralChecker:
+    """Bleeps are checked for the tone, its level and leftover speech."""
+
+    def test_correct_bleeps_pass(self, redacted):
+        path, regions = redacted
+        result = SpectralChecker().check(path, regions)
+
+        assert result.passed
+        assert result.regions_checked == 2
+
+    def test_shifted_bleep_flagged(self, source, redacted, tmp_path):
+        path, regions = redacted
+        audio, sr = sf.read(path, dtype="float32")
+        # Write the first bleep 100ms late
+        start, end = int(regions[0].start_time * sr), int(regions[0].end_time * sr)
+        shift = int(0.1 * sr)
+        tone = 0.5 * np.sin(2 * np.pi * 1000 * np.arange(end - start) / sr)
+        audio[start:end] = sf.read(str(source), dtype="float32")[0][start:end]
+        audio[start + shift:end + shift] = tone
+        path = tmp_path / "shifted.wav"
+        sf.write(str(path), audio, sr)
+
+        result = SpectralChecker().check(str(path), regions)
+
+        assert [f["index"] for f in result.flagged] == [0]
+        assert "start_edge" in result.flagged[0]["issues"]
+        assert "tone_after_region" in result.flagged[0]["issues"]
+
+    def test_quiet_bleep_flagged(self, source, redacted, tmp_path):
+        path, regions = redacted
+        audio, sr = sf.read(path, dtype="float32")
+        start, end = int(regions[1].start_time * sr), int(regions[1].end_time * sr)
+        audio[start:end] = 0.05 * np.sin(2 * np.pi * 1000 * np.arange(end - start) / sr)
+        path = tmp_path / "quiet.wav"
+        sf.write(str(path), audio, sr)
+
+        result = SpectralChecker().check(str(path), regions)
+
+        assert [f["index"] for f in result.flagged] == [1]
+
+    def test_truncated_file_flagged(self, redacted, tmp_path):
+        path, regions = redacted
+        audio, sr = sf.read(path, dtype="int16")
+        short = tmp_path / "short.flac"
+        sf.write(str(short), audio[:int(3.2 * sr)], sr)
+
+        result = SpectralChecker().check(str(short), regions)
+
+        assert result.flagged[-1]["issues"][0] == "truncated"
+
+
+class CountingTranscriber:
+    """Stands in for re-ASR; records how often it was called."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe(self, audio_path, channel=None):
+        self.calls += 1
+        raise RuntimeError("no model in tests")
+
+
+class TestReASRSkip:
+    """Re-ASR only runs when the spectral check can't vouch for the audio."""
+
+    def make_transcript(self, regions, is_fuzzy=False, confidence=1.0):
+        logs = [
+            RedactionLog("Monday", "[DAY]", "day", m.start_time, m.end_time, confidence, is_fuzzy)
+            for r in regions for m in r.pii_matches
+        ]
+        return RedactedTranscript("conv", "on Monday", "on [DAY]", [], logs, label_spans=[(3, 8)])
+
+    def test_exact_matches_skip_reasr(self, redacted):
+        path, regions = redacted
+        transcriber = CountingTranscriber()
+        verifier = Verifier(transcriber=transcriber, spectral_checker=SpectralChecker())
+
+        result = verifier.verify(self.make_transcript(regions), path, bleep_regions=regions)
+
+        assert transcriber.calls == 0
+        assert result.audio_method == "spectral"
+        assert result.audio_status == VerificationStatus.PASS
+        assert result.to_dict()["spectral"]["passed"]
+
+    def test_fuzzy_matches_still_reasr(self, redacted):
+        path, regions = redacted
+        transcriber = CountingTranscriber()
+        verifier = Verifier(transcriber=transcriber, spectral_checker=SpectralChecker())
+
+        result = verifier.verify(
+            self.make_transcript(regions, is_fuzzy=True, confidence=0.8), path,
+            bleep_regions=regions
+        )
+
+        assert transcriber.calls == 1
+        assert result.audio_method == "reasr"
@@ -0,0 +1,101 @@
+"""
+Tests for the word-level export.
+"""
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.export import WordExporter, iter_word_shards, read_word_shard
+from src.pii_detector import PIIDetector
+from src.text_redactor import TextRedactor
+from src.transcriber import TranscriptionResult, TranscriptionSegment
+from src.config import WordTimestamp
+
+
+def make_transcript(conversation_id, texts):
+    segments = []
+    t = 0.0
+    for text in texts:
+        words = []
+        for w in text.split():
+            words.append(WordTimestamp(word=w, start=t, end=t + 0.4, confidence=0.9))
+            t += 0.5
+        segments.append(TranscriptionSegment(
+            text=text, start=words[0].start, end=words[-1].end, words=words
+        ))
+    return TranscriptionResult(conversation_id, f"{conversation_id}.wav", t, segments, "en", 1.0)
+
+
+def add_conversation(exporter, conversation_id, texts):
+    raw = make_transcript(conversation_id, texts)
+    matches = PIIDetector().detect(raw)
+    exporter.add(raw, TextRedactor().redact(raw, matches), matches)
+
+
+def backends():
+    yield "npz"
+    try:
+        import pyarrow.parquet  # noqa: F401
+        yield "parquet"
+    except ImportError:
+        pass
+
+
+@pytest.mark.parametrize("backend", list(backends()))
+class TestWordExport:
+    """Both backends write the same rows."""
+
+    def test_raw_and_deid_rows(self, tmp_path, backend):
+        exporter = WordExporter(tmp_path, backend=backend)
+        add_conversation(exporter, "conv_000", ["we met on Monday", "in San Francisco today"])
+        exporter.close()
+
+        raw = read_word_shard(next(iter_word_shards(tmp_path / "words_raw")))
+        assert list(raw["word"]) == "we met on Monday in San Francisco today".split()
+        assert list(raw["label"]) == [None] * 3 + ["[DAY]", None, "[CITY]", "[CITY]", None]
+        assert raw["segment"].tolist() == [0, 0, 0, 0, 1, 1, 1, 1]
+        assert set(raw["conversation_id"]) == {"conv_000"}
+
+        deid = read_word_shard(next(iter_word_shards(tmp_path / "words_deid")))
+        assert list(deid["word"]) == "we met on [DAY] in [CITY] today".split()
+        assert list(deid["label"]) == [None] * 3 + ["[DAY]", None, "[CITY]", None]
+        assert "Monday" not in set(deid["word"])
+
+    def test_column_pruning(self, tmp_path, backend):
+        exporter = WordExporter(tmp_path, backend=backend)
+        add_conversation(exporter, "conv_000", ["red car on Tuesday"])
+        exporter.close()
+
+        shard = next(iter_word_shards(tmp_path / "words_raw"))
+        columns = read_word_shard(shard, columns=["start", "label"])
+        assert set(columns) == {"start", "label"}
+        np.testing.assert_allclose(columns["start"], [0.0, 0.5, 1.0, 1.5])
+
+    def test_shards_roll_over(self, tmp_path, backend):
+        exporter = WordExporter(tmp_path, backend=backend, row_group_rows=4, shard_rows=8)
+        for i in range(5):
+            add_conversation(exporter, f"conv_{i:03d}", ["one two three four"])
+        exporter.close()
+
+        shards = list(iter_word_shards(tmp_path / "words_raw"))
+        assert [p.stem for p in shards] == ["shard-00000", "shard-00001", "shard-00002"]
+
+        ids = np.concatenate([read_word_shard(p, ["conversation_id"])["conversation_id"]
+                              for p in shards])
+        assert len(ids) == 20
+        assert list(dict.fromkeys(ids)) == [f"conv_{i:03d}" for i in range(5)]
+
+    def test_previous_shards_replaced(self, tmp_path, backend):
+        exporter = WordExporter(tmp_path, backend=backend, row_group_rows=4, shard_rows=4)
+        for i in range(3):
+            add_conversation(exporter, f"conv_{i:03d}", ["one two three four"])
+        exporter.close()
+
+        exporter = WordExporter(tmp_path, backend=backend)
+        add_conversation(exporter, "conv_000", ["one two"])
+        exporter.close()
+
+        assert len(list(iter_word_shards(tmp_path / "words_raw"))) == 1
@@ -0,0 +1,88 @@
+"""
+Tests for the processing journal.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.journal import RESUME_DONE, Journal, source_fingerprint
+
+SETTINGS = {"output_profile": "flac"}
+VERIFY = {"verify_audio": True}
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def journal_run(journal, out, source, checkpoints=("transcribe", "redact_audio", "verify", "save")):
+    """Record a run of conv through the given checkpoints."""
+    journal.record("conv", "start", source=source, settings=SETTINGS, resume_from="transcribe")
+    files = {
+        "transcribe": [write(out / "raw" / "conv.json", b"raw")],
+        "redact_audio": [write(out / "audio" / "conv.flac", b"audio")],
+        "verify": [],
+        "save": [write(out / "deid" / "conv.json", b"deid")],
+    }
+    for checkpoint in checkpoints:
+        data = {"settings": VERIFY} if checkpoint == "verify" else {}
+        journal.record_stage("conv", checkpoint, out, files[checkpoint], **data)
+
+
+class TestJournal:
+    """Checkpoints and output hashes decide where a rerun picks up."""
+
+    def test_resume_points(self, tmp_path):
+        source = source_fingerprint(write(tmp_path / "conv.wav", b"source"))
+        journal = Journal(tmp_path / "journal.jsonl")
+        journal_run(journal, tmp_path, source)
+
+        state = journal.load()["conv"]
+        assert state.resume_point(source, SETTINGS, VERIFY, tmp_path) == RESUME_DONE
+        # Verification settings changed: keep the audio, verify again
+        assert state.resume_point(source, SETTINGS, {"verify_audio": False}, tmp_path) == "verify"
+        # Output settings or source changed: start over
+        new_settings = {"output_profile": "wav"}
+        assert state.resume_point(source, new_settings, VERIFY, tmp_path) == "transcribe"
+        new_source = {"size": 1, "mtime_ns": 0}
+        assert state.resume_point(new_source, SETTINGS, VERIFY, tmp_path) == "transcribe"
+
+        # Redacted audio modified since: redo it
+        (tmp_path / "audio" / "conv.flac").write_bytes(b"tampered")
+        assert state.resume_point(source, SETTINGS, VERIFY, tmp_path) == "redact_audio"
+
+    def test_failed_run_resumes_after_last_checkpoint(self, tmp_path):
+        source = source_fingerprint(write(tmp_path / "conv.wav", b"source"))
+        journal = Journal(tmp_path / "journal.jsonl")
+        journal_run(journal, tmp_path, source, checkpoints=("transcribe",))
+        journal.record("conv", "failed", stage="audio_redaction", error="disk full")
+
+        state = journal.load()["conv"]
+        assert not state.complete
+        assert state.failure["error"] == "disk full"
+        assert state.resume_point(source, SETTINGS, VERIFY, tmp_path) == "redact_audio"
+
+    def test_start_drops_redone_checkpoints(self, tmp_path):
+        source = source_fingerprint(write(tmp_path / "conv.wav", b"source"))
+        journal = Journal(tmp_path / "journal.jsonl")
+        journal_run(journal, tmp_path, source)
+        journal.record(
+            "conv", "start", source=source, settings=SETTINGS, resume_from="redact_audio"
+        )
+
+        state = journal.load()["conv"]
+        assert list(state.stages) == ["transcribe"]
+
+    def test_truncated_tail_ignored(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        journal = Journal(path)
+        journal.record("a", "failed", stage="transcription", error="boom")
+        with open(path, "ab") as f:
+            f.write(b'{"conversation_id": "b", "ev')  # Crash mid-write
+
+        assert list(journal.load()) == ["a"]
+        journal.record("c", "failed", stage="transcription", error="boom")
+        assert list(journal.load()) == ["a", "c"]
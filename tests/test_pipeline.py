@@ -0,0 +1,591 @@
+"""
+Tests for the pipeline orchestration.
+Uses a fake transcriber so no Whisper model is needed.
+"""
+import gc
+import json
+import threading
+import weakref
+import pytest
+import numpy as np
+import soundfile as sf
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.journal import RESUME_DONE
+from src.pipeline import PENDING_VERIFICATION, ConversationSummary, Pipeline
+from src.serialization import iter_json_files, read_json
+from src.export import iter_word_shards, read_word_shard
+from src.transcriber import TranscriptionResult, TranscriptionSegment
+from src.config import WordTimestamp
+
+SCRIPT = "we met on Monday in Houston and it was great"
+
+
+class FakeTranscriber:
+    """Returns the same short transcript for every file (shifted by 3s on channel 1)."""
+
+    def transcribe(self, audio_path, channel=None):
+        offset = 3.0 if channel == 1 else 0.0
+        script = SCRIPT if channel is None else " ".join(SCRIPT.split()[:6])
+        words = [
+            WordTimestamp(word=w, start=offset + 0.5 * i, end=offset + 0.5 * i + 0.4,
+                          confidence=0.95)
+            for i, w in enumerate(script.split())
+        ]
+        return TranscriptionResult(
+            conversation_id=Path(audio_path).stem,
+            audio_path=str(audio_path),
+            audio_duration=6.0,
+            segments=[TranscriptionSegment(
+                text=script, start=offset, end=offset + 3.0, words=words, channel=channel
+            )],
+            language="en",
+            language_probability=1.0
+        )
+
+
+def make_pipeline(output_dir, **kwargs):
+    pipeline = Pipeline(output_dir=str(output_dir), verify_audio=False, **kwargs)
+    pipeline.transcriber = FakeTranscriber()
+    return pipeline
+
+
+@pytest.fixture
+def audio_files(tmp_path):
+    rng = np.random.default_rng(0)
+    paths = []
+    for i in range(3):
+        path = tmp_path / "input" / f"conv_{i:03d}.wav"
+        path.parent.mkdir(exist_ok=True)
+        data = rng.integers(-10000, 10000, 16000 * 6, dtype=np.int16)
+        sf.write(str(path), data, 16000, subtype="PCM_16")
+        paths.append(str(path))
+    return paths
+
+
+class TestBackgroundWrites:
+    """Test that background output writes match synchronous ones."""
+
+    def test_async_matches_sync(self, tmp_path, audio_files):
+        sync = make_pipeline(tmp_path / "sync", async_writes=False).process_batch(audio_files)
+        async_ = make_pipeline(tmp_path / "async", async_writes=True).process_batch(audio_files)
+
+        assert all(r.success for r in sync + async_)
+        for a, b in zip(sync, async_):
+            assert len(a.bleep_regions) == len(b.bleep_regions) == 2
+
+        for conv in ("conv_000", "conv_001", "conv_002"):
+            sync_audio, _ = sf.read(str(tmp_path / "sync" / "audio" / "train" / f"{conv}.flac"))
+            async_audio, _ = sf.read(str(tmp_path / "async" / "audio" / "train" / f"{conv}.flac"))
+            np.testing.assert_array_equal(sync_audio, async_audio)
+
+            deid = tmp_path / "async" / "transcripts_deid" / "train" / f"{conv}.json"
+            assert json.loads(deid.read_text())["pii_count"] == 2
+
+        # No temp files left behind
+        assert not list((tmp_path / "async").rglob("*.partial*"))
+
+    def test_write_error_marks_conversation_failed(self, tmp_path, audio_files):
+        pipeline = make_pipeline(tmp_path / "out", async_writes=True)
+
+        def broken_save(output):
+            raise IOError("disk full")
+
+        pipeline._save_outputs = broken_save
+        results = pipeline.process_batch(audio_files[:1])
+
+        assert not results[0].success
+        assert results[0].stage == "save_outputs"
+        assert "disk full" in results[0].error
+
+        report = json.loads((tmp_path / "out" / "qa" / "processing_report.json").read_text())
+        assert report["summary"]["failed"] == 1
+
+
+class TestTranscriptCompression:
+    """Test compressed transcript outputs."""
+
+    def test_gzip_replaces_plain_outputs(self, tmp_path, audio_files):
+        make_pipeline(tmp_path / "out").process_batch(audio_files[:1])
+        make_pipeline(tmp_path / "out", transcript_compression="gzip").process_batch(
+            audio_files[:1]
+        )
+
+        deid_dir = tmp_path / "out" / "transcripts_deid" / "train"
+        assert [p.name for p in iter_json_files(deid_dir)] == ["conv_000.json.gz"]
+        assert read_json(deid_dir / "conv_000.json.gz")["pii_count"] == 2
+
+    def test_unknown_compression(self, tmp_path):
+        with pytest.raises(ValueError):
+            make_pipeline(tmp_path / "out", transcript_compression="bz2")
+
+
+class TestWordExport:
+    """Test the word-level export stage."""
+
+    def test_export_words(self, tmp_path, audio_files):
+        make_pipeline(tmp_path / "out", export_words=True).process_batch(audio_files)
+
+        exports = tmp_path / "out" / "exports"
+        raw = [read_word_shard(p) for p in iter_word_shards(exports / "words_raw")]
+        labels = [label for shard in raw for label in shard["label"] if label]
+        assert len(raw[0]["word"]) == 3 * len(SCRIPT.split())
+        assert labels == ["[DAY]", "[CITY]"] * 3
+
+
+class TestSpectralPrecheck:
+    """Bleeps that pass the spectral check spare the audio re-ASR."""
+
+    def test_reasr_skipped(self, tmp_path, audio_files):
+        pipeline = Pipeline(output_dir=str(tmp_path / "out"), verify_audio=True)
+        pipeline.transcriber = FakeTranscriber()
+        pipeline.verifier.transcriber = None  # Would load a model if re-ASR ran
+
+        result = pipeline.process_batch(audio_files[:1])[0]
+
+        assert result.success
+        assert result.verification.audio_method == "spectral"
+        assert result.verification.spectral["regions_checked"] == 2
+        report = json.loads((tmp_path / "out" / "qa" / "processing_report.json").read_text())
+        assert report["audio_verification"] == {"methods": {"spectral": 1}, "spectral_flagged": 0}
+
+
+class TestVerificationPolicy:
+    """The sampling decision is recorded in the manifest and report."""
+
+    def test_low_risk_files_sampled_out(self, tmp_path, audio_files):
+        pipeline = Pipeline(output_dir=str(tmp_path / "out"), verify_audio=True,
+                            spectral_precheck=False, audit_rate=0.0)
+        pipeline.transcriber = FakeTranscriber()
+        pipeline.verifier.transcriber = None  # Would load a model if re-ASR ran
+
+        results = pipeline.process_batch(audio_files)
+
+        assert all(r.verification.audio_method == "sampled_out" for r in results)
+        manifest = json.loads((tmp_path / "out" / "metadata" / "manifest.json").read_text())
+        assert [row["verification_policy"]["decision"] for row in manifest] == ["sampled_out"] * 3
+        # The text passed, but nobody checked the audio
+        assert [row["qa_status"] for row in manifest] == ["NOT_VERIFIED"] * 3
+        report = json.loads((tmp_path / "out" / "qa" / "processing_report.json").read_text())
+        assert report["verification_policy"]["decisions"] == {"sampled_out": 3}
+        assert report["verification_status"]["NOT_VERIFIED"] == 3
+        assert report["verification_policy"]["reasr_files"] == 0
+
+
+class TestAsyncVerification:
+    """Verification on a background pool."""
+
+    def test_matches_sync(self, tmp_path, audio_files):
+        outputs = {}
+        for mode in (False, True):
+            pipeline = make_pipeline(tmp_path / str(mode), async_verification=mode)
+            outputs[mode] = pipeline.process_batch(audio_files)
+
+        for sync, background in zip(outputs[False], outputs[True]):
+            assert background.verification.to_dict() == sync.verification.to_dict()
+        report = json.loads((tmp_path / "True" / "qa" / "processing_report.json").read_text())
+        assert report["verification_lag_s"]["pending"] == 0
+        assert report["verification_lag_s"]["max"] is not None
+
+    def test_manifest_pending_until_verified(self, tmp_path, audio_files):
+        pipeline = make_pipeline(tmp_path / "out", async_verification=True)
+        gate = threading.Event()
+        verify = pipeline.verifier.verify
+        pipeline.verifier.verify = lambda *args, **kwargs: gate.wait(5) and verify(*args, **kwargs)
+        manifest_path = tmp_path / "out" / "metadata" / "manifest.json"
+
+        pipeline._batch_results = [pipeline.process_conversation(audio_files[0])]
+        pipeline._update_manifest(force=True)
+        assert json.loads(manifest_path.read_text())[0]["qa_status"] == PENDING_VERIFICATION
+
+        gate.set()
+        pipeline.flush()
+        pipeline._update_manifest(force=True)
+        assert json.loads(manifest_path.read_text())[0]["qa_status"] == "PASS"
+
+
+class TestStagedExecution:
+    """The staged executor gives the same results as one file at a time."""
+
+    def test_matches_sequential(self, tmp_path, audio_files):
+        outputs = {}
+        for staged in (False, True):
+            pipeline = make_pipeline(tmp_path / str(staged), staged=staged,
+                                     stage_workers={"redact_text": 3, "redact_audio": 3})
+            outputs[staged] = pipeline.process_batch(audio_files)
+
+        assert [r.conversation_id for r in outputs[True]] == ["conv_000", "conv_001", "conv_002"]
+        for sequential, staged in zip(outputs[False], outputs[True]):
+            assert staged.success
+            assert staged.verification.to_dict() == sequential.verification.to_dict()
+            assert len(staged.bleep_regions) == len(sequential.bleep_regions) == 2
+
+        timing = ("processing_time_s", "verification_lag_s")
+        manifests = [
+            [{k: v for k, v in row.items() if k not in timing}
+             for row in read_json(tmp_path / str(staged) / "metadata" / "manifest.json")]
+            for staged in (False, True)
+        ]
+        assert manifests[0] == manifests[1]
+
+        for conv in ("conv_000", "conv_001", "conv_002"):
+            a, _ = sf.read(str(tmp_path / "False" / "audio" / "train" / f"{conv}.flac"))
+            b, _ = sf.read(str(tmp_path / "True" / "audio" / "train" / f"{conv}.flac"))
+            np.testing.assert_array_equal(a, b)
+
+        report = read_json(tmp_path / "True" / "qa" / "processing_report.json")
+        assert set(report["stage_metrics"]) == {
+            "transcribe", "redact_text", "redact_audio", "finish"
+        }
+        assert report["stage_metrics"]["redact_audio"]["workers"] == 3
+        assert all(m["items"] == 3 for m in report["stage_metrics"].values())
+
+    def test_failure_contained(self, tmp_path, audio_files):
+        pipeline = make_pipeline(tmp_path / "out", staged=True)
+        transcribe = pipeline.transcriber.transcribe
+
+        def flaky(audio_path, channel=None):
+            if "conv_001" in str(audio_path):
+                raise RuntimeError("decoder error")
+            return transcribe(audio_path, channel)
+
+        pipeline.transcriber.transcribe = flaky
+        results = pipeline.process_batch(audio_files)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].stage == "transcription"
+        assert "decoder error" in results[1].error
+
+    def test_job_setup_failure_contained(self, tmp_path, audio_files):
+        pipeline = make_pipeline(tmp_path / "out", staged=True)
+        new_job = pipeline._new_job
+
+        def broken_journal(audio_path, **kwargs):
+            if "conv_001" in str(audio_path):
+                raise ValueError("unreadable journal state")
+            return new_job(audio_path, **kwargs)
+
+        pipeline._new_job = broken_journal
+        results = pipeline.process_batch(audio_files)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "unreadable journal state"
+
+    def test_unknown_stage(self, tmp_path):
+        with pytest.raises(ValueError):
+            make_pipeline(tmp_path / "out", stage_workers={"upload": 2})
+
+
+class TestResume:
+    """Reruns skip finished conversations and resume failed ones from the journal."""
+
+    def counting(self, pipeline):
+        """Record which files the pipeline transcribes."""
+        calls = []
+        transcribe = pipeline.transcriber.transcribe
+
+        def counted(audio_path, channel=None):
+            calls.append(Path(audio_path).stem)
+            return transcribe(audio_path, channel)
+
+        pipeline.transcriber.transcribe = counted
+        return calls
+
+    def test_rerun_skips_completed(self, tmp_path, audio_files):
+        make_pipeline(tmp_path / "out").process_batch(audio_files)
+        manifest_path = tmp_path / "out" / "metadata" / "manifest.json"
+        manifest = read_json(manifest_path)
+
+        rerun = make_pipeline(tmp_path / "out")
+        calls = self.counting(rerun)
+        results = rerun.process_batch(audio_files)
+
+        assert calls == []
+        assert all(r.success and r.resumed_from == RESUME_DONE for r in results)
+        assert read_json(manifest_path) == manifest
+        report = read_json(tmp_path / "out" / "qa" / "processing_report.json")
+        assert report["resume"]["resumed_from"] == {RESUME_DONE: 3}
+        assert report["summary"]["total_pii_redacted"] == 6
+        assert report["verification_status"]["PASS"] == 3
+
+    def test_failed_file_resumes_after_transcription(self, tmp_path, audio_files):
+        pipeline = make_pipeline(tmp_path / "out")
+        redact = pipeline.audio_redactor.redact
+
+        def flaky(audio_path, *args, **kwargs):
+            if "conv_001" in str(audio_path):
+                raise IOError("disk full")
+            return redact(audio_path, *args, **kwargs)
+
+        pipeline.audio_redactor.redact = flaky
+        assert [r.success for r in pipeline.process_batch(audio_files)] == [True, False, True]
+
+        rerun = make_pipeline(tmp_path / "out")
+        calls = self.counting(rerun)
+        results = rerun.process_batch(audio_files)
+
+        assert calls == []
+        assert [r.resumed_from for r in results] == [RESUME_DONE, "redact_audio", RESUME_DONE]
+        assert results[1].success and len(results[1].bleep_regions) == 2
+        assert len(read_json(tmp_path / "out" / "metadata" / "manifest.json")) == 3
+        report = read_json(tmp_path / "out" / "qa" / "processing_report.json")
+        assert report["summary"]["failed"] == 0
+
+    def test_verification_settings_change_keeps_audio(self, tmp_path, audio_files):
+        make_pipeline(tmp_path / "out").process_batch(audio_files[:1])
+        audio = tmp_path / "out" / "audio" / "train" / "conv_000.flac"
+        written = audio.stat().st_mtime_ns
+
+        rerun = Pipeline(output_dir=str(tmp_path / "out"), verify_audio=True)
+        rerun.transcriber = FakeTranscriber()
+        rerun.verifier.transcriber = None  # Would load a model if re-ASR ran
+        result = rerun.process_batch(audio_files[:1])[0]
+
+        assert result.resumed_from == "verify"
+        assert result.verification.audio_method == "spectral"
+        assert result.verification.spectral["regions_checked"] == 2
+        assert audio.stat().st_mtime_ns == written
+
+    def test_changed_source_reprocessed(self, tmp_path, audio_files):
+        make_pipeline(tmp_path / "out").process_batch(audio_files)
+        data, sr = sf.read(audio_files[0], dtype="int16")
+        sf.write(audio_files[0], data[::-1].copy(), sr, subtype="PCM_16")
+
+        # Segment checkpoints left from the old recording
+        checkpoints = tmp_path / "out" / "checkpoints"
+        stale = [checkpoints / "conv_000.jsonl", checkpoints / "conv_000.ch1.jsonl"]
+        for path in stale + [checkpoints / "conv_001.jsonl"]:
+            path.write_text("{}\n")
+
+        rerun = make_pipeline(tmp_path / "out")
+        calls = self.counting(rerun)
+        results = rerun.process_batch(audio_files)
+
+        assert calls == ["conv_000"]
+        assert [r.resumed_from for r in results] == [None, RESUME_DONE, RESUME_DONE]
+        assert not any(path.exists() for path in stale)
+        assert (checkpoints / "conv_001.jsonl").exists()
+
+    def test_earlier_runs_merged(self, tmp_path, audio_files):
+        make_pipeline(tmp_path / "out").process_batch(audio_files[:2])
+        make_pipeline(tmp_path / "out").process_batch(audio_files[2:])
+
+        manifest = read_json(tmp_path / "out" / "metadata" / "manifest.json")
+        assert [row["conversation_id"] for row in manifest] == ["conv_002", "conv_000", "conv_001"]
+        report = read_json(tmp_path / "out" / "qa" / "processing_report.json")
+        assert report["summary"]["total_conversations"] == 3
+        assert report["resume"]["earlier_runs"] == 2
+
+    def test_export_includes_skipped(self, tmp_path, audio_files):
+        make_pipeline(tmp_path / "out", export_words=True).process_batch(audio_files)
+        make_pipeline(tmp_path / "out", export_words=True).process_batch(audio_files)
+
+        shards = iter_word_shards(tmp_path / "out" / "exports" / "words_deid")
+        assert sum(len(read_word_shard(p)["word"]) for p in shards) == 3 * len(SCRIPT.split())
+
+    def test_no_resume_reprocesses(self, tmp_path, audio_files):
+        make_pipeline(tmp_path / "out").process_batch(audio_files[:1])
+
+        rerun = make_pipeline(tmp_path / "out", resume=False)
+        calls = self.counting(rerun)
+        rerun.process_batch(audio_files[:1])
+
+        assert calls == ["conv_000"]
+
+
+class TestStageTimings:
+    """Every stage is timed and summarized in the report."""
+
+    def test_report_performance(self, tmp_path, audio_files):
+        make_pipeline(tmp_path / "out").process_batch(audio_files)
+
+        report_path = tmp_path / "out" / "qa" / "processing_report.json"
+        report = read_json(report_path)
+        stages = report["performance"]["stages"]
+        assert {"transcription", "detection", "text_redaction", "audio_redaction",
+                "verify_text", "save_outputs"} <= set(stages)
+        assert all(stats["files"] == 3 for stats in stages.values())
+        assert stages["detection"]["words_per_s"] > 0
+        assert stages["audio_redaction"]["bytes_per_s"] > 0
+        assert stages["transcription"]["rtf"] is not None
+        assert report["performance"]["batch"]["audio_s"] == 18.0
+        assert set(report["stage_timings"]["conv_000"]) == set(stages)
+
+        from scripts.visualize_results import visualize_processing_report
+        rendered = visualize_processing_report(str(report_path))
+        assert "STAGE TIMINGS" in rendered
+        assert "audio_redaction" in rendered
+
+
+class TestStreamingBatch:
+    """Streaming batches keep only summaries and give the same outputs."""
+
+    @pytest.mark.parametrize("staged", [False, True])
+    def test_matches_regular(self, tmp_path, audio_files, staged):
+        for streaming in (False, True):
+            make_pipeline(tmp_path / str(streaming), staged=staged, streaming=streaming,
+                          export_words=True).process_batch(audio_files)
+
+        def outputs(streaming):
+            out = tmp_path / str(streaming)
+            report = read_json(out / "qa" / "processing_report.json")
+            shards = iter_word_shards(out / "exports" / "words_deid")
+            return (
+                sorted(read_json(out / "metadata" / "manifest.json"),
+                       key=lambda row: row["conversation_id"]),
+                {k: report[k] for k in ("summary", "verification_status", "verification_policy",
+                                        "resume", "failures", "audio_modes")},
+                set(report["processing_times"]),
+                sum(len(read_word_shard(p)["word"]) for p in shards)
+            )
+
+        assert outputs(True) == outputs(False)
+        assert not list((tmp_path / "True").rglob(".*_rows.jsonl"))
+
+    def test_outputs_released(self, tmp_path, audio_files):
+        pipeline = make_pipeline(tmp_path / "out", streaming=True)
+        finalize = pipeline._finalize
+        released = []
+
+        def tracked(job):
+            released.append(weakref.ref(job.output))
+            finalize(job)
+
+        pipeline._finalize = tracked
+        results = pipeline.process_batch(audio_files)
+        gc.collect()
+
+        assert all(isinstance(r, ConversationSummary) for r in results)
+        assert [r.conversation_id for r in results] == ["conv_000", "conv_001", "conv_002"]
+        assert all(r.success and r.pii_count == 2 and r.qa_status == "PASS" for r in results)
+        assert len(released) == 3 and all(ref() is None for ref in released)
+        assert not pipeline._in_flight and not pipeline.writer._pending
+
+    def test_failures_and_earlier_runs(self, tmp_path, audio_files):
+        make_pipeline(tmp_path / "out").process_batch(audio_files[:2])
+        pipeline = make_pipeline(tmp_path / "out", streaming=True)
+
+        def broken_save(output):
+            raise IOError("disk full")
+
+        pipeline._save_outputs = broken_save
+        results = pipeline.process_batch(audio_files[2:])
+
+        assert not results[0].success and results[0].stage == "save_outputs"
+        manifest = read_json(tmp_path / "out" / "metadata" / "manifest.json")
+        assert [row["conversation_id"] for row in manifest] == ["conv_000", "conv_001"]
+        report = read_json(tmp_path / "out" / "qa" / "processing_report.json")
+        assert report["summary"]["failed"] == 1
+        assert report["resume"]["earlier_runs"] == 2
+
+
+class TestSharding:
+    """Shards run into one output directory and merge into the unsharded view."""
+
+    def test_shards_merge_to_full_batch(self, tmp_path, audio_files):
+        from src.sharding import merge_shards
+
+        make_pipeline(tmp_path / "full").process_batch(audio_files)
+        for index in range(2):
+            make_pipeline(tmp_path / "sharded", shard=(index, 2),
+                          streaming=index == 1).process_batch(audio_files)
+
+        assert not (tmp_path / "sharded" / "metadata" / "manifest.json").exists()
+        assert (tmp_path / "sharded" / "checkpoints" / "journal.shard-0-of-2.jsonl").exists()
+        merged = merge_shards(tmp_path / "sharded")
+
+        def manifest(out):
+            return sorted(read_json(out / "metadata" / "manifest.json"),
+                          key=lambda row: row["conversation_id"])
+
+        full = read_json(tmp_path / "full" / "qa" / "processing_report.json")
+        assert manifest(tmp_path / "sharded") == manifest(tmp_path / "full")
+        assert merged == read_json(tmp_path / "sharded" / "qa" / "processing_report.json")
+        assert merged["shards"] == {"count": 2, "merged": [0, 1], "missing": []}
+        for key in ("summary", "verification_status", "verification_policy", "audio_modes"):
+            assert merged[key] == full[key]
+        assert set(merged["stage_timings"]) == set(full["stage_timings"])
+        for stage, stats in full["performance"]["stages"].items():
+            assert merged["performance"]["stages"][stage]["files"] == stats["files"]
+            assert merged["performance"]["stages"][stage]["audio_s"] == stats["audio_s"]
+
+
+class TestScheduling:
+    """Batches start with the longest files; results stay in input order."""
+
+    @pytest.mark.parametrize("staged", [False, True])
+    def test_longest_first(self, tmp_path, staged):
+        paths = []
+        for name, seconds in (("a", 1.0), ("b", 4.0), ("c", 2.0)):
+            path = tmp_path / "input" / f"{name}.wav"
+            path.parent.mkdir(exist_ok=True)
+            sf.write(str(path), np.zeros(int(16000 * seconds), dtype=np.int16), 16000)
+            paths.append(str(path))
+
+        for longest_first, expected in ((True, ["b", "c", "a"]), (False, ["a", "b", "c"])):
+            pipeline = make_pipeline(tmp_path / str(longest_first), staged=staged,
+                                     longest_first=longest_first)
+            calls = TestResume().counting(pipeline)
+            results = pipeline.process_batch(paths)
+
+            assert calls == expected
+            assert [r.conversation_id for r in results] == ["a", "b", "c"]
+            assert pipeline.progress.done_files == 3
+            assert pipeline.progress.total_audio_s == 7.0
+
+
+class TestMultiChannel:
+    """Test per-channel transcription and redaction."""
+
+    def test_channels_redacted_independently(self, tmp_path):
+        source = tmp_path / "input" / "call_001.wav"
+        source.parent.mkdir()
+        data = np.full((16000 * 6, 2), 1000, dtype=np.int16)
+        data[:, 1] = -1000
+        sf.write(str(source), data, 16000, subtype="PCM_16")
+
+        pipeline = make_pipeline(tmp_path / "out", multichannel=True)
+        result = pipeline.process_batch([str(source)])[0]
+
+        assert result.success
+        assert sorted(m.channel for m in result.pii_matches) == [0, 0, 1, 1]
+        assert [s.channel for s in result.transcript_raw.segments] == [0, 1]
+
+        out, _ = sf.read(str(tmp_path / "out" / "audio" / "train" / "call_001.flac"),
+                         dtype="int16")
+        assert out.shape == data.shape
+
+        # "Monday" is at 1.5s on channel 0 and 4.5s on channel 1
+        def at(t):
+            return int(t * 16000)
+
+        assert out[at(1.6), 0] != 1000 and out[at(1.6), 1] == -1000
+        assert out[at(4.6), 0] == 1000 and out[at(4.6), 1] != -1000
+
+        deid = json.loads(
+            (tmp_path / "out" / "transcripts_deid" / "train" / "call_001.json").read_text()
+        )
+        assert [s["channel"] for s in deid["segments"]] == [0, 1]
+        assert deid["pii_count"] == 4
+
+    def test_channel_count_of_compressed_input(self, tmp_path):
+        av = pytest.importorskip("av")
+        path = tmp_path / "call_002.m4a"
+        container = av.open(str(path), "w")
+        stream = container.add_stream("aac", rate=16000, layout="stereo")
+        frame = av.AudioFrame.from_ndarray(
+            np.zeros((2, 1024), dtype=np.float32), format="fltp", layout="stereo"
+        )
+        frame.sample_rate = 16000
+        for packet in list(stream.encode(frame)) + list(stream.encode(None)):
+            container.mux(packet)
+        container.close()
+
+        assert make_pipeline(tmp_path / "out", multichannel=True)._channel_count(path) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
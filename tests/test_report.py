@@ -0,0 +1,85 @@
+"""
+Tests for the incrementally built processing report.
+"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.output_writer import OutputWriter
+from src.pipeline import ConversationOutput
+from src.report import ReportAccumulator, RowSpool
+
+
+def output(conversation_id, success=True, **kwargs):
+    return ConversationOutput(
+        conversation_id=conversation_id, success=success, processing_time_s=1.5,
+        audio_mode="bleep" if success else None, **kwargs
+    )
+
+
+class TestRowSpool:
+    """Rows come back in order, from memory or from the spool file."""
+
+    def test_file_spool(self, tmp_path):
+        spool = RowSpool(tmp_path / "rows.jsonl")
+        spool.append({"a": 1})
+        rows = iter(spool)
+        spool.append({"a": 2})  # After the read started: not included
+
+        assert list(rows) == [{"a": 1}]
+        assert list(spool) == [{"a": 1}, {"a": 2}]
+        spool.close()
+        assert not (tmp_path / "rows.jsonl").exists()
+
+    def test_memory_spool(self):
+        spool = RowSpool()
+        spool.append([1, 2])
+        assert list(spool) == [[1, 2]]
+
+
+class TestReportAccumulator:
+    """The report is built from counters and spooled per-conversation rows."""
+
+    def test_report(self, tmp_path):
+        report = ReportAccumulator(RowSpool(tmp_path / "rows.jsonl"))
+        report.add(output("a", timings={"detection": 0.25}))
+        report.add(output("b", success=False, stage="transcription", error="bad file"))
+        report.add(output("c", resumed_from="verify"))
+        report.add(output("d"), earlier=True)
+
+        path = tmp_path / "report.json"
+        report.write(path, batch_wall_s=2.0)
+        written = json.loads(path.read_text())
+
+        assert written["summary"]["total_conversations"] == 4
+        assert written["summary"]["failed"] == 1
+        assert written["failures"] == [
+            {"conversation_id": "b", "stage": "transcription", "error": "bad file"}
+        ]
+        assert written["verification_lag_s"]["pending"] == 3
+        assert written["resume"] == {"resumed_from": {"verify": 1}, "earlier_runs": 1}
+        assert written["processing_times"] == {"a": 1.5, "b": 1.5, "c": 1.5, "d": 1.5}
+        assert written["stage_timings"] == {"a": {"detection": 0.25}}
+        assert written["audio_modes"] == {"a": "bleep", "c": "bleep", "d": "bleep"}
+        assert written["performance"]["stages"]["detection"]["files"] == 1
+
+
+class TestOutputWriter:
+    """Finished jobs don't keep their targets alive; failures wait to be collected."""
+
+    def test_successful_jobs_forgotten(self):
+        writer = OutputWriter(max_workers=1)
+        target = output("a")
+        ok = writer.submit(target, "save_outputs", lambda: None)
+        failed = writer.submit(target, "save_outputs", lambda: 1 / 0)
+        ok.result()
+        failed.exception()
+
+        assert list(writer._pending) == [failed]
+        assert writer.collect(failed)
+        assert not target.success and target.stage == "save_outputs"
+        assert not writer.collect(ok)
+        assert writer.drain() == 0
+        writer.close()
@@ -0,0 +1,192 @@
+"""
+Tests for reviewer clip extraction.
+"""
+import pytest
+import numpy as np
+import soundfile as sf
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.audio_input import open_audio
+from src.pipeline import Pipeline
+from src.review import BlockCache, ClipExtractor, save_clip_pair
+from src.transcriber import TranscriptionResult, TranscriptionSegment
+from src.config import WordTimestamp
+
+SCRIPT = "we met on Monday in Houston and it was great"
+
+
+class FakeTranscriber:
+    def transcribe(self, audio_path, channel=None):
+        words = [
+            WordTimestamp(word=w, start=0.5 * i, end=0.5 * i + 0.4, confidence=0.95)
+            for i, w in enumerate(SCRIPT.split())
+        ]
+        return TranscriptionResult(
+            conversation_id=Path(audio_path).stem,
+            audio_path=str(audio_path),
+            audio_duration=6.0,
+            segments=[TranscriptionSegment(text=SCRIPT, start=0.0, end=6.0, words=words)],
+            language="en",
+            language_probability=1.0
+        )
+
+
+@pytest.fixture
+def processed(tmp_path):
+    """Run one 6s conversation through the pipeline and return (output_dir, audio)."""
+    rng = np.random.default_rng(0)
+    audio = rng.integers(-10000, 10000, 16000 * 6, dtype=np.int16)
+    input_path = tmp_path / "conv_000.wav"
+    sf.write(str(input_path), audio, 16000, subtype="PCM_16")
+
+    output_dir = tmp_path / "output"
+    pipeline = Pipeline(output_dir=str(output_dir), verify_audio=False)
+    pipeline.transcriber = FakeTranscriber()
+    pipeline.process_batch([str(input_path)])
+    return output_dir, audio.astype(np.float32) / 32768
+
+
+class TestClipExtractor:
+    """Clips come from the right place in both files."""
+
+    def test_regions_match_redactions(self, processed):
+        output_dir, _ = processed
+        regions = ClipExtractor(output_dir=str(output_dir)).regions("conv_000")
+
+        # Monday and Houston are adjacent enough to merge into one bleep
+        assert len(regions) >= 1
+        assert regions[0].start_time < 1.5 < regions[-1].end_time
+
+    def test_regions_are_the_runs(self, tmp_path):
+        input_path = tmp_path / "conv_000.wav"
+        sf.write(str(input_path), np.zeros(16000 * 6, dtype=np.int16), 16000, subtype="PCM_16")
+        pipeline = Pipeline(output_dir=str(tmp_path / "output"), verify_audio=False)
+        pipeline.transcriber = FakeTranscriber()
+        pipeline.audio_redactor.padding_before_s = 0.3  # Not the default
+        result = pipeline.process_batch([str(input_path)])[0]
+
+        extractor = ClipExtractor(output_dir=str(tmp_path / "output"))
+        regions = extractor.regions("conv_000")
+
+        assert [(r.start_time, r.end_time) for r in regions] == [
+            (r.start_time, r.end_time) for r in result.bleep_regions
+        ]
+        assert regions[0].pii_matches[0].category == result.bleep_regions[0].pii_matches[0].category
+
+    def test_regions_rebuilt_without_record(self, processed):
+        output_dir, _ = processed
+        (output_dir / "qa" / "bleep_regions" / "conv_000.json").unlink()
+
+        regions = ClipExtractor(output_dir=str(output_dir)).regions("conv_000")
+        assert regions[0].start_time < 1.5 < regions[-1].end_time
+
+    def test_time_range_clip(self, processed):
+        output_dir, audio = processed
+        pair = ClipExtractor(output_dir=str(output_dir)).clip("conv_000", 4.0, 5.0)
+
+        assert pair.original_sample_rate == 16000
+        np.testing.assert_allclose(pair.original[:, 0], audio[64000:80000], atol=1e-6)
+        # Outside the bleep the redacted audio is the original
+        np.testing.assert_allclose(pair.redacted[:, 0], audio[64000:80000], atol=1e-4)
+
+    def test_region_clip_is_bleeped(self, processed):
+        output_dir, _ = processed
+        pair = ClipExtractor(output_dir=str(output_dir)).region_clip("conv_000", 0, context_s=0.5)
+
+        assert len(pair.original) == len(pair.redacted)
+        assert not np.allclose(pair.original, pair.redacted, atol=1e-3)
+
+    def test_bad_region_index(self, processed):
+        output_dir, _ = processed
+        with pytest.raises(IndexError):
+            ClipExtractor(output_dir=str(output_dir)).region_clip("conv_000", 99)
+
+    def test_unknown_conversation(self, processed):
+        output_dir, _ = processed
+        with pytest.raises(FileNotFoundError):
+            ClipExtractor(output_dir=str(output_dir)).regions("missing")
+
+    def test_save_clip_pair(self, processed, tmp_path):
+        output_dir, _ = processed
+        pair = ClipExtractor(output_dir=str(output_dir)).clip("conv_000", 1.0, 2.0)
+        original_path, redacted_path = save_clip_pair(pair, str(tmp_path / "clips"))
+
+        assert sf.info(original_path).frames == 16000
+        assert sf.info(redacted_path).frames == 16000
+
+
+class TestBlockCache:
+    """Only the needed blocks are decoded, and repeats hit the cache."""
+
+    def test_reads_span_blocks(self, tmp_path):
+        path = tmp_path / "ramp.wav"
+        data = np.arange(10000, dtype=np.float32) / 10000
+        sf.write(str(path), data, 1000, subtype="FLOAT")
+
+        cache = BlockCache(max_blocks=4, block_frames=1000)
+        audio, rate = cache.read(str(path), 2.5, 4.5)
+
+        assert rate == 1000
+        np.testing.assert_array_equal(audio[:, 0], data[2500:4500])
+        assert cache.misses == 3
+
+        cache.read(str(path), 3.0, 4.0)
+        assert cache.hits == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        path = tmp_path / "ramp.wav"
+        sf.write(str(path), np.zeros(10000, dtype=np.float32), 1000)
+
+        cache = BlockCache(max_blocks=2, block_frames=1000)
+        cache.read(str(path), 0.0, 1.0)
+        cache.read(str(path), 1.0, 2.0)
+        cache.read(str(path), 2.0, 3.0)
+
+        cache.read(str(path), 0.0, 1.0)
+        assert cache.misses == 4
+
+    def test_handle_reused(self, tmp_path):
+        path = tmp_path / "ramp.wav"
+        sf.write(str(path), np.zeros(10000, dtype=np.float32), 1000)
+
+        cache = BlockCache(max_blocks=1, block_frames=1000)
+        for start in (0.0, 5.0, 2.0):
+            cache.read(str(path), start, start + 1.0)
+
+        assert list(cache._sources) == [str(path)]
+        cache.close()
+        assert not cache._sources
+
+    def test_compressed_source(self, tmp_path):
+        av = pytest.importorskip("av")
+        path = tmp_path / "tone.m4a"
+        rate = 16000
+        t = np.arange(rate * 4) / rate
+        tone = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)[None, :]
+        container = av.open(str(path), "w")
+        stream = container.add_stream("aac", rate=rate, layout="mono")
+        for i in range(0, tone.shape[1], 1024):
+            frame = av.AudioFrame.from_ndarray(
+                np.ascontiguousarray(tone[:, i:i + 1024]), format="fltp", layout="mono"
+            )
+            frame.sample_rate = rate
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+        container.close()
+
+        with open_audio(str(path)) as source:
+            decoded = source.read(-1, dtype="float32", always_2d=True)
+
+        cache = BlockCache(max_blocks=2, block_frames=4000)
+        late, _ = cache.read(str(path), 3.0, 3.5)
+        early, sample_rate = cache.read(str(path), 0.5, 1.0)  # Seeks backwards
+
+        assert sample_rate == 16000
+        np.testing.assert_allclose(late, decoded[48000:56000], atol=1e-6)
+        np.testing.assert_allclose(early, decoded[8000:16000], atol=1e-6)
+        cache.close()
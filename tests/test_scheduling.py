@@ -0,0 +1,54 @@
+"""
+Tests for duration-aware scheduling and the progress ETA.
+"""
+import numpy as np
+import soundfile as sf
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scheduling import ProgressEstimator, format_duration, longest_first, probe_durations
+
+
+def write_wav(path, seconds):
+    sf.write(str(path), np.zeros(int(16000 * seconds), dtype=np.int16), 16000, subtype="PCM_16")
+    return str(path)
+
+
+class TestScheduling:
+    """Durations come from headers; the longest files go first."""
+
+    def test_probe_durations(self, tmp_path):
+        paths = [write_wav(tmp_path / "a.wav", 2.0), write_wav(tmp_path / "b.wav", 0.5)]
+        broken = tmp_path / "c.wav"
+        broken.write_bytes(b"\0" * (Path(paths[0]).stat().st_size - 44))  # No header
+
+        durations = probe_durations(paths + [str(broken), str(tmp_path / "missing.wav")])
+
+        assert durations[:2] == [2.0, 0.5]
+        assert abs(durations[2] - 2.0) < 0.1  # Estimated from its size
+        assert durations[3] == 0.0
+
+    def test_longest_first(self):
+        assert longest_first([1.0, 5.0, 1.0, 3.0]) == [1, 3, 0, 2]
+        assert longest_first([]) == []
+
+    def test_progress(self):
+        progress = ProgressEstimator([30.0, 10.0, 10.0, 10.0])
+        assert progress.eta_s() is None
+
+        progress.done(30.0)
+        progress.skip(10.0)
+        progress._started = time.perf_counter() - 15.0  # 15s for the first 30s of audio
+
+        assert progress.total_files == 3
+        assert abs(progress.rtf - 0.5) < 0.01
+        assert abs(progress.eta_s() - 10.0) < 0.2  # 20s of audio left at RTF 0.5
+        assert progress.status().startswith("1/3 files, 30s of 50s audio, RTF 0.50, ETA 10s")
+
+    def test_format_duration(self):
+        assert format_duration(12.4) == "12s"
+        assert format_duration(185) == "3m05s"
+        assert format_duration(3720) == "1h02m"
@@ -0,0 +1,120 @@
+"""
+Tests for transcript serialization.
+"""
+import json
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import serialization
+from src.serialization import (
+    conversation_id_from_path,
+    find_transcript,
+    iter_json_files,
+    read_json,
+    remove_stale_variants,
+    write_transcript
+)
+from src.pii_detector import PIIDetector
+from src.text_redactor import TextRedactor
+from src.transcriber import TranscriptionResult, TranscriptionSegment
+from src.config import WordTimestamp
+
+
+def make_transcript():
+    texts = ["we met on Monday", "in San Francisco", "it was “great”"]
+    segments = []
+    t = 0.0
+    for channel, text in enumerate(texts):
+        words = []
+        for w in text.split():
+            words.append(WordTimestamp(word=w, start=t, end=t + 0.4, confidence=0.87))
+            t += 0.55
+        segments.append(TranscriptionSegment(
+            text=text, start=words[0].start, end=words[-1].end, words=words,
+            channel=channel if channel else None
+        ))
+    return TranscriptionResult("conv_001", "conv_001.wav", t, segments, "en", 0.98)
+
+
+@pytest.fixture
+def transcripts():
+    raw = make_transcript()
+    redacted = TextRedactor().redact(raw, PIIDetector().detect(raw))
+    return raw, redacted
+
+
+def as_json(obj):
+    return json.loads(json.dumps(obj.to_dict()))
+
+
+class TestTranscriptSerialization:
+    """Streamed output matches to_dict() in every variant."""
+
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_raw_matches_to_dict(self, tmp_path, transcripts, compression):
+        raw, _ = transcripts
+        path = write_transcript(tmp_path, raw, compression)
+
+        assert path.name == f"conv_001{serialization.TRANSCRIPT_SUFFIXES[compression]}"
+        assert read_json(path) == as_json(raw)
+
+    def test_redacted_matches_to_dict(self, tmp_path, transcripts):
+        _, redacted = transcripts
+        path = write_transcript(tmp_path, redacted, None, include_original_text=True)
+
+        data = read_json(path)
+        assert data == as_json(redacted)
+        assert data["pii_count"] == 2
+
+    def test_redacted_drops_original_text(self, tmp_path, transcripts):
+        _, redacted = transcripts
+        data = read_json(write_transcript(tmp_path, redacted, None, include_original_text=False))
+
+        assert "original_text" not in data
+        assert data["redacted_text"] == redacted.redacted_text
+
+    def test_compact(self, tmp_path, transcripts):
+        raw, _ = transcripts
+        text = write_transcript(tmp_path, raw, None).read_text()
+        assert "\n" not in text
+        assert ": " not in text
+
+    def test_without_orjson(self, tmp_path, transcripts, monkeypatch):
+        raw, _ = transcripts
+        monkeypatch.setattr(serialization, "orjson", None)
+        assert read_json(write_transcript(tmp_path, raw, "gzip")) == as_json(raw)
+
+    def test_zstd(self, tmp_path, transcripts):
+        pytest.importorskip("zstandard")
+        raw, _ = transcripts
+        assert read_json(write_transcript(tmp_path, raw, "zstd")) == as_json(raw)
+
+
+class TestTranscriptFiles:
+    """Finding transcripts whatever their compression."""
+
+    def test_find_and_iterate(self, tmp_path, transcripts):
+        raw, _ = transcripts
+        gz = write_transcript(tmp_path, raw, "gzip")
+        (tmp_path / "other.json").write_text("{}")
+        (tmp_path / ".conv_002.partial.json").write_text("{")
+
+        assert find_transcript(tmp_path, "conv_001") == gz
+        assert find_transcript(tmp_path, "missing") is None
+        assert [p.name for p in iter_json_files(tmp_path)] == ["conv_001.json.gz", "other.json"]
+
+    def test_conversation_id_from_path(self):
+        assert conversation_id_from_path(Path("a/conv_1.json")) == "conv_1"
+        assert conversation_id_from_path(Path("a/conv_1.json.gz")) == "conv_1"
+        assert conversation_id_from_path(Path("a/conv_1.json.zst")) == "conv_1"
+
+    def test_remove_stale_variants(self, tmp_path, transcripts):
+        raw, _ = transcripts
+        plain = write_transcript(tmp_path, raw, None)
+        gz = write_transcript(tmp_path, raw, "gzip")
+
+        assert remove_stale_variants(tmp_path, "conv_001", keep=gz) == [plain]
+        assert find_transcript(tmp_path, "conv_001") == gz
@@ -0,0 +1,48 @@
+"""
+Tests for multi-node sharding and merging.
+"""
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.sharding import (
+    find_shard_files,
+    parse_shard,
+    select_shard,
+    shard_name,
+    shard_of
+)
+
+
+class TestSharding:
+    """Every conversation lands in exactly one shard, the same one every time."""
+
+    def test_parse_shard(self):
+        assert parse_shard("0/4") == (0, 4)
+        assert parse_shard("3/4") == (3, 4)
+        for spec in ("4/4", "-1/4", "0/0", "1", "a/b"):
+            with pytest.raises(ValueError):
+                parse_shard(spec)
+
+    def test_shards_partition_input(self):
+        paths = [f"/data/conv_{i:04d}.wav" for i in range(1000)]
+        shards = [select_shard(paths, (i, 4)) for i in range(4)]
+
+        assert sorted(p for shard in shards for p in shard) == paths
+        assert all(200 < len(shard) < 300 for shard in shards)
+        # Stable: depends only on the id, not on the path or the run
+        assert shard_of("conv_0001", 4) == shard_of("conv_0001", 4)
+        assert select_shard(["/other/conv_0001.flac"], (shard_of("conv_0001", 4), 4))
+
+    def test_shard_file_names(self, tmp_path):
+        assert shard_name("manifest.json", None) == "manifest.json"
+        assert shard_name("manifest.json", (1, 4)) == "manifest.shard-1-of-4.json"
+        assert shard_name("journal.jsonl", (0, 2)) == "journal.shard-0-of-2.jsonl"
+
+        for name in ("manifest.shard-0-of-2.json", "manifest.shard-1-of-2.json",
+                     "manifest.json", "manifest_old.shard-0-of-2.json"):
+            (tmp_path / name).write_text("[]")
+        found = find_shard_files(tmp_path, "manifest.json")
+        assert sorted(found) == [(0, 2), (1, 2)]
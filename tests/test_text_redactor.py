@@ -0,0 +1,99 @@
+"""
+Tests for text redaction.
+"""
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.text_redactor import TextRedactor
+from src.transcriber import TranscriptionResult, TranscriptionSegment
+from src.config import PIIMatch, WordTimestamp
+
+
+def make_transcript(segment_texts):
+    """Build a transcript with 0.5s per word across the given segments."""
+    segments = []
+    t = 0.0
+    for text in segment_texts:
+        words = []
+        for w in text.split():
+            words.append(WordTimestamp(word=w, start=t, end=t + 0.4, confidence=0.9))
+            t += 0.5
+        segments.append(TranscriptionSegment(
+            text=text, start=words[0].start, end=words[-1].end, words=words
+        ))
+    return TranscriptionResult(
+        conversation_id="test",
+        audio_path="test.wav",
+        audio_duration=t,
+        segments=segments,
+        language="en",
+        language_probability=1.0
+    )
+
+
+def make_match(transcript, indices, category):
+    words = transcript.get_all_words()
+    return PIIMatch(
+        text=" ".join(words[i].word for i in indices),
+        category=category,
+        start_time=words[indices[0]].start,
+        end_time=words[indices[-1]].end,
+        confidence=1.0,
+        word_indices=list(indices)
+    )
+
+
+class TestTextRedactor:
+    """Single-pass redaction over segments and sorted matches."""
+
+    @pytest.fixture
+    def redactor(self):
+        return TextRedactor()
+
+    def test_replaces_matches_with_labels(self, redactor):
+        transcript = make_transcript(["we met on Monday", "in New York City today"])
+        matches = [
+            make_match(transcript, [3], "day"),
+            make_match(transcript, [5, 6, 7], "city"),
+        ]
+        result = redactor.redact(transcript, matches)
+
+        assert result.redacted_text == "we met on [DAY] in [CITY] today"
+        assert result.original_text == "we met on Monday in New York City today"
+        assert [log.original_text for log in result.redaction_logs] == ["Monday", "New York City"]
+
+    def test_untouched_segments_reused(self, redactor):
+        transcript = make_transcript(["hello there", "see you Friday", "bye now"])
+        result = redactor.redact(transcript, [make_match(transcript, [4], "day")])
+
+        assert result.redacted_segments[0] is transcript.segments[0]
+        assert result.redacted_segments[2] is transcript.segments[2]
+        assert result.redacted_segments[1].text == "see you [DAY]"
+
+    def test_match_spanning_segments(self, redactor):
+        transcript = make_transcript(["flying to San", "Francisco tomorrow"])
+        result = redactor.redact(transcript, [make_match(transcript, [2, 3], "city")])
+
+        assert result.redacted_segments[0].text == "flying to [CITY]"
+        assert result.redacted_segments[1].text == "tomorrow"
+        assert len(result.redaction_logs) == 1
+
+    def test_unsorted_matches(self, redactor):
+        transcript = make_transcript(["red car on Tuesday"])
+        matches = [
+            make_match(transcript, [3], "day"),
+            make_match(transcript, [0], "color"),
+        ]
+        result = redactor.redact(transcript, matches)
+
+        assert result.redacted_text == "[COLOR] car on [DAY]"
+
+    def test_no_matches(self, redactor):
+        transcript = make_transcript(["nothing to see", "here"])
+        result = redactor.redact(transcript, [])
+
+        assert result.redacted_text == result.original_text
+        assert all(a is b for a, b in zip(result.redacted_segments, transcript.segments))
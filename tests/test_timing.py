@@ -0,0 +1,44 @@
+"""
+Tests for stage timing statistics.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.timing import StageStats, percentiles, timed
+
+
+class TestTiming:
+    """Per-stage totals, percentiles, real-time factor and throughput."""
+
+    def test_timed_accumulates(self):
+        timings = {}
+        for _ in range(2):
+            with timed(timings, "detection"):
+                pass
+        with timed(None, "ignored"):
+            pass
+
+        assert list(timings) == ["detection"]
+        assert timings["detection"] >= 0
+
+    def test_percentiles(self):
+        values = list(range(1, 101))
+        assert percentiles(values) == {"p50": 50.5, "p95": 95.05, "p99": 99.01}
+        assert percentiles([]) == {"p50": None, "p95": None, "p99": None}
+
+    def test_stage_stats(self):
+        stats = StageStats()
+        stats.add({"transcription": 2.0, "detection": 0.5}, {"transcription": 4_000_000}, 10.0, 100)
+        stats.add({"transcription": 6.0, "detection": 0.5}, {"transcription": 4_000_000}, 20.0, 300)
+        summary = stats.summary()
+
+        transcription = summary["transcription"]
+        assert transcription["files"] == 2
+        assert transcription["total_s"] == 8.0
+        assert transcription["rtf"] == round(8.0 / 30.0, 4)
+        assert transcription["rtf_p50"] == 0.25  # Per-file RTFs 0.2 and 0.3
+        assert transcription["bytes_per_s"] == 1_000_000
+        assert "words_per_s" not in transcription
+        assert summary["detection"]["words_per_s"] == 400.0
@@ -0,0 +1,182 @@
+"""
+Tests for transcription checkpointing.
+Uses a fake Whisper model so no weights are downloaded.
+"""
+import json
+import threading
+import pytest
+import numpy as np
+import soundfile as sf
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import transcriber as transcriber_module
+from src.transcriber import Transcriber, TranscriptionSegment, load_channel
+from src.config import SAMPLE_RATE, WordTimestamp
+
+
+class FakeModel:
+    """Yields one segment per second of input audio, optionally failing partway."""
+
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after
+        self.inputs = []
+
+    def transcribe(self, audio, **kwargs):
+        self.inputs.append(audio)
+        if isinstance(audio, str):
+            audio, _ = sf.read(audio, dtype="float32")
+        duration = len(audio) / SAMPLE_RATE
+
+        def segments():
+            for i in range(int(duration)):
+                if self.fail_after is not None and i >= self.fail_after:
+                    raise RuntimeError("worker preempted")
+                word = SimpleNamespace(word=f" w{i}", start=i + 0.1, end=i + 0.9, probability=0.9)
+                yield SimpleNamespace(text=f" w{i}", start=float(i), end=i + 1.0, words=[word])
+
+        info = SimpleNamespace(duration=duration, language="en", language_probability=1.0)
+        return segments(), info
+
+
+@pytest.fixture
+def audio_path(tmp_path):
+    path = tmp_path / "conv_001.wav"
+    sf.write(str(path), np.zeros(SAMPLE_RATE * 5, dtype=np.float32), SAMPLE_RATE)
+    return path
+
+
+class TestCheckpointing:
+    """Test that partial transcriptions resume from the last segment."""
+
+    def test_checkpoint_removed_on_success(self, tmp_path, audio_path):
+        transcriber = Transcriber(checkpoint_dir=str(tmp_path / "ckpt"))
+        transcriber._model = FakeModel()
+
+        result = transcriber.transcribe(str(audio_path))
+
+        assert len(result.segments) == 5
+        assert not (tmp_path / "ckpt" / "conv_001.jsonl").exists()
+
+    def test_segment_text_joined_from_words(self, tmp_path, audio_path):
+        model = FakeModel()
+        transcribe = model.transcribe
+
+        def spaced(audio, **kwargs):
+            # Whisper's text can differ from its words in spacing
+            segments, info = transcribe(audio, **kwargs)
+            spaced_segments = (
+                SimpleNamespace(**{**vars(s), "text": f" {s.text}  ."}) for s in segments
+            )
+            return spaced_segments, info
+
+        model.transcribe = spaced
+        transcriber = Transcriber()
+        transcriber._model = model
+        result = transcriber.transcribe(str(audio_path))
+
+        assert [s.text for s in result.segments] == ["w0", "w1", "w2", "w3", "w4"]
+
+    def test_resume_after_failure(self, tmp_path, audio_path):
+        checkpoint = tmp_path / "ckpt" / "conv_001.jsonl"
+        transcriber = Transcriber(checkpoint_dir=str(tmp_path / "ckpt"))
+        transcriber._model = FakeModel(fail_after=3)
+
+        with pytest.raises(RuntimeError):
+            transcriber.transcribe(str(audio_path))
+        assert len(checkpoint.read_text().splitlines()) == 1 + 3  # Header and 3 segments
+
+        model = FakeModel()
+        transcriber._model = model
+        result = transcriber.transcribe(str(audio_path))
+
+        # Second run only sees the audio after the checkpointed segments
+        assert len(model.inputs[0]) == SAMPLE_RATE * 2
+        assert [s.start for s in result.segments] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert result.segments[3].words[0].start == pytest.approx(3.1)
+        assert result.audio_duration == pytest.approx(5.0)
+
+    def test_truncated_checkpoint_line_ignored(self, tmp_path, audio_path):
+        checkpoint = tmp_path / "ckpt" / "conv_001.jsonl"
+        checkpoint.parent.mkdir()
+        seg = TranscriptionSegment("w0", 0.0, 1.0, [WordTimestamp("w0", 0.1, 0.9, 0.9)])
+        transcriber = Transcriber(checkpoint_dir=str(tmp_path / "ckpt"))
+        header = transcriber._checkpoint_header(audio_path)
+        checkpoint.write_text(
+            json.dumps(header) + "\n" + json.dumps(seg.to_dict()) + "\n" + '{"text": "w1", "sta'
+        )
+
+        model = FakeModel()
+        transcriber._model = model
+        result = transcriber.transcribe(str(audio_path))
+
+        assert len(model.inputs[0]) == SAMPLE_RATE * 4
+        assert [s.start for s in result.segments] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    @pytest.mark.parametrize("change", ["source", "model"])
+    def test_stale_checkpoint_discarded(self, tmp_path, audio_path, change):
+        checkpoint = tmp_path / "ckpt" / "conv_001.jsonl"
+        transcriber = Transcriber(checkpoint_dir=str(tmp_path / "ckpt"))
+        transcriber._model = FakeModel(fail_after=3)
+        with pytest.raises(RuntimeError):
+            transcriber.transcribe(str(audio_path))
+
+        if change == "source":
+            # New recording under the same conversation id
+            sf.write(str(audio_path), np.zeros(SAMPLE_RATE * 6, dtype=np.float32), SAMPLE_RATE)
+        else:
+            transcriber = Transcriber(model_size="small", checkpoint_dir=str(tmp_path / "ckpt"))
+        model = FakeModel()
+        transcriber._model = model
+        result = transcriber.transcribe(str(audio_path))
+
+        # Transcribed from the start, not resumed after the old segments
+        assert model.inputs == [str(audio_path)]
+        assert len(result.segments) == (6 if change == "source" else 5)
+        assert not checkpoint.exists()
+
+
+class TestChannels:
+    """Per-channel mode: one shared model, any channel count and sample rate."""
+
+    def test_model_loaded_once_across_threads(self, monkeypatch):
+        loaded = []
+
+        def fake_model(model_size, **kwargs):
+            loaded.append(kwargs)
+            return FakeModel()
+
+        monkeypatch.setattr(transcriber_module, "WhisperModel", fake_model)
+        transcriber = Transcriber(device="cpu", num_workers=4)
+        barrier = threading.Barrier(4)
+
+        def load():
+            barrier.wait()
+            return transcriber._get_model()
+
+        threads = [threading.Thread(target=load) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(loaded) == 1
+        assert loaded[0]["num_workers"] == 4
+
+    def test_load_channel_resamples(self, tmp_path):
+        # Four channels at 8 kHz: each channel a distinct constant level
+        path = tmp_path / "four.wav"
+        levels = np.array([0.1, 0.2, 0.3, 0.4], dtype=np.float32)
+        sf.write(str(path), np.tile(levels, (8000 * 2, 1)), 8000)
+
+        channel = load_channel(str(path), 2)
+
+        assert len(channel) == pytest.approx(SAMPLE_RATE * 2, abs=SAMPLE_RATE // 100)
+        assert np.median(channel) == pytest.approx(0.3, abs=1e-3)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
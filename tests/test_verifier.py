@@ -0,0 +1,113 @@
+"""
+Tests for text verification.
+"""
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.pii_detector import PIIDetector
+from src.text_redactor import TextRedactor, RedactedTranscript
+from src.transcriber import TranscriptionResult, TranscriptionSegment
+from src.verifier import Verifier, VerificationStatus, unredacted_spans
+from src.config import WordTimestamp
+
+
+def make_transcript(segment_texts):
+    """Build a transcript with 0.5s per word across the given segments."""
+    segments = []
+    t = 0.0
+    for text in segment_texts:
+        words = []
+        for w in text.split():
+            words.append(WordTimestamp(word=w, start=t, end=t + 0.4, confidence=0.9))
+            t += 0.5
+        segments.append(TranscriptionSegment(
+            text=text, start=words[0].start, end=words[-1].end, words=words
+        ))
+    return TranscriptionResult("test", "test.wav", t, segments, "en", 1.0)
+
+
+@pytest.fixture
+def detector():
+    return PIIDetector()
+
+
+def redact(detector, texts):
+    transcript = make_transcript(texts)
+    return TextRedactor().redact(transcript, detector.detect(transcript))
+
+
+class TestLabelSpans:
+    """The redactor records where each label sits in the redacted text."""
+
+    def test_spans_point_at_labels(self, detector):
+        redacted = redact(detector, ["hello there", "we met on Monday", "in San Francisco today"])
+        text = redacted.redacted_text
+
+        assert text == "hello there we met on [DAY] in [CITY] today"
+        assert [text[s:e] for s, e in redacted.label_spans] == ["[DAY]", "[CITY]"]
+
+    def test_unredacted_spans(self):
+        assert unredacted_spans(20, [(3, 8), (9, 14)]) == [(0, 3), (8, 9), (14, 20)]
+        assert unredacted_spans(5, [(0, 5)]) == []
+        assert unredacted_spans(4, []) == [(0, 4)]
+
+
+class TestVerifyText:
+    """Only text between labels is rescanned."""
+
+    def test_clean_transcript_passes(self, detector):
+        verifier = Verifier(detector=detector)
+        redacted = redact(detector, ["we met on Monday", "in San Francisco today"])
+
+        status, pii_found, _, coverage = verifier.verify_text(redacted)
+
+        assert status == VerificationStatus.PASS
+        assert pii_found == []
+        assert coverage["mode"] == "spans"
+        assert coverage["labels"] == 2
+        assert coverage["scanned_chars"] + coverage["redacted_chars"] == coverage["total_chars"]
+
+    def test_leak_between_labels_found(self, detector):
+        verifier = Verifier(detector=detector)
+        redacted = redact(detector, ["we met on Monday", "in San Francisco today"])
+        # Simulate a leak the redactor missed
+        redacted.redacted_text = redacted.redacted_text.replace("today", "Tuesday")
+
+        status, pii_found, _, _ = verifier.verify_text(redacted)
+
+        assert status != VerificationStatus.PASS
+        assert [(p["text"], p["category"]) for p in pii_found] == [("Tuesday", "day")]
+        start = pii_found[0]["start"]
+        assert redacted.redacted_text[start:pii_found[0]["end"]] == "Tuesday"
+
+    def test_same_result_as_full_scan(self, detector):
+        verifier = Verifier(detector=detector)
+        redacted = redact(detector, ["we met on Monday", "in San Francisco today"])
+        text = redacted.redacted_text.replace("today", "in May we went to Paris")
+        spans = RedactedTranscript(
+            "test", redacted.original_text, text, redacted.redacted_segments,
+            redacted.redaction_logs, label_spans=redacted.label_spans
+        )
+        full = RedactedTranscript(
+            "test", redacted.original_text, text, redacted.redacted_segments,
+            redacted.redaction_logs
+        )
+
+        _, span_pii, _, span_coverage = verifier.verify_text(spans)
+        _, full_pii, _, full_coverage = verifier.verify_text(full)
+
+        assert span_pii == full_pii
+        assert full_coverage["mode"] == "full"
+        assert span_coverage["scanned_chars"] < full_coverage["scanned_chars"]
+
+    def test_coverage_in_result(self, detector):
+        verifier = Verifier(detector=detector)
+        redacted = redact(detector, ["see you Friday"])
+
+        result = verifier.verify(redacted, verify_audio=False).to_dict()
+
+        assert result["text_coverage"]["labels"] == 1
+        assert result["text_coverage"]["scanned_spans"] == 1
@@ -0,0 +1,120 @@
+"""
+Tests for the risk-scored audio verification policy.
+"""
+import json
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.audio_redactor import AudioRedactor
+from src.config import PIIMatch, WordTimestamp
+from src.transcriber import TranscriptionResult, TranscriptionSegment
+from src.verify_policy import (
+    DECISION_ALL,
+    DECISION_AUDIT,
+    DECISION_HIGH_RISK,
+    DECISION_SAMPLED_OUT,
+    DECISION_UNCHANGED,
+    VerificationPolicy,
+    audit_draw,
+    load_previous_statuses,
+    risk_factors
+)
+
+
+def make_transcript(confidences):
+    """One word per 0.5s with the given confidences."""
+    words = [
+        WordTimestamp(word=f"w{i}", start=0.5 * i, end=0.5 * i + 0.4, confidence=c)
+        for i, c in enumerate(confidences)
+    ]
+    segment = TranscriptionSegment(text=" ".join(w.word for w in words), start=0.0,
+                                   end=words[-1].end, words=words)
+    return TranscriptionResult("conv", "conv.wav", 0.5 * len(words), [segment], "en", 1.0)
+
+
+def match_at(i, is_fuzzy=False):
+    return PIIMatch(text=f"w{i}", category="day", start_time=0.5 * i,
+                    end_time=0.5 * i + 0.4, confidence=0.8 if is_fuzzy else 1.0,
+                    word_indices=[i], is_fuzzy=is_fuzzy)
+
+
+def regions_for(matches, duration):
+    return AudioRedactor().calculate_bleep_regions(matches, duration)
+
+
+class TestRiskFactors:
+    """Each factor is counted from data the pipeline already has."""
+
+    def test_clean_file_scores_zero(self):
+        transcript = make_transcript([0.9] * 20)
+        matches = [match_at(10)]
+        factors = risk_factors(transcript, matches, regions_for(matches, 10.0))
+
+        assert factors == {
+            "fuzzy_matches": 0, "low_confidence_words": 0, "edge_matches": 0, "history": 0
+        }
+
+    def test_counts(self):
+        confidences = [0.9] * 20
+        confidences[9] = confidences[11] = confidences[2] = 0.3
+        confidences[5] = 0.3  # Not within 1s of any match
+        transcript = make_transcript(confidences)
+        matches = [match_at(10, is_fuzzy=True), match_at(0)]  # word 0: padding clamped at 0s
+
+        factors = risk_factors(transcript, matches, regions_for(matches, 10.0), "FAIL")
+
+        assert factors == {
+            "fuzzy_matches": 1, "low_confidence_words": 3, "edge_matches": 1, "history": 1
+        }
+
+
+class TestPolicy:
+    """High-risk files are always verified; the rest are sampled."""
+
+    def decide(self, policy, conversation_id="conv", is_fuzzy=False, **kwargs):
+        transcript = make_transcript([0.9] * 20)
+        matches = [match_at(10, is_fuzzy=is_fuzzy)]
+        return policy.decide(conversation_id, transcript, matches,
+                             regions_for(matches, 10.0), **kwargs)
+
+    def test_policy_off_verifies_all(self):
+        decision = self.decide(VerificationPolicy(None))
+        assert decision.decision == DECISION_ALL
+        assert decision.reasr is None
+
+    def test_high_risk_always_verified(self):
+        decision = self.decide(VerificationPolicy(0.0), is_fuzzy=True)
+        assert decision.decision == DECISION_HIGH_RISK
+        assert decision.reasr is True
+
+    def test_history_makes_file_high_risk(self):
+        policy = VerificationPolicy(0.0, previous_statuses={"conv": "REVIEW_REQUIRED"})
+        assert self.decide(policy).decision == DECISION_HIGH_RISK
+
+    def test_low_risk_sampled(self):
+        assert self.decide(VerificationPolicy(0.0)).decision == DECISION_SAMPLED_OUT
+        assert self.decide(VerificationPolicy(1.0)).decision == DECISION_AUDIT
+
+    def test_unchanged_audio(self):
+        decision = self.decide(VerificationPolicy(0.5), audio_unchanged=True)
+        assert decision.decision == DECISION_UNCHANGED
+
+    def test_audit_draw_is_stable_and_uniform(self):
+        draws = [audit_draw(f"conv_{i:04d}") for i in range(2000)]
+        assert draws == [audit_draw(f"conv_{i:04d}") for i in range(2000)]
+        assert 0.08 < sum(d < 0.1 for d in draws) / len(draws) < 0.12
+        assert audit_draw("conv_0001", seed=1) != audit_draw("conv_0001", seed=0)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            VerificationPolicy(1.5)
+
+    def test_load_previous_statuses(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps([{"conversation_id": "a", "qa_status": "FAIL"}]))
+
+        assert load_previous_statuses(path) == {"a": "FAIL"}
+        assert load_previous_statuses(tmp_path / "missing.json") == {}
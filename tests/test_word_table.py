@@ -0,0 +1,88 @@
+"""
+Tests for the columnar word table.
+"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.word_table import WordTable, WordSlice, word_dicts
+from src.transcriber import TranscriptionResult, TranscriptionSegment
+from src.config import WordTimestamp
+
+
+def make_words(texts, start=0.0):
+    return [
+        WordTimestamp(word=w, start=start + 0.5 * i, end=start + 0.5 * i + 0.4, confidence=0.9)
+        for i, w in enumerate(texts)
+    ]
+
+
+class TestWordTable:
+    """Columns, interning and views."""
+
+    def test_round_trip(self):
+        words = make_words(["the", "red", "the", "car"])
+        table = WordTable.from_words(words)
+
+        assert len(table) == 4
+        assert table.tokens == ["the", "red", "car"]
+        assert table.token_ids.tolist() == [0, 1, 0, 2]
+        assert list(table) == words
+        assert table[-1].word == "car"
+
+    def test_slices_are_views(self):
+        table = WordTable.from_words(make_words(["a", "b", "c", "d", "e"]))
+        middle = table[1:4]
+
+        assert isinstance(middle, WordSlice)
+        assert middle.words() == ["b", "c", "d"]
+        assert middle[1:].words() == ["c", "d"]
+        assert middle[-1].start == table[3].start
+        assert len(table[4:2]) == 0
+
+    def test_map_tokens_once_per_token(self):
+        table = WordTable.from_words(make_words(["x", "y", "x", "x"]))
+        calls = []
+
+        result = table.map_tokens(lambda t: calls.append(t) or t.upper())
+
+        assert result == ["X", "Y", "X", "X"]
+        assert calls == ["x", "y"]
+
+    def test_serialization_matches_objects(self):
+        words = make_words(["hello", "there"], start=1.25)
+        table = WordTable.from_words(words)
+
+        assert word_dicts(table[0:2]) == word_dicts(words)
+        assert word_dicts(table[0:2], confidence=False) == word_dicts(words, confidence=False)
+
+    def test_columns_are_compact(self):
+        table = WordTable.from_words(make_words(["word"] * 10000))
+        assert table.nbytes / len(table) <= 28
+
+
+class TestTranscriptStorage:
+    """Transcripts keep their words in one table."""
+
+    def test_segments_become_slices(self):
+        segments = [
+            TranscriptionSegment("a b", 0.0, 1.0, make_words(["a", "b"])),
+            TranscriptionSegment("c", 1.0, 2.0, make_words(["c"], start=1.0)),
+        ]
+        result = TranscriptionResult("t", "t.wav", 2.0, segments, "en", 1.0)
+
+        assert len(result.get_all_words()) == 3
+        assert all(isinstance(seg.words, WordSlice) for seg in result.segments)
+        assert result.segments[1].words[0].word == "c"
+        assert result.segments[1].words.table is result.words
+
+    def test_to_dict_json(self):
+        segments = [TranscriptionSegment("a b", 0.0, 1.0, make_words(["a", "b"]))]
+        result = TranscriptionResult("t", "t.wav", 1.0, segments, "en", 1.0)
+        data = json.loads(json.dumps(result.to_dict()))
+
+        assert data["segments"][0]["words"][1] == {
+            "word": "b", "start": 0.5, "end": 0.9, "confidence": 0.9
+        }